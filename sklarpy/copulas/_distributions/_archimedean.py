@@ -76,6 +76,20 @@ class archimedean_copula_base_gen(PreFitCopula):
             Available for 'mle' algorithm.
             The tolerance to use when determining convergence.
             Default value is 0.5.
+        workers: Union[int, Callable]
+            When fitting to data only.
+            Available for 'mle' algorithm.
+            The number of processes to evaluate each differential evolution
+            population over in parallel, -1 to use all available cores, or a
+            map-like callable such as multiprocessing.Pool.map.
+            Default value is 1.
+        vectorized: bool
+            When fitting to data only.
+            Available for 'mle' algorithm.
+            True to evaluate each differential evolution population in a
+            single call of the objective function. Ignored if workers is not
+            1.
+            Default value is False.
         params0: Union[Params, tuple]
             When fitting to data only.
             Available for 'mle' algorithm.
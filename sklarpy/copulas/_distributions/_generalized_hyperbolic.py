@@ -37,9 +37,9 @@ class gen_hyperbolic_copula_gen(PreFitCopula):
 
     def _h_logpdf_sum(self, g: np.ndarray, copula_params: Union[Params, tuple]
                       ) -> np.ndarray:
-        pdf_vals: np.ndarray = self._u_g_pdf(func=gh.pdf, arr=g,
-                                             copula_params=copula_params)
-        return np.log(pdf_vals).sum(axis=1)
+        logpdf_vals: np.ndarray = self._u_g_pdf(
+            func=gh.logpdf, arr=g, copula_params=copula_params)
+        return logpdf_vals.sum(axis=1)
 
     def fit(self, data: Union[pd.DataFrame, np.ndarray, None] = None,
             copula_params: Union[Params, tuple, None] = None,
@@ -127,6 +127,21 @@ class gen_hyperbolic_copula_gen(PreFitCopula):
             When fitting to data only.
             True to display the progress of the optimization algorithm.
             Default value is False.
+        workers: Union[int, Callable]
+            When fitting to data only.
+            The number of processes to evaluate each differential evolution
+            population over in parallel, -1 to use all available cores, or a
+            map-like callable such as multiprocessing.Pool.map. For the 'em'
+            algorithm, this is used when maximizing Q2, unless 'workers' is
+            specified in q2_options.
+            Default value is 1.
+        vectorized: bool
+            When fitting to data only.
+            True to evaluate each differential evolution population in a
+            single batched log-likelihood call. For the 'em' algorithm, this
+            is used when maximizing Q2, unless 'vectorized' is specified in
+            q2_options. Ignored if workers is not 1.
+            Default value is False.
         kwargs:
             Any additional keyword arguments to pass to CorrelationMatrix.corr
 
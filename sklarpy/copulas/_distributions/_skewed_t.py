@@ -34,6 +34,6 @@ class skewed_t_copula_gen(gen_hyperbolic_copula_gen):
 
     def _h_logpdf_sum(self, g: np.ndarray, copula_params: Union[Params, tuple]
                       ) -> np.ndarray:
-        pdf_vals: np.ndarray = self._u_g_pdf(func=skewed_t.pdf, arr=g,
-                                             copula_params=copula_params)
-        return np.log(pdf_vals).sum(axis=1)
+        logpdf_vals: np.ndarray = self._u_g_pdf(
+            func=skewed_t.logpdf, arr=g, copula_params=copula_params)
+        return logpdf_vals.sum(axis=1)
@@ -86,6 +86,18 @@ class student_t_copula_gen(PreFitCopula):
             For the 'em' algorithm, if params0 specified by the user, function
             outcome ~ deterministic between runs and therefore having a
             min_retries and max_retries greater than 1 has little benefit.
+        workers: Union[int, Callable]
+            When fitting to data only.
+            The number of processes to evaluate each differential evolution
+            population over in parallel, -1 to use all available cores, or a
+            map-like callable such as multiprocessing.Pool.map.
+            Default value is 1.
+        vectorized: bool
+            When fitting to data only.
+            True to evaluate each differential evolution population in a
+            single call of the objective function. Ignored if workers is not
+            1.
+            Default value is False.
         kwargs:
             kwargs for CorrelationMatrix.corr
 
@@ -7,11 +7,13 @@ from sklarpy.utils._type_keeper import TypeKeeper
 from sklarpy.utils._serialize import Savable
 from sklarpy.utils._copy import Copyable
 from sklarpy.utils._params import Params
+from sklarpy.utils._sample_cache import SampleCacheable
+from sklarpy.utils._sampling import check_sampling
 
 __all__ = ['FittedCopula']
 
 
-class FittedCopula(Savable, Copyable):
+class FittedCopula(Savable, Copyable, SampleCacheable):
     """A fitted copula model"""
     def __init__(self, obj, fit_info: dict):
         """A fitted copula model.
@@ -117,8 +119,9 @@ class FittedCopula(Savable, Copyable):
 
     def mc_cdf(self, x: Union[pd.DataFrame, np.ndarray],
                match_datatype: bool = True, num_generate: int = 10 ** 4,
-               show_progress: bool = False, **kwargs) \
-            -> Union[pd.DataFrame, np.ndarray]:
+               show_progress: bool = False, seed: int = None,
+               sampling: str = 'random', **kwargs) \
+            -> Union[pd.DataFrame, np.ndarray, tuple]:
         """The monte-carlo numerical approximation of the cdf function of the
         overall joint distribution.
         The standard cdf function may take time to evaluate for certain copula
@@ -140,21 +143,37 @@ class FittedCopula(Savable, Copyable):
         show_progress: bool
             True to display the progress of the mc-cdf calculations.
             Default is False.
+        seed: int
+            The seed of the random sample used. None to use numpy's global
+            random state. If the sample cache is enabled, samples with the
+            same seed are reused and extended by later calls.
+            Default is None.
+        sampling: str
+            The sampling method used to generate the random variables. See
+            copula_rvs for the options.
+            Default is 'random'.
         kwargs:
-            kwargs to pass to the multivariate distribution's mc_cdf.
+            kwargs to pass to the multivariate distribution's mc_cdf,
+            such as atol and rtol, to draw random variables until a target
+            standard error is reached, and return_stderr.
 
         Returns
         -------
-        mc_cdf: Union[pd.DataFrame, np.ndarray]
-            numerical cdf values of the joint distribution.
+        mc_cdf: Union[pd.DataFrame, np.ndarray, tuple]
+            numerical cdf values of the joint distribution. If return_stderr
+            is True, a tuple of these and their standard errors.
         """
+        check_sampling(sampling)
+        kwargs.setdefault('mc_sampler', self._mc_batches(
+            lambda size: self.__mc_sampler(size, sampling), seed, sampling))
         return self.__obj.mc_cdf(
             x=x, copula_params=self.copula_params, mdists=self.mdists,
             match_datatype=match_datatype, num_generate=num_generate,
             show_progress=show_progress, **kwargs)
 
     def rvs(self, size: int, ppf_approx: bool = True,
-            match_datatype: bool = True) -> np.ndarray:
+            match_datatype: bool = True, sampling: str = 'random'
+            ) -> np.ndarray:
         """The random variable generator function of the overall joint
         distribution. This requires the evaluation of the ppf / quantile
         function of each marginal distribution, which for certain univariate
@@ -177,6 +196,9 @@ class FittedCopula(Savable, Copyable):
         True to output the same datatype as the fitted data, if possible.
         False to output a np.ndarray.
         Default is True.
+        sampling: str
+            The sampling method. See copula_rvs for the options.
+            Default is 'random'.
 
         Returns
         -------
@@ -186,7 +208,7 @@ class FittedCopula(Savable, Copyable):
         """
         rvs_array: np.ndarray = self.__obj.rvs(
             size=size, copula_params=self.copula_params, mdists=self.mdists,
-            ppf_approx=ppf_approx)
+            ppf_approx=ppf_approx, sampling=sampling)
         type_keeper: TypeKeeper = self.__fit_info['type_keeper']
         return type_keeper.type_keep_from_2d_array(
             rvs_array, match_datatype=match_datatype)
@@ -280,8 +302,9 @@ class FittedCopula(Savable, Copyable):
 
     def copula_mc_cdf(self, u: Union[pd.DataFrame, np.ndarray],
                       match_datatype: bool = True, num_generate: int = 10 ** 4,
-                      show_progress: bool = False, **kwargs) \
-            -> Union[pd.DataFrame, np.ndarray]:
+                      show_progress: bool = False, seed: int = None,
+                      sampling: str = 'random', **kwargs) \
+            -> Union[pd.DataFrame, np.ndarray, tuple]:
         """The monte-carlo numerical approximation of the cdf function of the
         copula distribution. The standard copula_cdf function may take time to
         evaluate for certain copula distributions, due to d-dimensional
@@ -305,20 +328,44 @@ class FittedCopula(Savable, Copyable):
         show_progress: bool
             True to display the progress of the copula mc-cdf calculations.
             Default is False.
+        seed: int
+            The seed of the random sample used. None to use numpy's global
+            random state. If the sample cache is enabled, samples with the
+            same seed are reused and extended by later calls.
+            Default is None.
+        sampling: str
+            The sampling method used to generate the random variables. See
+            copula_rvs for the options.
+            Default is 'random'.
         kwargs:
-            kwargs to pass to the multivariate distribution's mc_cdf.
+            kwargs to pass to the multivariate distribution's mc_cdf,
+            such as atol and rtol, to draw random variables until a target
+            standard error is reached, and return_stderr.
 
         Returns
         -------
-        copula_mc_cdf: Union[pd.DataFrame, np.ndarray]
-            numerical cdf values of the copula distribution.
+        copula_mc_cdf: Union[pd.DataFrame, np.ndarray, tuple]
+            numerical cdf values of the copula distribution. If return_stderr
+            is True, a tuple of these and their standard errors.
         """
+        check_sampling(sampling)
+        kwargs.setdefault('mc_sampler', self._mc_batches(
+            lambda size: self.__mc_sampler(size, sampling), seed, sampling))
         return self.__obj.copula_mc_cdf(
             u=u, copula_params=self.copula_params,
             match_datatype=match_datatype, num_generate=num_generate,
             show_progress=show_progress, **kwargs)
 
-    def copula_rvs(self, size: int) -> np.ndarray:
+    def __mc_sampler(self, size: int, sampling: str = 'random'
+                     ) -> np.ndarray:
+        # monte-carlo cdfs count the multivariate random variables underlying
+        # the copula
+        copula_params: Params = self.copula_params
+        return self.__obj._u_to_g(self.__obj.copula_rvs(
+            size=size, copula_params=copula_params, sampling=sampling),
+            copula_params)
+
+    def copula_rvs(self, size: int, sampling: str = 'random') -> np.ndarray:
         """The random variable generator function of the copula distribution.
 
         Parameters
@@ -326,6 +373,13 @@ class FittedCopula(Savable, Copyable):
         size: int
             How many multivariate random samples to generate from the copula
             distribution.
+        sampling: str
+            The sampling method. 'random' for pseudo-random sampling, or
+            'sobol', 'antithetic' or 'lhs' to generate the random variables
+            from a scrambled Sobol sequence, antithetic pairs or a Latin
+            hypercube of uniform random numbers respectively, for variance
+            reduction. 'lhs' also stratifies each margin of the copula sample.
+            Default is 'random'.
 
         Returns
         -------
@@ -335,7 +389,7 @@ class FittedCopula(Savable, Copyable):
             pseudo-observation values of the univariate marginals.
         """
         return self.__obj.copula_rvs(
-            size=size, copula_params=self.copula_params)
+            size=size, copula_params=self.copula_params, sampling=sampling)
 
     def num_marginal_params(self) -> int:
         """Calculates the total number of parameters defining the marginal
@@ -555,8 +609,8 @@ class FittedCopula(Savable, Copyable):
                      color: str, alpha: float, figsize: tuple, grid: bool,
                      axes_names: tuple, zlim: tuple, num_generate: int,
                      num_points: int, show_progress: bool, show: bool,
-                     mc_num_generate: int = None, ranges_to_u: bool = False) \
-            -> None:
+                     mc_num_generate: int = None, ranges_to_u: bool = False,
+                     seed: int = None) -> None:
         """Utility function able to implement pdf_plot, cdf_plot, mc_cdf_plot,
         copula_pdf_plot, copula_cdf_plot and copula_mc_cdf_plot methods without
         duplicate code.
@@ -643,6 +697,11 @@ class FittedCopula(Savable, Copyable):
             True to convert user provided var1_range and var2_range arrays
             to marginal distribution cdf / pseudo-observation values.
             Default is False.
+        seed: int
+            For mc_cdf_plot and copula_mc_cdf_plot only.
+            The seed of the random sample used. None to use numpy's global
+            random state.
+            Default is None.
         """
 
         # argument checks
@@ -675,6 +734,11 @@ class FittedCopula(Savable, Copyable):
             var2_range: np.ndarray = np.linspace(
                 rng_bounds[1][0], rng_bounds[1][1], num_points, dtype=float)
 
+        # monte-carlo sample, reused across the plot's grid
+        mc_rvs: np.ndarray = self._mc_sample(
+            self.__mc_sampler, mc_num_generate, seed) \
+            if 'mc' in func_str else None
+
         # plotting
         self.__obj._threeD_plot(
             func_str=func_str, copula_params=self.copula_params,
@@ -683,7 +747,8 @@ class FittedCopula(Savable, Copyable):
             grid=grid, axes_names=axes_names, zlim=zlim,
             num_generate=num_generate, num_points=num_points,
             show_progress=show_progress, show=show,
-            mc_num_generate=mc_num_generate, ranges_to_u=ranges_to_u)
+            mc_num_generate=mc_num_generate, ranges_to_u=ranges_to_u,
+            mc_rvs=mc_rvs)
 
     def pdf_plot(self, ppf_approx: bool = True, var1_range: np.ndarray = None,
                  var2_range: np.ndarray = None, color: str = 'royalblue',
@@ -867,7 +932,7 @@ class FittedCopula(Savable, Copyable):
                     grid: bool = True, axes_names: tuple = None,
                     zlim: tuple = (None, None), num_generate: int = 1000,
                     num_points: int = 100, show_progress: bool = True,
-                    show: bool = True, **kwargs) -> None:
+                    show: bool = True, seed: int = None, **kwargs) -> None:
         """Produces a 3D plot of the joint distribution's cdf / cumulative
         density function, using a monte-carlo numerical approximation.
 
@@ -946,6 +1011,11 @@ class FittedCopula(Savable, Copyable):
         show: bool
             True to display the plot when the method is called.
             Default is True.
+        seed: int
+            The seed of the random sample used. None to use numpy's global
+            random state. If the sample cache is enabled, samples with the
+            same seed are reused and extended by later calls.
+            Default is None.
         """
         self._threeD_plot(
             func_str='mc_cdf', ppf_approx=ppf_approx, var1_range=var1_range,
@@ -953,7 +1023,7 @@ class FittedCopula(Savable, Copyable):
             grid=grid, axes_names=axes_names, zlim=zlim,
             num_generate=num_generate, num_points=num_points,
             show_progress=show_progress, show=show,
-            mc_num_generate=mc_num_generate)
+            mc_num_generate=mc_num_generate, seed=seed)
 
     def copula_pdf_plot(self, var1_range: np.ndarray = None,
                         var2_range: np.ndarray = None,
@@ -1111,7 +1181,7 @@ class FittedCopula(Savable, Copyable):
                            zlim: tuple = (None, None),
                            num_generate: int = 1000, num_points: int = 100,
                            show_progress: bool = True, show: bool = True,
-                           **kwargs) -> None:
+                           seed: int = None, **kwargs) -> None:
         """Produces a 3D plot of the copula distribution's cdf / density
         function using monte-carlo numerical methods.
 
@@ -1175,6 +1245,11 @@ class FittedCopula(Savable, Copyable):
         show: bool
             True to display the plot when the method is called.
             Default is True.
+        seed: int
+            The seed of the random sample used. None to use numpy's global
+            random state. If the sample cache is enabled, samples with the
+            same seed are reused and extended by later calls.
+            Default is None.
         """
         ranges_to_u: bool = not (var1_range is None and var2_range is None)
         self._threeD_plot(
@@ -1183,7 +1258,8 @@ class FittedCopula(Savable, Copyable):
             grid=grid, axes_names=axes_names, zlim=zlim,
             num_generate=num_generate, num_points=num_points,
             show_progress=show_progress, show=show,
-            mc_num_generate=mc_num_generate, ranges_to_u=ranges_to_u)
+            mc_num_generate=mc_num_generate, ranges_to_u=ranges_to_u,
+            seed=seed)
 
     @property
     def copula_params(self) -> Params:
@@ -9,6 +9,7 @@ from sklarpy.utils._input_handlers import check_multivariate_data, get_mask
 from sklarpy.utils._type_keeper import TypeKeeper
 from sklarpy.utils._params import Params
 from sklarpy.utils._not_implemented import NotImplementedBase
+from sklarpy.utils._sampling import check_sampling, stratify_margins
 from sklarpy.multivariate._prefit_dists import PreFitContinuousMultivariate, \
     FittedContinuousMultivariate
 from sklarpy.univariate._fitted_dists import FittedUnivariateBase
@@ -370,15 +371,25 @@ class PreFitCopula(NotImplementedBase):
         # calculating cdf values
         mc_str: str = "mc_" if mc_cdf else ""
         func: Callable = eval(f"self.copula_{mc_str}cdf")
-        copula_cdf_values: np.ndarray = func(
+        copula_cdf_values = func(
             u=res['cdf'], copula_params=copula_params_tuple,
             match_datatype=False, **kwargs)
+        if mc_cdf and kwargs.get('return_stderr', False):
+            copula_cdf_values, stderrs = copula_cdf_values
+            stderrs_output: np.ndarray = output.copy()
+            stderrs_output[~mask] = stderrs
 
         # converting to correct output datatype
         output[~mask] = copula_cdf_values
-        return TypeKeeper(x).type_keep_from_1d_array(
+        type_keeper: TypeKeeper = TypeKeeper(x)
+        cdf_values = type_keeper.type_keep_from_1d_array(
             array=output, match_datatype=match_datatype,
             col_name=[f'{mc_str}cdf'])
+        if mc_cdf and kwargs.get('return_stderr', False):
+            return cdf_values, type_keeper.type_keep_from_1d_array(
+                array=stderrs_output, match_datatype=match_datatype,
+                col_name=['mc_cdf stderr'])
+        return cdf_values
 
     def cdf(self, x: Union[pd.DataFrame, np.ndarray],
             copula_params: Union[Params, tuple],
@@ -426,7 +437,7 @@ class PreFitCopula(NotImplementedBase):
                mdists: Union[MarginalFitter, dict],
                match_datatype: bool = True, num_generate: int = 10 ** 4,
                show_progress: bool = False, **kwargs) \
-            -> Union[pd.DataFrame, np.ndarray]:
+            -> Union[pd.DataFrame, np.ndarray, tuple]:
         """The monte-carlo numerical approximation of the cdf function of the
         overall joint distribution. The standard cdf function may take time
         to evaluate for certain copula distributions, due to d-dimensional
@@ -460,12 +471,15 @@ class PreFitCopula(NotImplementedBase):
             True to display the progress of the mc-cdf calculations.
             Default is False.
         kwargs:
-            kwargs to pass to the multivariate distribution's mc_cdf.
+            kwargs to pass to the multivariate distribution's mc_cdf,
+            such as atol and rtol, to draw random variables until a target
+            standard error is reached, and return_stderr.
 
         Returns
         -------
-        mc_cdf: Union[pd.DataFrame, np.ndarray]
-            numerical cdf values of the joint distribution.
+        mc_cdf: Union[pd.DataFrame, np.ndarray, tuple]
+            numerical cdf values of the joint distribution. If return_stderr
+            is True, a tuple of these and their standard errors.
         """
         return self.__cdf_mccdf(
             mc_cdf=True, x=x, copula_params=copula_params, mdists=mdists,
@@ -474,7 +488,7 @@ class PreFitCopula(NotImplementedBase):
 
     def rvs(self, size: int, copula_params: Union[Params, tuple],
             mdists: Union[MarginalFitter, dict], ppf_approx: bool = True,
-            **kwargs) -> np.ndarray:
+            sampling: str = 'random', **kwargs) -> np.ndarray:
         """The random variable generator function of the overall joint
         distribution. This requires the evaluation of the ppf / quantile
         function of each marginal distribution, which for certain univariate
@@ -503,6 +517,9 @@ class PreFitCopula(NotImplementedBase):
             quantile function, via linear interpolation, when generating
             random variables.
             Default is True.
+        sampling: str
+            The sampling method. See copula_rvs for the options.
+            Default is 'random'.
 
         Returns
         -------
@@ -511,7 +528,7 @@ class PreFitCopula(NotImplementedBase):
             distribution.
         """
         copula_rvs: np.ndarray = self.copula_rvs(
-            size=size, copula_params=copula_params)
+            size=size, copula_params=copula_params, sampling=sampling)
         func_str: str = "ppf_approx" if ppf_approx else "ppf"
         res: dict = self.__mdist_calcs(func_strs=[func_str], data=copula_rvs,
                                        mdists=mdists, check=True)
@@ -655,9 +672,15 @@ class PreFitCopula(NotImplementedBase):
         g: np.ndarray = self._u_to_g(u_array, copula_params_tuple)
         mc_str: str = "mc_" if mc_cdf else ""
         func: Callable = eval(f"self._mv_object.{mc_str}cdf")
-        copula_cdf_values: np.ndarray = func(x=g, params=copula_params_tuple,
-                                             match_datatype=False, **kwargs)
-        return TypeKeeper(u).type_keep_from_1d_array(
+        copula_cdf_values = func(x=g, params=copula_params_tuple,
+                                 match_datatype=False, **kwargs)
+        type_keeper: TypeKeeper = TypeKeeper(u)
+        if mc_cdf and kwargs.get('return_stderr', False):
+            return tuple(type_keeper.type_keep_from_1d_array(
+                array=values, match_datatype=match_datatype, col_name=[name])
+                for values, name in zip(copula_cdf_values,
+                                        ('mc_cdf', 'mc_cdf stderr')))
+        return type_keeper.type_keep_from_1d_array(
             array=copula_cdf_values, match_datatype=match_datatype,
             col_name=[f'{mc_str}cdf'])
 
@@ -702,7 +725,7 @@ class PreFitCopula(NotImplementedBase):
                       copula_params: Union[Params, tuple],
                       match_datatype: bool = True, num_generate: int = 10 ** 4,
                       show_progress: bool = False, **kwargs) \
-            -> Union[pd.DataFrame, np.ndarray]:
+            -> Union[pd.DataFrame, np.ndarray, tuple]:
         """The monte-carlo numerical approximation of the cdf function of the
         copula distribution. The standard copula_cdf function may take time to
         evaluate for certain copula distributions, due to d-dimensional
@@ -727,12 +750,15 @@ class PreFitCopula(NotImplementedBase):
             True to display the progress of the copula mc-cdf calculations.
             Default is False.
         kwargs:
-            kwargs to pass to the multivariate distribution's mc_cdf.
+            kwargs to pass to the multivariate distribution's mc_cdf,
+            such as atol and rtol, to draw random variables until a target
+            standard error is reached, and return_stderr.
 
         Returns
         -------
-        copula_mc_cdf: Union[pd.DataFrame, np.ndarray]
-            numerical cdf values of the copula distribution.
+        copula_mc_cdf: Union[pd.DataFrame, np.ndarray, tuple]
+            numerical cdf values of the copula distribution. If return_stderr
+            is True, a tuple of these and their standard errors.
         """
         return self.__copula_cdf_mccdf(
             mc_cdf=True, u=u, copula_params=copula_params,
@@ -781,7 +807,7 @@ class PreFitCopula(NotImplementedBase):
         return u
 
     def copula_rvs(self, size: int, copula_params: Union[Params, tuple],
-                   **kwargs) -> np.ndarray:
+                   sampling: str = 'random', **kwargs) -> np.ndarray:
         """The random variable generator function of the copula distribution.
 
         Parameters
@@ -794,6 +820,16 @@ class PreFitCopula(NotImplementedBase):
             your copula distribution. Can be a Params object of the specific
             multivariate distribution or a tuple containing these parameters
             in the correct order.
+        sampling: str
+            The sampling method. 'random' for pseudo-random sampling.
+            'sobol' and 'antithetic' generate the multivariate distribution's
+            random variables from a scrambled Sobol sequence or antithetic
+            pairs of uniform random numbers, through its normal mixture or
+            frailty representation. 'lhs' uses a Latin hypercube for these
+            and also stratifies each margin, keeping the ranks of the sample,
+            so that the marginal ppfs are evaluated at exactly one point in
+            each of size equal width strata.
+            Default is 'random'.
 
         Returns
         -------
@@ -802,13 +838,16 @@ class PreFitCopula(NotImplementedBase):
             distribution. These correspond to randomly sampled cdf /
             pseudo-observation values of the univariate marginals.
         """
+        check_sampling(sampling)
         num_loops: int = 0
         d: int = self._mv_object._get_dim(
             self._mv_object._get_params(copula_params))
         valid_copula_rvs: deque = deque()
-        while size > 0:
+        num_remaining: int = size
+        while num_remaining > 0:
             # generating random variables from multivariate distribution
-            mv_rvs: np.ndarray = self._mv_object.rvs(size, copula_params)
+            mv_rvs: np.ndarray = self._mv_object.rvs(
+                num_remaining, copula_params, sampling=sampling)
 
             # converting to copula rvs
             raw_copula_rvs: np.ndarray = self._g_to_u(mv_rvs, copula_params)
@@ -820,13 +859,17 @@ class PreFitCopula(NotImplementedBase):
             valid_copula_rvs.append(copula_rvs)
 
             # repeating until sample size reached
-            size -= copula_rvs.shape[0]
+            num_remaining -= copula_rvs.shape[0]
             num_loops += 1
             if num_loops > self.__MAX_RVS_LOOPS:
                 raise ArithmeticError(f"Unable to generate valid copula rvs. "
                                       f"Max number of retries reached: "
                                       f"{self.__MAX_RVS_LOOPS}")
-        return np.concatenate(valid_copula_rvs, axis=0)
+        copula_rvs = np.concatenate(valid_copula_rvs, axis=0)
+        if sampling == 'lhs':
+            # latin hypercube sampling with dependence
+            copula_rvs = stratify_margins(copula_rvs)
+        return copula_rvs
 
     def _get_components_summary(self,
                                 fitted_mv_object: FittedContinuousMultivariate,
@@ -1350,8 +1393,8 @@ class PreFitCopula(NotImplementedBase):
                      color: str, alpha: float, figsize: tuple, grid: bool,
                      axes_names: Iterable, zlim: tuple, num_generate: int,
                      num_points: int, show_progress: bool, show: bool,
-                     mc_num_generate: int = None, ranges_to_u: bool = False) \
-            -> None:
+                     mc_num_generate: int = None, ranges_to_u: bool = False,
+                     mc_rvs: np.ndarray = None) -> None:
         """Utility function able to implement pdf_plot, cdf_plot, mc_cdf_plot,
         copula_pdf_plot, copula_cdf_plot and copula_mc_cdf_plot methods
         without duplicate code.
@@ -1447,6 +1490,12 @@ class PreFitCopula(NotImplementedBase):
             True to convert user provided var1_range and var2_range arrays
             to marginal distribution cdf / pseudo-observation values.
             Default is False.
+        mc_rvs: np.ndarray
+            For mc_cdf_plot and copula_mc_cdf_plot only.
+            The random variables of the underlying multivariate distribution
+            to use when evaluating monte-carlo functions. If None,
+            mc_num_generate random variables are generated.
+            Default is None.
         """
         # checking arguments
         test_rvs: np.ndarray = self.rvs(
@@ -1505,11 +1554,12 @@ class PreFitCopula(NotImplementedBase):
         # func kwargs
         func_kwargs: dict = {'copula_params': copula_params, 'mdists': mdists,
                              'match_datatype': False, 'show_progress': False}
-        if func_str == 'copula_mc_cdf':
-            urvs = self.copula_rvs(size=mc_num_generate,
-                                   copula_params=copula_params)
-            grvs: np.ndarray = self._u_to_g(urvs, copula_params)
-            func_kwargs['rvs'] = grvs
+        if 'mc_cdf' in func_str:
+            if mc_rvs is None:
+                urvs = self.copula_rvs(size=mc_num_generate,
+                                       copula_params=copula_params)
+                mc_rvs = self._u_to_g(urvs, copula_params)
+            func_kwargs['rvs'] = mc_rvs
         else:
             func_kwargs['rvs'] = None
         func: Callable = eval(f"self.{func_str}")
@@ -9,7 +9,7 @@ from sklarpy.utils._type_keeper import TypeKeeper
 from sklarpy.utils._input_handlers import check_multivariate_data
 from sklarpy.utils._iterator import get_iterator
 from sklarpy.utils._serialize import Savable
-from sklarpy.univariate import UnivariateFitter
+from sklarpy.univariate import UnivariateFitter, FitPool
 from sklarpy.plotting._pair_plot import pair_plot
 
 __all__ = ['MarginalFitter']
@@ -121,7 +121,8 @@ class MarginalFitter(Savable):
                          'options for only a subset of variables.')
 
     def _fit_single_marginal(self, index: int,
-                             univariate_fitter_options: dict):
+                             univariate_fitter_options: dict,
+                             fitter: UnivariateFitter = None):
         """Selects the probability distribution which best fits a
         given marginal.
 
@@ -132,18 +133,74 @@ class MarginalFitter(Savable):
         univariate_fitter_options: dict
             The arguments of UnivariateFitter to use for this particular
             variable.
+        fitter: UnivariateFitter
+            An already fitted UnivariateFitter for the variable. If None, one
+            is created and fitted.
+            Default is None.
 
         Returns
         -------
         marginal_dict
             The best fitted distribution for our variable.
         """
-        variable_data: np.ndarray = self._data[:, index]
-        fitter: UnivariateFitter = UnivariateFitter(variable_data)
-        fitter.fit(**univariate_fitter_options)
+        if fitter is None:
+            variable_data: np.ndarray = self._data[:, index]
+            fitter = UnivariateFitter(variable_data)
+            fitter.fit(**univariate_fitter_options)
         marginal_dist = fitter.get_best(**univariate_fitter_options)
         return marginal_dist
 
+    def _fit_pooled_marginals(self, univariate_fitter_options: dict,
+                              pool: FitPool = None) -> dict:
+        """Fits UnivariateFitters to every variable whose options request
+        concurrent fitting, using a single pool of worker processes. The data
+        is placed in shared memory once, with the distributions of every
+        such variable scheduled across the pool together.
+
+        Parameters
+        ----------
+        univariate_fitter_options: dict
+            Standardised univariate_fitter_options dictionary.
+        pool: FitPool
+            The pool of worker processes to use. If None, the pool given in
+            the options of the variables is used, or if none is given, a pool
+            is created for this fit only.
+            Default is None.
+
+        Returns
+        -------
+        fitters: dict
+            The fitted UnivariateFitter of each variable fitted concurrently.
+        """
+        pooled: list = [
+            index for index, options in univariate_fitter_options.items()
+            if options.get('use_processpoolexecutor', False)
+            or (options.get('pool') is not None)]
+        if len(pooled) == 0:
+            return {}
+
+        fitters: dict = {}
+        fits: dict = {}
+        for index in pooled:
+            options: dict = univariate_fitter_options[index]
+            fitter: UnivariateFitter = UnivariateFitter(self._data[:, index])
+            distributions, data_type = fitter._fit_setup(**options)
+            fitters[index] = fitter
+            fits[index] = (fitter, distributions, data_type,
+                           options.get('timeout', 10))
+            pool = options.get('pool') if pool is None else pool
+
+        if pool is None:
+            with FitPool() as pool:
+                UnivariateFitter._fit_with_pool(pool, self._data, fits)
+        else:
+            UnivariateFitter._fit_with_pool(pool, self._data, fits)
+
+        for index in pooled:
+            fitters[index]._fit_finish(
+                univariate_fitter_options[index].get('raise_error', False))
+        return fitters
+
     def fit(self, univariate_fitter_options: dict = None, **kwargs):
         """Fits the best univariate distributions to each variable in a given
         multivariate dataset
@@ -174,6 +231,11 @@ class MarginalFitter(Savable):
         ------------------
         show_progress: bool
             Whether to show the progress of your fitting.
+        pool: FitPool
+            A pool of worker processes to use for the variables whose
+            univariate_fitter_options have use_processpoolexecutor set to
+            True. Pools can be reused across many fits. If not given, a single
+            pool is created and shared between all such variables.
 
         See Also
         --------
@@ -190,13 +252,16 @@ class MarginalFitter(Savable):
         self._fitted_marginals = {}
         self._cdf_data: np.ndarray = np.full(self._data.shape, np.nan, float)
 
+        fitters: dict = self._fit_pooled_marginals(univariate_fitter_options,
+                                                   kwargs.get('pool', None))
+
         iterator = get_iterator(
             range(self._num_variables), kwargs.get('show_progress', False),
             'MarginalFitter Progress: '
         )
         for index in iterator:
             marginal_dist = self._fit_single_marginal(
-                index, univariate_fitter_options[index]
+                index, univariate_fitter_options[index], fitters.get(index)
             )
             self._fitted_marginals[index] = marginal_dist
             summaries.append(marginal_dist.summary)
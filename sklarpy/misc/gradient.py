@@ -2,7 +2,6 @@
 import numpy as np
 import pandas as pd
 from typing import Callable, Union, Iterable
-from collections import deque
 
 from sklarpy.utils._input_handlers import check_univariate_data
 
@@ -11,14 +10,20 @@ __all__ = ['gradient_1d']
 
 def gradient_1d(func: Callable,
                 x: Union[pd.DataFrame, pd.Series, np.ndarray, Iterable],
-                eps: float = 10 ** -2,  domain: tuple = None) -> np.ndarray:
+                eps: float = 10 ** -2,  domain: tuple = None, order: int = 2
+                ) -> np.ndarray:
     """Calculates the numerical first derivative / gradient of a given
     1-dimensional function.
 
+    func is evaluated once, on all of the points required by the finite
+    difference stencil. Functions which cannot be evaluated on numpy arrays
+    are evaluated point by point instead.
+
     Parameters
     ----------
     func : Callable
-        The function to differentiate. Must accept scalar values as arguments.
+        The function to differentiate. Should accept numpy arrays as
+        arguments, otherwise must accept scalar values.
     x: Union[pd.DataFrame, pd.Series, np.ndarray, Iterable]
         The data points to calculate the derivative at. Must be a 1-dimensional
         array, dataframe, series or iterable containing integer or scalar
@@ -28,6 +33,12 @@ def gradient_1d(func: Callable,
         Default is 0.01.
     domain: tuple
         The domain on which your function is valid. Optional.
+    order: int
+        The order of accuracy of the finite difference stencil. Must be 2, for
+        central differences, or 4, for five-point central differences. Points
+        too close to the edges of the domain for the full stencil use one-sided
+        differences.
+        Default is 2.
 
     Returns
     --------
@@ -50,26 +61,46 @@ def gradient_1d(func: Callable,
     if not isinstance(func, Callable):
         raise TypeError('func must be a callable function.')
 
-    # calculating gradients
-    gradients: deque = deque()
-    for xi in x:
-        if (xi < domain[0]) or (xi > domain[1]):
-            # nan if outside domain
-            gradients.append(np.nan)
-        else:
-            # determining upper and lower values to use when calculating the
-            # derivative
-            if xi - eps >= domain[0]:
-                lower: float = xi - eps
-            else:
-                lower = xi
-
-            if xi + eps <= domain[1]:
-                upper: float = xi + eps
-            else:
-                upper = xi
-
-            # calculating numerical derivative
-            gradient: float = (func(upper) - func(lower)) / (upper - lower)
-            gradients.append(gradient)
-    return np.asarray(gradients)
+    if order not in (2, 4):
+        raise ValueError('order must be 2 or 4.')
+
+    # determining upper and lower values to use when calculating the
+    # derivative, keeping every point func is evaluated at within the domain
+    x = x.astype(float)
+    inside: np.ndarray = (x >= domain[0]) & (x <= domain[1])
+    xc: np.ndarray = np.minimum(np.maximum(x, domain[0]), domain[1])
+    lower: np.ndarray = np.where(xc - eps >= domain[0], xc - eps, xc)
+    upper: np.ndarray = np.where(xc + eps <= domain[1], xc + eps, xc)
+    points: list = [upper, lower]
+    if order == 4:
+        five_point: np.ndarray = (xc - 2 * eps >= domain[0]) \
+            & (xc + 2 * eps <= domain[1])
+        points += [np.where(five_point, xc + 2 * eps, xc),
+                   np.where(five_point, xc - 2 * eps, xc)]
+
+    # evaluating func on all points at once
+    values: np.ndarray = _evaluate(func, np.concatenate(points))
+    values = values.reshape(len(points), x.size)
+
+    # calculating numerical derivative
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gradients: np.ndarray = (values[0] - values[1]) / (upper - lower)
+        if order == 4:
+            gradients = np.where(
+                five_point, (8 * (values[0] - values[1]) - values[2]
+                             + values[3]) / (12 * eps), gradients)
+
+    # nan if outside domain
+    return np.where(inside, gradients, np.nan)
+
+
+def _evaluate(func: Callable, points: np.ndarray) -> np.ndarray:
+    """Evaluates func on an array of points, falling back to evaluating each
+    point separately if func cannot be evaluated on numpy arrays."""
+    try:
+        values: np.ndarray = np.asarray(func(points), dtype=float)
+    except (TypeError, ValueError):
+        values = None
+    if (values is None) or (values.shape != points.shape):
+        values = np.array([func(point) for point in points], dtype=float)
+    return values
@@ -1,7 +1,7 @@
 # Contains code for evaluating Modified Bessel functions
 import numpy as np
 import scipy.special
-from typing import Union, Iterable
+from typing import Union
 
 __all__ = ['kv']
 
@@ -12,17 +12,21 @@ class kv:
     __LARGE_VALUE: float = 100
 
     @staticmethod
-    def logkv(v: Union[float, int], z: Union[float, int], **kwargs) -> float:
+    def logkv(v: Union[float, int, np.ndarray],
+              z: Union[float, int, np.ndarray], **kwargs
+              ) -> Union[float, np.ndarray]:
         """Evaluates the log of the Modified Bessel function of the 2nd kind.
         Accounts for the limits of z and v.
+        v and z may be scalars or arrays of any broadcastable shape, with the
+        appropriate limiting case chosen element-wise.
 
         Parameters
         -----------
-        v: Union[float, int]
+        v: Union[float, int, np.ndarray]
             The v parameter, which specifies the member of the Modified Bessel
             function of the 2nd kind family to evaluate.
-        z : Union[int, float]
-            The scalar value to evaluate the Modified Bessel function of the
+        z : Union[float, int, np.ndarray]
+            The value(s) to evaluate the Modified Bessel function of the
             2nd kind at.
         kwargs:
             See below
@@ -34,54 +38,65 @@ class kv:
             limit of K_v(0).
             Default is 10 ** -5
         large_value: float
-            The value of which, if z is above, we assume K_v(z) tends to the
-            limit of K_v(inf).
+            The value of which, if z is above and K_v(z) cannot be evaluated
+            numerically, we assume K_v(z) tends to the limit of K_v(inf).
             Default is 100
 
         Returns
         -------
-        logkv: float
-            The value of log(K_v(z))
+        logkv: Union[float, np.ndarray]
+            The value(s) of log(K_v(z)). A float if both v and z are scalars.
         """
         # argchecks
         small_value: float = kwargs.get('small_value', kv.__SMALL_VALUE)
         large_value: float = kwargs.get('large_value', kv.__LARGE_VALUE)
 
-        for arg in (v, z, large_value, small_value):
-            if isinstance(arg, Iterable) and np.asarray(arg).size == 1:
-                arg = float(arg)
+        for arg in (small_value, large_value):
+            if np.asarray(arg).size != 1:
+                raise TypeError("small_value and large_value keyword "
+                                "arguments must be scalars.")
+        small_value, large_value = float(small_value), float(large_value)
 
-            if not (isinstance(arg, float) or isinstance(arg, int)):
-                raise TypeError("all arguments / keyword arguments must "
-                                "be scalars.")
         # k_-v(z) = k_v(z)
-        v = abs(v)
+        v, z = np.broadcast_arrays(np.abs(np.asarray(v, dtype=float)),
+                                   np.asarray(z, dtype=float))
 
-        if 0 <= z <= small_value:
-            if v == 0:
-                # lim z-> 0, v -> 0
-                return np.log(-np.log(z))
-            # lim z -> 0, v fixed
-            return np.log(0.5) + scipy.special.loggamma(v) - v * np.log(0.5*z)
-        elif z >= large_value:
-            # lim z -> inf
-            return -z + 0.5 * np.log(np.pi / (2*z))
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # no limiting cases. exponentially scaled to avoid underflow for
+            # large z.
+            logkv: np.ndarray = np.log(scipy.special.kve(v, z)) - z
 
-        # no limiting cases
-        return np.log(scipy.special.kv(v, z))
+            # lim z -> 0, v fixed. also used when K_v(z) overflows for large
+            # v, where it is the leading term of the large order expansion.
+            small: np.ndarray = (0 <= z) & ((z <= small_value)
+                                            | np.isposinf(logkv))
+            logkv = np.where(small & (v != 0), np.log(0.5)
+                             + scipy.special.loggamma(v) - v * np.log(0.5 * z),
+                             logkv)
+            # lim z-> 0, v -> 0
+            logkv = np.where(small & (v == 0), np.log(-np.log(z)), logkv)
+
+            # lim z -> inf. only needed where the exponentially scaled
+            # evaluation fails, as the limit ignores the dependence on v.
+            logkv = np.where((z >= large_value) & ~np.isfinite(logkv),
+                             -z + 0.5 * np.log(np.pi / (2 * z)), logkv)
+
+        return float(logkv) if logkv.ndim == 0 else logkv
 
     @staticmethod
-    def kv(v: float, z: float, **kwargs) -> float:
+    def kv(v: Union[float, int, np.ndarray],
+           z: Union[float, int, np.ndarray], **kwargs
+           ) -> Union[float, np.ndarray]:
         """Evaluates the Modified Bessel function of the 2nd kind.
         Accounts for the limits of z and v.
 
         Parameters
         -----------
-        v: Union[float, int]
+        v: Union[float, int, np.ndarray]
             The v parameter, which specifies the member of the Modified Bessel
             function of the 2nd kind family to evaluate.
-        z : Union[int, float]
-            The scalar value to evaluate the Modified Bessel function of the
+        z : Union[float, int, np.ndarray]
+            The value(s) to evaluate the Modified Bessel function of the
             2nd kind at.
         kwargs:
             See below
@@ -93,13 +108,13 @@ class kv:
             limit of K_v(0).
             Default is 10 ** -5
         large_value: float
-            The value of which, if z is above, we assume K_v(z) tends to the
-            limit of K_v(inf).
+            The value of which, if z is above and K_v(z) cannot be evaluated
+            numerically, we assume K_v(z) tends to the limit of K_v(inf).
             Default is 100
 
         Returns
         -------
-        kv: float
-            The value of K_v(z)
+        kv: Union[float, np.ndarray]
+            The value(s) of K_v(z). A float if both v and z are scalars.
         """
         return np.exp(kv.logkv(v, z, **kwargs))
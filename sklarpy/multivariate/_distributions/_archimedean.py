@@ -7,6 +7,7 @@ from abc import abstractmethod
 from typing import Union, Tuple, Callable
 import scipy.stats
 import scipy.optimize
+import scipy.special
 
 from sklarpy.multivariate._prefit_dists import PreFitContinuousMultivariate
 from sklarpy.multivariate._fitted_dists import FittedContinuousMultivariate
@@ -25,6 +26,7 @@ class multivariate_archimedean_base_gen(PreFitContinuousMultivariate):
     _DEFAULT_STRICT_BOUNDS: tuple
     _DEFAULT_BOUNDS: tuple
     _N_PARAMS: int
+    _V_NUM_UNIFORMS: int = 1
 
     def _get_dim(self, params: tuple) -> int:
         return params[-1]
@@ -168,6 +170,24 @@ class multivariate_archimedean_base_gen(PreFitContinuousMultivariate):
             univariate array of random variables, sampled from distribution G.
         """
 
+    def _v_from_uniforms(self, u: np.ndarray, params: tuple) -> np.ndarray:
+        """Transforms uniform random numbers into random variates of
+        univariate distribution G.
+
+        Parameters
+        ----------
+        u: np.ndarray
+            A (size, _V_NUM_UNIFORMS) array of uniform random numbers.
+        params : tuple
+            The parameters which define the multivariate model, in tuple form.
+
+        Returns
+        -------
+        v_rvs: : np.ndarray
+            univariate array of random variables, sampled from distribution G.
+        """
+        self._not_implemented('variance reduced sampling')
+
     def _rvs(self, size: int, params: tuple) -> np.ndarray:
         v: np.ndarray = self._v_rvs(size=size, params=params)
         d: int = params[-1]
@@ -175,6 +195,15 @@ class multivariate_archimedean_base_gen(PreFitContinuousMultivariate):
         t: np.ndarray = -np.log(x) / v
         return self._G_hat(t=t, params=params)
 
+    def _num_rvs_uniforms(self, params: tuple) -> int:
+        return params[-1] + self._V_NUM_UNIFORMS
+
+    def _rvs_from_uniforms(self, u: np.ndarray, params: tuple) -> np.ndarray:
+        v: np.ndarray = self._v_from_uniforms(
+            u[:, :self._V_NUM_UNIFORMS], params)
+        t: np.ndarray = -np.log(u[:, self._V_NUM_UNIFORMS:]) / v
+        return self._G_hat(t=t, params=params)
+
     def _get_bounds(self, data: np.ndarray, as_tuple: bool, **kwargs) \
             -> Union[dict, tuple]:
         d: int = data.shape[1]
@@ -203,8 +232,8 @@ class multivariate_archimedean_base_gen(PreFitContinuousMultivariate):
             constraints: tuple = tuple()
         else:
             # adding equality constraints
-            con: Callable = lambda theta: np.abs(np.full(con_shape, theta[0])
-                                                 - excluded)
+            con: Callable = lambda theta: np.abs(
+                np.subtract.outer(excluded, theta[0]))
             nlc: scipy.optimize.NonlinearConstraint = \
                 scipy.optimize.NonlinearConstraint(
                     con, np.full(con_shape, 10**-5),
@@ -341,6 +370,20 @@ class multivariate_archimedean_base_gen(PreFitContinuousMultivariate):
             Available for 'mle' algorithm.
             The tolerance to use when determining convergence.
             Default value is 0.5.
+        workers: Union[int, Callable]
+            When fitting to data only.
+            Available for 'mle' algorithm.
+            The number of processes to evaluate each differential evolution
+            population over in parallel, -1 to use all available cores, or a
+            map-like callable such as multiprocessing.Pool.map.
+            Default value is 1.
+        vectorized: bool
+            When fitting to data only.
+            Available for 'mle' algorithm.
+            True to evaluate each differential evolution population in a
+            single call of the objective function. Ignored if workers is not
+            1.
+            Default value is False.
         params0: Union[Params, tuple]
             When fitting to data only.
             Available for 'mle' algorithm.
@@ -385,6 +428,12 @@ class multivariate_clayton_gen(multivariate_archimedean_base_gen):
             return np.full((size, 1), np.nan)
         return scipy.stats.gamma.rvs(a=1/theta, scale=1, size=(size, 1))
 
+    def _v_from_uniforms(self, u: np.ndarray, params: tuple) -> np.ndarray:
+        theta = params[0]
+        if theta < 0:
+            return np.full((u.shape[0], 1), np.nan)
+        return scipy.special.gammaincinv(1/theta, u).reshape((-1, 1))
+
     def _inverse_kendall_tau_calc(self, kendall_tau: float) -> float:
         return 2 * kendall_tau / (1 - kendall_tau)
 
@@ -394,16 +443,11 @@ class multivariate_clayton_gen(multivariate_archimedean_base_gen):
         # common calculations
         theta_inv: float = 1/theta
 
-        # calculating evaluating generator function
-        gen_sum: np.ndarray = np.zeros((x.shape[0], ), dtype=float)
-        log_cs: float = 0.0
-        log_gs: float = 0.0
-        for i in range(d):
-            gen_val: np.ndarray = self._generator(u=x[:, i], params=params)
-            gen_sum += gen_val
-
-            log_cs += np.log(theta_inv + d - i)
-            log_gs += np.log((theta*gen_val) + 1)
+        # evaluating generator function for all variables at once
+        gen_vals: np.ndarray = self._generator(u=x, params=params)
+        gen_sum: np.ndarray = gen_vals.sum(axis=1)
+        log_cs: float = np.log(theta_inv + d - np.arange(d)).sum()
+        log_gs: np.ndarray = np.log((theta * gen_vals) + 1).sum(axis=1)
 
         return (d * np.log(theta)) \
                - ((theta_inv + d) * np.log((theta * gen_sum) + 1)) + log_cs \
@@ -415,6 +459,7 @@ class multivariate_gumbel_gen(multivariate_archimedean_base_gen):
     _DEFAULT_STRICT_BOUNDS = (1.001, 100.0)
     _DEFAULT_BOUNDS = _DEFAULT_STRICT_BOUNDS
     _N_PARAMS = 2
+    _V_NUM_UNIFORMS = 2
 
     def _param_range(self, d: int) -> Tuple[Tuple[float, float], np.ndarray]:
         return (self._DEFAULT_BOUNDS[0], np.inf), np.array([])
@@ -428,8 +473,13 @@ class multivariate_gumbel_gen(multivariate_archimedean_base_gen):
         return np.exp(-np.power(t, 1/theta))
 
     def _v_rvs(self, size: int, params: tuple) -> np.ndarray:
+        return self._v_from_uniforms(np.random.uniform(size=(size, 2)),
+                                     params)
+
+    def _v_from_uniforms(self, u: np.ndarray, params: tuple) -> np.ndarray:
         # For the special case of the Gumbel copula,
         # we have V ~ St(1 / theta, 1, c, 0)
+        size: int = u.shape[0]
         theta: float = params[0]
         alpha: float = 1 / theta
         beta: float = 1.0
@@ -437,8 +487,8 @@ class multivariate_gumbel_gen(multivariate_archimedean_base_gen):
         mu: float = 0.0
 
         # simulating X ~ St(alpha, beta, 1, 0) rvs
-        u: np.ndarray = np.random.uniform(-0.5*np.pi, 0.5*np.pi, size)
-        w: np.ndarray = scipy.stats.expon.rvs(size=size)
+        w: np.ndarray = -np.log(u[:, 1])
+        u = np.pi * (u[:, 0] - 0.5)
         zeta: float = -beta * np.tan(np.pi * alpha * 0.5)
         if alpha != 1.0:
             xi: float = np.arctan(-zeta) / alpha
@@ -464,35 +514,86 @@ class multivariate_gumbel_gen(multivariate_archimedean_base_gen):
     def _inverse_kendall_tau_calc(self, kendall_tau: float) -> float:
         return 1 / (1 - kendall_tau)
 
-    def _DK_psi(self, t: np.ndarray, params: tuple, K: int) -> np.ndarray:
-        if K == 0:
-            return self._generator_inverse(t=t, params=params)
+    @staticmethod
+    def _log_DK_psi_coefs(theta: float, K: int) -> np.ndarray:
+        """Calculates the logarithms of the coefficients of the polynomial
+        P_K, where the K-th derivative of the generator inverse is given by
+        D^K psi(t) = (-1)^K psi(t) t^-K P_K(t^(1/theta)).
+
+        The coefficients are built bottom-up using the recurrence
+        P_{k+1}(x) = (k + ax)P_k(x) - axP_k'(x), a = 1/theta, in O(K^2)
+        operations. As a <= 1, all coefficients are non-negative, so no
+        cancellation occurs.
+
+        Parameters
+        ----------
+        theta: float
+            The theta parameter of the Gumbel copula.
+        K: int
+            The order of the derivative.
+
+        Returns
+        -------
+        log_coefs: np.ndarray
+            The logarithms of the coefficients of x^0, ..., x^K in P_K(x).
+        """
+        a: float = 1 / theta
+        orders: np.ndarray = np.arange(K + 1)
+        log_coefs: np.ndarray = np.full((K + 1, ), -np.inf)
+        log_coefs[0] = 0.0
+        with np.errstate(divide='ignore'):
+            for k in range(K):
+                shifted: np.ndarray = np.full((K + 1, ), -np.inf)
+                shifted[1:] = np.log(a) + log_coefs[:-1]
+                log_coefs = np.logaddexp(
+                    np.log(np.maximum(k - a * orders, 0.0)) + log_coefs,
+                    shifted)
+        return log_coefs
+
+    def _log_abs_DK_psi(self, t: np.ndarray, params: tuple, K: int
+                        ) -> np.ndarray:
+        """Calculates the logarithm of the absolute value of the K-th
+        derivative of the generator inverse.
+
+        Parameters
+        ----------
+        t: np.ndarray
+            The values to evaluate the derivative at.
+        params: tuple
+            The parameters which define the multivariate model, in tuple form.
+        K: int
+            The order of the derivative.
+
+        Returns
+        -------
+        log_abs_DK_psi: np.ndarray
+            log(|D^K psi(t)|)
+        """
         theta: float = params[0]
-        theta_inv: float = 1/theta
+        log_coefs: np.ndarray = self._log_DK_psi_coefs(theta, K)
+        log_t: np.ndarray = np.log(t)
+        log_poly: np.ndarray = scipy.special.logsumexp(
+            log_coefs + np.multiply.outer(log_t / theta, np.arange(K + 1)),
+            axis=-1)
+        return - np.power(t, 1 / theta) - (K * log_t) + log_poly
 
-        DK_psi: np.ndarray = np.zeros(t.shape, dtype=float)
-        for j in range(K):
-            prod = np.array([theta_inv - i + 1
-                             for i in range(1, K - j + 1)]).prod()
-            DK_psi -= self._DK_psi(t=t, params=params, K=j) \
-                      * np.power(t, theta_inv - K + j) * prod
-        return DK_psi
+    def _DK_psi(self, t: np.ndarray, params: tuple, K: int) -> np.ndarray:
+        return ((-1) ** K) * np.exp(self._log_abs_DK_psi(t=t, params=params,
+                                                         K=K))
 
     def _logpdf(self, x: np.ndarray, params: tuple,  **kwargs) -> np.ndarray:
         theta, d = params
 
-        # calculating evaluating generator function
-        gen_sum: np.ndarray = np.zeros((x.shape[0],), dtype=float)
-        log_gs: float = 0.0
-        for i in range(d):
-            gen_val: np.ndarray = self._generator(u=x[:, i], params=params)
-            gen_sum += gen_val
-
-            log_gs -= (((1/theta) - 1) * np.log(gen_val)) + np.log(x[:, i])
+        # evaluating generator function for all variables at once
+        gen_vals: np.ndarray = self._generator(u=x, params=params)
+        gen_sum: np.ndarray = gen_vals.sum(axis=1)
+        log_gs: np.ndarray = - ((((1/theta) - 1) * np.log(gen_vals))
+                                + np.log(x)).sum(axis=1)
 
         # calculating d-th derivative of generator inverse
-        Dd_psi: np.ndarray = self._DK_psi(t=gen_sum, params=params, K=d)
-        return np.log(np.abs(Dd_psi)) + (d*np.log(theta)) + log_gs
+        log_Dd_psi: np.ndarray = self._log_abs_DK_psi(t=gen_sum,
+                                                      params=params, K=d)
+        return log_Dd_psi + (d*np.log(theta)) + log_gs
 
 
 class bivariate_frank_gen(multivariate_archimedean_base_gen):
@@ -513,8 +614,16 @@ class bivariate_frank_gen(multivariate_archimedean_base_gen):
         return -(theta**-1) * np.log(1 + np.exp(-t) * (np.exp(-theta) - 1))
 
     def _rvs(self, size: int, params: tuple) -> np.ndarray:
+        return self._rvs_from_uniforms(np.random.uniform(size=(size, 2)),
+                                       params)
+
+    def _num_rvs_uniforms(self, params: tuple) -> int:
+        return 2
+
+    def _rvs_from_uniforms(self, u: np.ndarray, params: tuple) -> np.ndarray:
+        # conditional distribution method
         theta: float = params[0]
-        rvs: np.ndarray = np.random.uniform(size=(size, 2))
+        rvs: np.ndarray = u.copy()
         rvs[:, 1] = - (theta**-1) * np.log(
             1 + (((1 - np.exp(-theta)) * rvs[:, 1])
                  / (
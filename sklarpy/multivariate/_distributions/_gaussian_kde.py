@@ -1,5 +1,11 @@
 # Contains code for the multivariate Gaussian KDE model
+import weakref
 import scipy.stats
+import scipy.fft
+import scipy.integrate
+import scipy.linalg
+import scipy.ndimage
+import scipy.special
 import numpy as np
 import pandas as pd
 from typing import Tuple, Union, Callable
@@ -10,6 +16,300 @@ from sklarpy.utils._params import Params
 
 __all__ = ['multivariate_gaussian_kde_gen']
 
+_NUM_KERNEL_SDS: float = 6.0  # kernel truncation and grid padding
+_GRID_SPACINGS: tuple = (0.1, 0.15, 0.2, 0.25)  # in kernel sds
+_MAX_GRID_SIZE: int = 2 ** 22  # max number of points in a (padded) grid
+_PDF_RTOL: float = 10 ** -2  # max relative error of binned pdf values
+_CDF_ATOL: float = 10 ** -3  # max absolute error of binned cdf values
+_NUM_VALIDATION_POINTS: int = 64
+_EXACT_LOGPDF_PAIRS: int = 10 ** 7  # auto: max query x training points
+_EXACT_CDF_PAIRS: int = 10 ** 5
+
+
+def _linear_binning(points: np.ndarray, weights: np.ndarray, lo: np.ndarray,
+                    spacing: np.ndarray, shape: tuple) -> np.ndarray:
+    """Linearly bins multivariate data onto a regular grid, splitting each
+    observation between the 2^d corners of the grid cell containing it in
+    proportion to its distance from each.
+
+    Parameters
+    ----------
+    points: np.ndarray
+        The (n, d) array of observations.
+    weights: np.ndarray
+        The weight of each observation.
+    lo: np.ndarray
+        The first point of the grid in each dimension.
+    spacing: np.ndarray
+        The spacing of the grid in each dimension.
+    shape: tuple
+        The number of grid points in each dimension.
+
+    Returns
+    -------
+    counts: np.ndarray
+        The (weighted, fractional) number of observations assigned to each
+        grid point.
+    """
+    d: int = len(shape)
+    upper: np.ndarray = np.array(shape) - 2
+    position: np.ndarray = (points - lo) / spacing
+    idx: np.ndarray = np.clip(np.floor(position).astype(np.int64), 0, upper)
+    frac: np.ndarray = np.clip(position - idx, 0.0, 1.0)
+
+    size: int = int(np.prod(shape))
+    counts: np.ndarray = np.zeros(size)
+    for corner in range(2 ** d):
+        offsets: list = [(corner >> j) & 1 for j in range(d)]
+        corner_weights: np.ndarray = weights.copy()
+        for j, offset in enumerate(offsets):
+            corner_weights *= frac[:, j] if offset else 1 - frac[:, j]
+        corner_idx: np.ndarray = np.ravel_multi_index(
+            tuple((idx + offsets).T), shape)
+        counts += np.bincount(corner_idx, corner_weights, size)
+    return counts.reshape(shape)
+
+
+def _grid_shapes(points: np.ndarray, spacing: np.ndarray, sds: np.ndarray
+                 ) -> Tuple[np.ndarray, np.ndarray, tuple, tuple]:
+    """Returns the first point and shape of a grid covering the data and
+    padded by the kernel's truncation width, the kernel's half-width in grid
+    points and the zero-padded shape of the FFT convolution.
+
+    Parameters
+    ----------
+    points: np.ndarray
+        The (n, d) array of observations.
+    spacing: np.ndarray
+        The spacing of the grid in each dimension.
+    sds: np.ndarray
+        The marginal standard deviations of the kernel.
+
+    Returns
+    -------
+    grid_info: Tuple[np.ndarray, np.ndarray, tuple, tuple]
+        lo, half_width, shape, fft_shape
+    """
+    padding: np.ndarray = _NUM_KERNEL_SDS * sds
+    lo: np.ndarray = points.min(axis=0) - padding
+    hi: np.ndarray = points.max(axis=0) + padding
+    shape: tuple = tuple(int(m) for m in
+                         np.ceil((hi - lo) / spacing).astype(int) + 1)
+    half_width: np.ndarray = np.ceil(padding / spacing).astype(int)
+    fft_shape: tuple = tuple(
+        scipy.fft.next_fast_len(m + 2 * int(w), real=True)
+        for m, w in zip(shape, half_width))
+    return lo, half_width, shape, fft_shape
+
+
+def _binned_kde_grid(points: np.ndarray, weights: np.ndarray,
+                     kernel_cov: np.ndarray, spacing_sds: np.ndarray,
+                     num_tents: int) \
+        -> Union[Tuple[np.ndarray, np.ndarray, np.ndarray], None]:
+    """Evaluates a gaussian kde at the points of a regular grid, by
+    convolving the linearly binned data with the kernel using the FFT.
+
+    The finest spacing in _GRID_SPACINGS whose zero-padded grid has at most
+    _MAX_GRID_SIZE points is used. Linear binning, linear interpolation and
+    trapezoidal integration each smooth the kde by (approximately) a tent
+    function of variance spacing^2 / 6 in each dimension, so the total
+    variance added is subtracted from the kernel's covariance.
+
+    Parameters
+    ----------
+    points: np.ndarray
+        The (n, d) array of observations.
+    weights: np.ndarray
+        The weight of each observation, summing to 1.
+    kernel_cov: np.ndarray
+        The covariance matrix of the gaussian kernel.
+    spacing_sds: np.ndarray
+        The standard deviations, in each dimension, which the grid's spacing
+        is a multiple of.
+    num_tents: int
+        The number of tent function smoothings to correct for.
+
+    Returns
+    -------
+    grid: Union[Tuple[np.ndarray, np.ndarray, np.ndarray], None]
+        The first point of the grid, the grid's spacing and the kde's pdf at
+        each grid point. None if the grid is too large.
+    """
+    d: int = points.shape[1]
+    sds: np.ndarray = np.sqrt(np.diag(kernel_cov))
+    for spacing_sd in _GRID_SPACINGS:
+        spacing: np.ndarray = spacing_sd * spacing_sds
+        lo, half_width, shape, fft_shape = _grid_shapes(points, spacing, sds)
+        if np.prod(fft_shape, dtype=float) <= _MAX_GRID_SIZE:
+            break
+    else:
+        return None
+
+    # evaluating the bias corrected kernel on its own grid
+    offsets: list = np.meshgrid(*[np.arange(-w, w + 1) * spacing[j]
+                                  for j, w in enumerate(half_width)],
+                                indexing='ij')
+    corrected_cov: np.ndarray = kernel_cov \
+        - np.diag(num_tents * spacing ** 2 / 6)
+    kernel: np.ndarray = scipy.stats.multivariate_normal.pdf(
+        np.stack(offsets, axis=-1), np.zeros(d), corrected_cov)
+
+    counts: np.ndarray = _linear_binning(points, weights, lo, spacing, shape)
+    convolved: np.ndarray = scipy.fft.irfftn(
+        scipy.fft.rfftn(counts, fft_shape)
+        * scipy.fft.rfftn(kernel.reshape(offsets[0].shape), fft_shape),
+        fft_shape)
+    pdf_grid: np.ndarray = convolved[tuple(
+        slice(w, w + m) for w, m in zip(half_width, shape))]
+    return lo, spacing, np.clip(pdf_grid, 0.0, None)
+
+
+class _BinnedKDE:
+    """A binned approximation of a fitted scipy gaussian_kde, allowing its
+    logpdf and cdf to be evaluated in O(1) time per point, after an
+    O(n + G log G) set-up.
+
+    The pdf is tabulated in the whitened space, where the kernel is
+    isotropic, and the cdf in the original space, where the region it
+    integrates over is a box, as the cumulative integral of the pdf along
+    each axis. Each grid is built on first use and checked against exact
+    values, being discarded if its error exceeds _PDF_RTOL / _CDF_ATOL.
+    Methods return nans wherever exact evaluation is required.
+    """
+    _UNBUILT = 'unbuilt'
+
+    def __init__(self, kde: scipy.stats.gaussian_kde):
+        self.covariance: np.ndarray = kde.covariance.copy()
+        self._chol: np.ndarray = np.linalg.cholesky(self.covariance)
+        self._log_det_chol: float = float(np.log(np.diag(self._chol)).sum())
+        self._pdf_grid = self._cdf_grid = self._UNBUILT
+
+        # truncated kernel contributions are negligible above this density
+        d: int = self.covariance.shape[0]
+        self._pdf_floor: float = (2 * np.pi) ** (-d / 2) \
+            * np.exp(-_NUM_KERNEL_SDS ** 2 / 2) / _PDF_RTOL
+
+    @staticmethod
+    def _points_weights(kde: scipy.stats.gaussian_kde
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        return kde.dataset.T, kde.weights / kde.weights.sum()
+
+    def _whiten(self, x: np.ndarray) -> np.ndarray:
+        return scipy.linalg.solve_triangular(self._chol, x.T, lower=True).T
+
+    @staticmethod
+    def _positions(x: np.ndarray, grid: tuple) -> Tuple[np.ndarray, tuple]:
+        lo, spacing, values = grid
+        return ((x - lo) / spacing).T, values.shape
+
+    def _build_pdf(self, kde: scipy.stats.gaussian_kde) -> None:
+        points, weights = self._points_weights(kde)
+        d: int = points.shape[1]
+        self._pdf_grid = _binned_kde_grid(
+            self._whiten(points), weights, np.eye(d), np.ones(d), 2)
+        if self._pdf_grid is None:
+            return
+
+        # comparing to exact values next to a subset of the observations,
+        # in between grid points
+        idx: np.ndarray = np.linspace(0, points.shape[0] - 1,
+                                      _NUM_VALIDATION_POINTS).astype(int)
+        z: np.ndarray = self._whiten(points[idx]) + 0.5 / np.sqrt(d)
+        binned: np.ndarray = self._binned_pdf(z)
+        exact: np.ndarray = kde.pdf((z @ self._chol.T).T) \
+            * np.exp(self._log_det_chol)
+        mask: np.ndarray = ~np.isnan(binned)
+        if not (mask.any() and np.abs(binned[mask] / exact[mask] - 1).max()
+                <= _PDF_RTOL):
+            self._pdf_grid = None
+
+    def _build_cdf(self, kde: scipy.stats.gaussian_kde) -> None:
+        points, weights = self._points_weights(kde)
+        d: int = points.shape[1]
+        conditional_sds: np.ndarray = 1 / np.sqrt(np.diag(
+            np.linalg.inv(self.covariance)))
+        grid = _binned_kde_grid(points, weights, self.covariance,
+                                conditional_sds, 3)
+        if grid is None:
+            self._cdf_grid = None
+            return
+        lo, spacing, cdf_grid = grid
+        for j in range(d):
+            cdf_grid = scipy.integrate.cumulative_trapezoid(
+                cdf_grid, dx=spacing[j], axis=j, initial=0)
+        cdf_grid /= cdf_grid[(-1, ) * d]
+        self._cdf_grid = lo, spacing, cdf_grid
+
+        # comparing each marginal to its exact value, a weighted sum of
+        # univariate normal cdfs
+        sds: np.ndarray = np.sqrt(np.diag(self.covariance))
+        for j in range(d):
+            x: np.ndarray = np.full((_NUM_VALIDATION_POINTS, d), np.inf)
+            x[:, j] = np.linspace(points[:, j].min(), points[:, j].max(),
+                                  _NUM_VALIDATION_POINTS)
+            exact: np.ndarray = scipy.special.ndtr(
+                (x[:, j, None] - points[:, j]) / sds[j]) @ weights
+            if np.abs(self._binned_cdf(x) - exact).max() > _CDF_ATOL:
+                self._cdf_grid = None
+                return
+
+    def _binned_pdf(self, z: np.ndarray) -> np.ndarray:
+        """The binned whitened pdf, with nans outside the grid or where it
+        cannot be relied on."""
+        position, shape = self._positions(z, self._pdf_grid)
+        inside: np.ndarray = ((position >= 0) & (position <= np.array(
+            shape)[:, None] - 1)).all(axis=0)
+        values: np.ndarray = scipy.ndimage.map_coordinates(
+            self._pdf_grid[2], position, order=1, mode='nearest')
+        values[~inside | (values < self._pdf_floor)] = np.nan
+        return values
+
+    def _binned_cdf(self, x: np.ndarray) -> np.ndarray:
+        """The binned cdf. Values below the grid, which lie more than
+        _NUM_KERNEL_SDS kernel standard deviations below all observations
+        in some dimension, are 0."""
+        position, shape = self._positions(x, self._cdf_grid)
+        below: np.ndarray = (position < 0).any(axis=0)
+        position = np.clip(position, 0, np.array(shape)[:, None] - 1)
+        values: np.ndarray = scipy.ndimage.map_coordinates(
+            self._cdf_grid[2], position, order=1, mode='nearest')
+        values[below] = 0.0
+        return np.clip(values, 0.0, 1.0)
+
+    def logpdf(self, x: np.ndarray, kde: scipy.stats.gaussian_kde
+               ) -> np.ndarray:
+        """The binned logpdf, with nans where exact evaluation is required.
+        """
+        if self._pdf_grid is self._UNBUILT:
+            self._build_pdf(kde)
+        if self._pdf_grid is None:
+            return np.full((x.shape[0], ), np.nan)
+        return np.log(self._binned_pdf(self._whiten(x))) \
+            - self._log_det_chol
+
+    def cdf(self, x: np.ndarray, kde: scipy.stats.gaussian_kde
+            ) -> np.ndarray:
+        """The binned cdf, with nans where exact evaluation is required."""
+        if self._cdf_grid is self._UNBUILT:
+            self._build_cdf(kde)
+        if self._cdf_grid is None:
+            return np.full((x.shape[0], ), np.nan)
+        return self._binned_cdf(x)
+
+
+# binned approximations are built once per fitted kde
+_binned_kdes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_binned_kde(kde: scipy.stats.gaussian_kde) -> _BinnedKDE:
+    """Returns the binned approximation of a fitted kde, rebuilding it if the
+    kde's bandwidth has changed."""
+    binned: _BinnedKDE = _binned_kdes.get(kde)
+    if binned is None or not np.array_equal(binned.covariance,
+                                            kde.covariance):
+        binned = _binned_kdes[kde] = _BinnedKDE(kde)
+    return binned
+
 
 class multivariate_gaussian_kde_gen(PreFitContinuousMultivariate):
     """Multivariate Gaussian KDE model."""
@@ -32,9 +332,71 @@ class multivariate_gaussian_kde_gen(PreFitContinuousMultivariate):
     def _get_dim(self, params: tuple) -> int:
         return params[0].covariance.shape[1]
 
+    @staticmethod
+    def _use_binned(x: np.ndarray, kde: scipy.stats.gaussian_kde,
+                    max_exact_pairs: int, **kwargs) -> bool:
+        """Whether to use the binned approximation of the kde.
+
+        Parameters
+        ----------
+        x: np.ndarray
+            numpy array of multivariate data.
+        kde: scipy.stats.gaussian_kde
+            The fitted kde.
+        max_exact_pairs: int
+            The number of query and training point pairs above which 'auto'
+            uses the binned approximation.
+        kwargs:
+            See below.
+
+        Keyword Arguments
+        ------------------
+        kde_method: str
+            'exact' to evaluate the kde over all training points, 'binned' to
+            use a binned approximation of the kde, or 'auto' to use the binned
+            approximation only for large numbers of points.
+            The binned approximation tabulates the kde on a grid using the
+            FFT, with relative pdf errors below 1% and absolute cdf errors
+            below 0.001. It falls back to exact evaluation when the grid would
+            be too large (typically d > 3, or d = 3 with long tails) or
+            inaccurate, and for points far from the data.
+            Default is 'auto'.
+
+        Returns
+        -------
+        use_binned: bool
+            True to use the binned approximation.
+        """
+        kde_method: str = kwargs.get('kde_method', 'auto')
+        if kde_method not in ('auto', 'binned', 'exact'):
+            raise ValueError("kde_method must be one of 'auto', 'binned' or "
+                             "'exact'.")
+        if kde_method == 'auto':
+            return x.shape[0] * kde.n > max_exact_pairs
+        return kde_method == 'binned'
+
     def _logpdf(self, x: np.ndarray, params: tuple,  **kwargs) -> np.ndarray:
         kde: scipy.stats.gaussian_kde = params[0]
-        return kde.logpdf(x.T).T
+        if not self._use_binned(x, kde, _EXACT_LOGPDF_PAIRS, **kwargs):
+            return kde.logpdf(x.T).T
+
+        logpdf_values: np.ndarray = _get_binned_kde(kde).logpdf(x, kde)
+        exact_mask: np.ndarray = np.isnan(logpdf_values)
+        if exact_mask.any():
+            logpdf_values[exact_mask] = kde.logpdf(x[exact_mask].T)
+        return logpdf_values
+
+    def _cdf(self, x: np.ndarray, params: tuple, **kwargs) -> np.ndarray:
+        kde: scipy.stats.gaussian_kde = params[0]
+        if not self._use_binned(x, kde, _EXACT_CDF_PAIRS, **kwargs):
+            return super()._cdf(x, params, **kwargs)
+
+        cdf_values: np.ndarray = _get_binned_kde(kde).cdf(x, kde)
+        exact_mask: np.ndarray = np.isnan(cdf_values)
+        if exact_mask.any():
+            cdf_values[exact_mask] = super()._cdf(x[exact_mask], params,
+                                                  **kwargs)
+        return cdf_values
 
     def _singlular_cdf(self, num_variables: int, xrow: np.ndarray,
                        params: tuple) -> float:
@@ -1,12 +1,17 @@
 # Contains code for the multivariate Generalized Hyperbolic model
 import numpy as np
 import pandas as pd
+import scipy.linalg
+import scipy.special
+import warnings
 from collections import deque
 from typing import Tuple, Union
 from scipy.optimize import differential_evolution
 
 from sklarpy.multivariate._prefit_dists import PreFitContinuousMultivariate
 from sklarpy.multivariate._fitted_dists import FittedContinuousMultivariate
+from sklarpy.multivariate._distributions._normal_mixture_cdf import \
+    normal_mixture_cdf
 from sklarpy.univariate import gig
 from sklarpy.univariate._distributions import _gh
 from sklarpy.misc import CorrelationMatrix, kv
@@ -106,15 +111,189 @@ class multivariate_gen_hyperbolic_gen(PreFitContinuousMultivariate):
                        - (0.25 * (d - 2 * lamb) * (np.log(q) + np.log(p)))
         return float(log_c + log_h)
 
+    @staticmethod
+    def _quad_forms(x: np.ndarray, loc: np.ndarray, shape: np.ndarray,
+                    gamma: np.ndarray) -> Tuple[np.ndarray, np.ndarray,
+                                                float, float]:
+        """Calculates the quadratic forms required by the log-pdf of the
+        Generalized Hyperbolic family for every observation at once.
+
+        The shape matrix is factored a single time via its Cholesky
+        decomposition, with all Mahalanobis terms then obtained from one
+        triangular solve.
+
+        The parameters of S models may also be given at once, as (S, d, 1)
+        location and skewness stacks and a (S, d, d) shape stack, in which
+        case each returned value gains a leading axis of size S.
+
+        Parameters
+        ----------
+        x: np.ndarray
+            numpy array of multivariate data.
+        loc: np.ndarray
+            The location vector of the multivariate model.
+        shape: np.ndarray
+            The square, symmetric shape matrix of the multivariate model.
+        gamma: np.ndarray
+            The skewness vector of the multivariate model.
+
+        Returns
+        -------
+        quad_forms: Tuple[np.ndarray, np.ndarray, float, float]
+            (x-loc)^T shape^-1 (x-loc) for each row,
+            (x-loc)^T shape^-1 gamma for each row,
+            gamma^T shape^-1 gamma,
+            log(det(shape)).
+        """
+        if shape.ndim == 3:
+            L: np.ndarray = np.linalg.cholesky(shape)
+            z: np.ndarray = np.linalg.solve(
+                L, x.T[np.newaxis, :, :] - loc)
+            g: np.ndarray = np.linalg.solve(L, gamma)
+            log_diag: np.ndarray = np.log(np.diagonal(L, axis1=1, axis2=2))
+            return ((z ** 2).sum(axis=1), (z * g).sum(axis=1),
+                    (g ** 2).sum(axis=1),
+                    2 * log_diag.sum(axis=1, keepdims=True))
+
+        d: int = loc.size
+        L: np.ndarray = np.linalg.cholesky(shape)
+        z: np.ndarray = scipy.linalg.solve_triangular(
+            L, (x - loc.reshape((1, d))).T, lower=True)
+        g: np.ndarray = scipy.linalg.solve_triangular(
+            L, gamma.reshape((d, 1)), lower=True)
+        return ((z ** 2).sum(axis=0), (z * g).sum(axis=0),
+                float((g ** 2).sum()), 2 * float(np.log(np.diag(L)).sum()))
+
+    def _batch_logpdf(self, x: np.ndarray, params: tuple, **kwargs
+                      ) -> np.ndarray:
+        """Returns the log-pdf values for all sets of variable observations,
+        with the shape matrix factored only once.
+
+        Parameters
+        ----------
+        x: np.ndarray
+            numpy array of multivariate data.
+        params : tuple
+            The parameters which define the multivariate model, in tuple form.
+
+        Returns
+        -------
+        logpdf_array : np.ndarray
+            numpy array of log-pdf values.
+        """
+        # getting params
+        lamb, chi, psi, loc, shape, gamma = params
+        d: int = shape.shape[-1]
+
+        # common calculations
+        mahalanobis, skew_terms, gamma_term, log_det = self._quad_forms(
+            x, loc, shape, gamma)
+        q: np.ndarray = chi + mahalanobis
+        p: float = psi + gamma_term
+        r: float = np.sqrt(chi * psi)
+
+        log_c: float = (lamb * (np.log(psi) - np.log(r))) \
+                       + ((0.5 * d - lamb) * np.log(p)) \
+                       - 0.5 * (
+                               (d * np.log(2 * np.pi))
+                               + log_det
+                               + 2 * kv.logkv(lamb, r)
+                       )
+        log_h: np.ndarray = kv.logkv(lamb - (d / 2), np.sqrt(q * p)) \
+                            + skew_terms \
+                            - (0.25 * (d - 2 * lamb) * (np.log(q) + np.log(p)))
+        return log_c + log_h
+
     def _logpdf(self, x: np.ndarray, params: tuple, **kwargs) -> np.ndarray:
         xshape: tuple = x.shape
         if len(xshape) == 1:
-            x.reshape((x.shape[0], 1))
+            x = x.reshape((1, x.shape[0]))
         elif len(xshape) != 2:
             raise ValueError("x must be a 1 or 2 dimensional array")
 
-        return np.array([self._singular_logpdf(xrow, params, **kwargs)
-                         for xrow in x], dtype=float)
+        try:
+            return self._batch_logpdf(x, params, **kwargs)
+        except np.linalg.LinAlgError:
+            # shape matrix is not positive definite, so cannot be Cholesky
+            # factored
+            return np.array([self._singular_logpdf(xrow, params, **kwargs)
+                             for xrow in x], dtype=float)
+
+    def _cdf(self, x: np.ndarray, params: tuple, **kwargs) -> np.ndarray:
+        """The cumulative distribution function of the multivariate
+        distribution, evaluated for all rows at once using randomized
+        quasi-monte-carlo, conditioning on the mixing variable W.
+
+        Parameters
+        ----------
+        x: np.ndarray
+            numpy array of multivariate data.
+        params : tuple
+            The parameters which define the multivariate model, in tuple form.
+        kwargs:
+            See below.
+
+        Keyword Arguments
+        ------------------
+        abseps: float
+            The absolute error tolerance of each cdf value. A warning is
+            raised if it is not met using max_num_points points.
+            Default is 10 ** -4.
+        max_num_points: int
+            The maximum number of points used to evaluate each cdf value.
+            Default is 2 ** 16.
+
+        See Also
+        --------
+        sklarpy.multivariate._distributions._normal_mixture_cdf.
+        normal_mixture_cdf
+
+        Returns
+        -------
+        cdf_array: np.ndarray
+            numpy array of cumulative distribution values.
+        """
+        abseps: float = kwargs.get('abseps', 10 ** -4)
+        cdf_values, errors = normal_mixture_cdf(
+            x=x, loc=params[3], shape=params[4], gamma=params[5],
+            w_ppf=lambda q: self._w_ppf(q, params), abseps=abseps,
+            max_num_points=kwargs.get('max_num_points', 2 ** 16))
+        if np.any(errors > abseps):
+            warnings.warn(f"{self.name} cdf values have estimated absolute "
+                          f"errors of up to {errors.max():.2e}, exceeding "
+                          f"abseps={abseps}.")
+        return cdf_values
+
+    def _batch_loglikelihood(self, data: np.ndarray, params: list, **kwargs
+                             ) -> np.ndarray:
+        # stacking each parameter, so all models are evaluated at once
+        params_tuples: list = [self._get_params(params_tuple,
+                                                check_params=False)
+                               for params_tuple in params]
+        stacked_params: deque = deque()
+        for i in range(len(params_tuples[0])):
+            stacked: np.ndarray = np.stack([
+                np.asarray(params_tuple[i], dtype=float)
+                for params_tuple in params_tuples])
+            stacked_params.append(stacked.reshape((-1, 1))
+                                  if stacked.ndim == 1 else stacked)
+
+        try:
+            with np.errstate(all='ignore'):
+                logpdf_values: np.ndarray = self._batch_logpdf(
+                    data, tuple(stacked_params))
+        except np.linalg.LinAlgError:
+            # at least one shape matrix is not positive definite
+            return super()._batch_loglikelihood(data, params, **kwargs)
+
+        mask: np.ndarray = np.isnan(logpdf_values)
+        loglikelihoods: np.ndarray = np.where(mask, 0.0, logpdf_values
+                                              ).sum(axis=1)
+        # all logpdf values are nan, so returning nan
+        loglikelihoods[mask.all(axis=1)] = np.nan
+        # returning -np.inf instead of nan
+        loglikelihoods[np.isinf(logpdf_values).any(axis=1)] = -np.inf
+        return loglikelihoods
 
     def _w_rvs(self, size: int, params: tuple) -> np.ndarray:
         """Returns random variates, generated from the univariate distribution
@@ -140,6 +319,24 @@ class multivariate_gen_hyperbolic_gen(PreFitContinuousMultivariate):
         """
         return gig.rvs((size,), params[:3], ppf_approx=True)
 
+    def _w_ppf(self, q: np.ndarray, params: tuple) -> np.ndarray:
+        """Returns the percent point function (inverse cdf) values of the
+        univariate distribution of W.
+
+        Parameters
+        ----------
+        q: np.ndarray
+            univariate array of probabilities.
+        params : tuple
+            The parameters which define the multivariate model, in tuple form.
+
+        Returns
+        -------
+        w_ppf: np.ndarray
+            univariate array of ppf values of W.
+        """
+        return gig.ppf(q, params[:3])
+
     def _rvs(self, size: int, params: tuple) -> np.ndarray:
         # getting params
         loc: np.ndarray = params[3]
@@ -162,6 +359,16 @@ class multivariate_gen_hyperbolic_gen(PreFitContinuousMultivariate):
         m: np.ndarray = loc + (w * gamma)
         return (m + np.sqrt(w) * (A @ z)).T
 
+    def _num_rvs_uniforms(self, params: tuple) -> int:
+        return self._get_dim(params) + 1
+
+    def _rvs_from_uniforms(self, u: np.ndarray, params: tuple) -> np.ndarray:
+        # normal mean-variance mixture, with W generated by inversion
+        w: np.ndarray = self._w_ppf(u[:, 0], params).reshape((-1, 1))
+        z: np.ndarray = scipy.special.ndtri(u[:, 1:])
+        return params[3].flatten() + w * params[5].flatten() \
+            + np.sqrt(w) * (z @ np.linalg.cholesky(params[4]).T)
+
     def _etas_deltas_zetas(self, data: np.ndarray, params: tuple, h: float) \
             -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Calculates the conditional expectations of W given X, to use in the
@@ -190,29 +397,20 @@ class multivariate_gen_hyperbolic_gen(PreFitContinuousMultivariate):
             array of eta values, array of delta values, array of zeta values.
         """
         lamb, chi, psi, loc, shape, gamma = params
-        shape_inv: np.ndarray = np.linalg.inv(shape)
         d: int = loc.size
-        etas: deque = deque()
-        deltas: deque = deque()
-        zetas: deque = deque()
+        n: int = data.shape[0]
 
-        p: float = psi + (gamma.T @ shape_inv @ gamma)
+        # conditional GIG parameters for every observation at once
+        mahalanobis, _, gamma_term, _ = self._quad_forms(data, loc, shape,
+                                                         gamma)
+        q: np.ndarray = chi + mahalanobis
+        p: float = psi + gamma_term
         v = lamb - 0.5 * d
 
-        for xi in data:
-            xi = xi.reshape((d, 1))
-            qi: float = chi + ((xi - loc).T @ shape_inv @ (xi - loc))
-
-            cond_params: tuple = (v, qi, p)
-            eta_i: float = self._UNIVAR._exp_w(cond_params)
-            delta_i: float = self._UNIVAR._exp_w((-v, p, qi))
-            zeta_i: float = self._exp_log_w(cond_params, h)
-
-            deltas.append(delta_i)
-            etas.append(eta_i)
-            zetas.append(zeta_i)
-
-        n: int = len(etas)
+        cond_params: tuple = (v, q, p)
+        etas: np.ndarray = self._UNIVAR._exp_w(cond_params)
+        deltas: np.ndarray = self._UNIVAR._exp_w((-v, p, q))
+        zetas: np.ndarray = self._exp_log_w(cond_params, h)
         return (
             np.asarray(etas, dtype=float).reshape((n, 1)),
             np.asarray(deltas, dtype=float).reshape((n, 1)),
@@ -626,7 +824,7 @@ class multivariate_gen_hyperbolic_gen(PreFitContinuousMultivariate):
         best_k: int = 0
         continue_em: bool = True
         best_params = params = (lamb, chi, psi, loc, shape, gamma) = params0
-        loglikelihood: float = self.loglikelihood(data, best_params)
+        loglikelihood: float = self._loglikelihood(data, best_params)
         best_loglikelihood: float = loglikelihood
         q2_success: bool = False
         last_m_runs: deque = deque([best_loglikelihood])  # m = window length
@@ -656,9 +854,8 @@ class multivariate_gen_hyperbolic_gen(PreFitContinuousMultivariate):
                 # 4. update location and shape
                 loc = ((deltas * data).mean(axis=0, dtype=float)
                        .reshape((d, 1)) - gamma) / delta_mean
-                omega: np.ndarray = np.array([
-                    deltas[i] * (data[i, :] - loc) @ (data[i, :] - loc).T
-                    for i in range(n)]).mean(axis=0, dtype=float) - (
+                centred: np.ndarray = data - loc.reshape((1, d))
+                omega: np.ndarray = ((deltas * centred).T @ centred / n) - (
                         eta_mean * gamma @ gamma.T)
                 omega, _, eigenvalues = CorrelationMatrix._rm_pd(omega,
                                                                  min_eig)
@@ -676,7 +873,7 @@ class multivariate_gen_hyperbolic_gen(PreFitContinuousMultivariate):
 
             # 7. check convergence
             params: tuple = (lamb, chi, psi, loc, shape, gamma)
-            loglikelihood: float = self.loglikelihood(data, params)
+            loglikelihood: float = self._loglikelihood(data, params)
 
             if q2_success and k > convergence_window_length:
                 max_change: float = abs(
@@ -813,6 +1010,9 @@ class multivariate_gen_hyperbolic_gen(PreFitContinuousMultivariate):
             for arg in default_q2_options:
                 if arg not in q2_options:
                     q2_options[arg] = default_q2_options[arg]
+            for arg in ('workers', 'vectorized'):
+                if (arg in user_kwargs) and (arg not in q2_options):
+                    q2_options[arg] = user_kwargs[arg]
             kwargs: dict = {
                 'min_retries': 0, 'max_retries': 3, 'copula': False,
                 'bounds': bounds, 'params0': default_param0,
@@ -911,6 +1111,21 @@ class multivariate_gen_hyperbolic_gen(PreFitContinuousMultivariate):
             When fitting to data only.
             True to display the progress of the optimization algorithm.
             Default value is False.
+        workers: Union[int, Callable]
+            When fitting to data only.
+            The number of processes to evaluate each differential evolution
+            population over in parallel, -1 to use all available cores, or a
+            map-like callable such as multiprocessing.Pool.map. For the 'em'
+            algorithm, this is used when maximizing Q2, unless 'workers' is
+            specified in q2_options.
+            Default value is 1.
+        vectorized: bool
+            When fitting to data only.
+            True to evaluate each differential evolution population in a
+            single batched log-likelihood call. For the 'em' algorithm, this
+            is used when maximizing Q2, unless 'vectorized' is specified in
+            q2_options. Ignored if workers is not 1.
+            Default value is False.
         kwargs:
             Any additional keyword arguments to pass to CorrelationMatrix.cov
 
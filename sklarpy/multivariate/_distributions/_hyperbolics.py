@@ -87,9 +87,7 @@ class multivariate_hyperbolic_base_gen(multivariate_gen_hyperbolic_gen):
     def _get_params0(self, data: np.ndarray, bounds: tuple, cov_method: str,
                      min_eig, copula: bool, **kwargs) -> tuple:
         # modifying bounds to fit those of the Generalized Hyperbolic
-        d: int = (len(bounds) - 2) / 2 if self._ASYMMETRIC else len(bounds) - 2
-        d = int(d)
-        self._init_lamb(d)
+        self._init_lamb(data.shape[1])
         bounds = ((self._lamb, self._lamb), *bounds)
 
         return super()._get_params0(data=data, bounds=bounds,
@@ -2,6 +2,7 @@
 import numpy as np
 import pandas as pd
 import scipy.stats
+import scipy.special
 from typing import Tuple, Union
 
 from sklarpy.multivariate._prefit_dists import PreFitContinuousMultivariate
@@ -42,6 +43,10 @@ class multivariate_normal_gen(PreFitContinuousMultivariate):
             size=size, mean=loc.flatten(), cov=params[1]).reshape(
             (size, loc.size))
 
+    def _rvs_from_uniforms(self, u: np.ndarray, params: tuple) -> np.ndarray:
+        z: np.ndarray = scipy.special.ndtri(u)
+        return params[0].flatten() + z @ np.linalg.cholesky(params[1]).T
+
     def _fit_given_data_kwargs(self, method: str, data: np.ndarray,
                                **user_kwargs) -> dict:
         return {'cov_method': 'laloux_pp_kendall', 'copula': False}
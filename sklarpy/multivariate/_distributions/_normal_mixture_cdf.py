@@ -0,0 +1,145 @@
+# Contains a randomized quasi-monte-carlo integrator for the cdfs of
+# multivariate normal mean-variance mixture distributions
+import numpy as np
+import scipy.special
+import scipy.stats
+from typing import Callable, Tuple, Union
+
+__all__ = ['normal_mixture_cdf']
+
+_NUM_RANDOMIZATIONS: int = 8  # independent scramblings of the sobol sequence
+_MIN_NUM_POINTS: int = 2 ** 7  # initial number of points per randomization
+_MAX_BLOCK_SIZE: int = 2 ** 22  # max rows x points evaluated at once
+_ERROR_MULTIPLIER: float = 3.0  # error estimate, in standard errors
+_EPS: float = 10 ** -15
+
+
+def _genz_integrand(b: np.ndarray, chol: np.ndarray, u: np.ndarray
+                    ) -> np.ndarray:
+    """The separation of variables integrand of Genz (1992), whose expectation
+    over u ~ U(0, 1)^(d-1) is the probability that a N(0, chol @ chol.T)
+    random vector is less than or equal to b.
+
+    Parameters
+    ----------
+    b: np.ndarray
+        The upper integration limits, of shape (..., d).
+    chol: np.ndarray
+        The lower triangular cholesky factor of the covariance matrix.
+    u: np.ndarray
+        The uniform points, of shape broadcastable to (..., d - 1).
+
+    Returns
+    -------
+    integrand: np.ndarray
+        The integrand's value for each set of limits and points.
+    """
+    d: int = chol.shape[0]
+    e: np.ndarray = scipy.special.ndtr(b[..., 0] / chol[0, 0])
+    f: np.ndarray = e.copy()
+    y: np.ndarray = np.empty(b.shape[:-1] + (d - 1, ))
+    for i in range(1, d):
+        y[..., i - 1] = scipy.special.ndtri(np.clip(
+            u[..., i - 1] * e, _EPS, 1 - _EPS))
+        e = scipy.special.ndtr(
+            (b[..., i] - y[..., :i] @ chol[i, :i]) / chol[i, i])
+        f *= e
+    return f
+
+
+def normal_mixture_cdf(x: np.ndarray, loc: np.ndarray, shape: np.ndarray,
+                       gamma: np.ndarray, w_ppf: Union[Callable, None],
+                       abseps: float = 10 ** -4,
+                       max_num_points: int = 2 ** 16) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluates the cdf of a multivariate normal mean-variance mixture
+    distribution, X = loc + W * gamma + sqrt(W) * A @ Z, with A @ A.T = shape
+    and Z standard normal, using randomized quasi-monte-carlo.
+
+    Conditional on W, X is multivariate normal, so the cdf is the expectation
+    over W of a multivariate normal cdf. W is generated by inverting its cdf
+    and the normal cdf is written as an integral over the unit hypercube
+    using the separation of variables of Genz (1992), giving a d-dimensional
+    integrand which is averaged over scrambled Sobol points. Independent
+    scramblings give an unbiased estimate and its standard error, and the
+    number of points is doubled until the error of each row is below abseps.
+
+    Parameters
+    ----------
+    x: np.ndarray
+        The (n, d) array of values to evaluate the cdf at.
+    loc: np.ndarray
+        The location vector.
+    shape: np.ndarray
+        The shape matrix.
+    gamma: np.ndarray
+        The skewness vector.
+    w_ppf: Union[Callable, None]
+        The ppf of the mixing variable W, taking an array of probabilities.
+        None if W = 1, in which case X is multivariate normal.
+    abseps: float
+        The absolute error tolerance.
+        Default is 10 ** -4.
+    max_num_points: int
+        The maximum number of points to evaluate the integrand at, for each
+        row.
+        Default is 2 ** 16.
+
+    See Also
+    --------
+    Genz, A. (1992) Numerical computation of multivariate normal
+    probabilities. Journal of Computational and Graphical Statistics, 1.
+
+    Returns
+    -------
+    cdf_values, errors: Tuple[np.ndarray, np.ndarray]
+        The estimated cdf values and their absolute errors, given as
+        _ERROR_MULTIPLIER standard errors.
+    """
+    n, d = x.shape
+    chol: np.ndarray = np.linalg.cholesky(shape)
+    centered: np.ndarray = x - loc.flatten()
+    gamma = gamma.flatten()
+    num_dims: int = d - 1 + (w_ppf is not None)
+    if num_dims == 0:
+        # univariate normal
+        return scipy.special.ndtr(centered[:, 0] / chol[0, 0]), np.zeros(n)
+
+    engines: list = [scipy.stats.qmc.Sobol(num_dims, scramble=True)
+                     for _ in range(_NUM_RANDOMIZATIONS)]
+    sums: np.ndarray = np.zeros((n, _NUM_RANDOMIZATIONS))
+    cdf_values: np.ndarray = np.zeros(n)
+    errors: np.ndarray = np.full(n, np.inf)
+    active: np.ndarray = np.arange(n)
+    num_points: int = 0
+    batch_size: int = _MIN_NUM_POINTS
+    while active.size > 0 \
+            and num_points * _NUM_RANDOMIZATIONS < max_num_points:
+        # the next points of each randomization, doubling the total
+        u: np.ndarray = np.clip(np.stack([
+            engine.random(batch_size) for engine in engines]), _EPS, 1 - _EPS)
+        if w_ppf is None:
+            sqrt_w: np.ndarray = np.ones(u.shape[:2])
+            w: np.ndarray = sqrt_w
+        else:
+            w = w_ppf(u[..., 0].flatten()).reshape(u.shape[:2])
+            sqrt_w = np.sqrt(w)
+            u = u[..., 1:]
+
+        # evaluating the integrand for blocks of rows at once
+        block: int = max(1, _MAX_BLOCK_SIZE // (u.shape[0] * u.shape[1] * d))
+        for start in range(0, active.size, block):
+            rows: np.ndarray = active[start: start + block]
+            b: np.ndarray = (centered[rows, None, None, :]
+                             - w[..., None] * gamma) / sqrt_w[..., None]
+            sums[rows] += _genz_integrand(b, chol, u).sum(axis=2)
+        num_points += batch_size
+        batch_size = num_points
+
+        # checking which rows have converged
+        estimates: np.ndarray = sums[active] / num_points
+        cdf_values[active] = estimates.mean(axis=1)
+        errors[active] = _ERROR_MULTIPLIER * estimates.std(axis=1, ddof=1) \
+            / np.sqrt(_NUM_RANDOMIZATIONS)
+        active = active[errors[active] > abseps]
+    return np.clip(cdf_values, 0.0, 1.0), errors
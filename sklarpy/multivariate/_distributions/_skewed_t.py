@@ -2,7 +2,6 @@
 import numpy as np
 import scipy.special
 from typing import Tuple, Union
-from collections import deque
 from scipy.optimize import differential_evolution
 
 from sklarpy.multivariate._distributions._generalized_hyperbolic import \
@@ -104,6 +103,27 @@ class multivariate_skewed_t_gen(multivariate_gen_hyperbolic_gen):
                        - s * (np.log(q / dof) - np.log(np.sqrt(q * p)))
         return float(log_c + log_h)
 
+    def _batch_logpdf(self, x: np.ndarray, params: tuple, **kwargs
+                      ) -> np.ndarray:
+        # getting params
+        _, dof, _, loc, shape, gamma = params
+        d: int = shape.shape[-1]
+
+        # common calculations
+        mahalanobis, skew_terms, p, log_det = self._quad_forms(
+            x, loc, shape, gamma)
+        q: np.ndarray = dof + mahalanobis
+        s: float = 0.5*(dof + d)
+        m: np.ndarray = np.sqrt(q * p)
+
+        log_c: float = (1 - s) * np.log(2) - 0.5 * (
+                2 * scipy.special.loggamma(0.5 * dof)
+                + d * np.log(np.pi * dof) + log_det)
+        log_h: np.ndarray = kv.logkv(s, m) \
+                            + skew_terms \
+                            - s * (np.log(q / dof) - np.log(m))
+        return log_c + log_h
+
     def _logpdf_cdf(self, func_str: str, x: np.ndarray, params: tuple, **kwargs
                     ) -> np.ndarray:
         """Utility function able to implement logpdf and cdf methods without
@@ -147,6 +167,10 @@ class multivariate_skewed_t_gen(multivariate_gen_hyperbolic_gen):
         alpha_beta: float = params[1] / 2
         return ig.rvs((size, ), (alpha_beta, alpha_beta), ppf_approx=True)
 
+    def _w_ppf(self, q: np.ndarray, params: tuple) -> np.ndarray:
+        alpha_beta: float = params[1] / 2
+        return ig.ppf(q, (alpha_beta, alpha_beta))
+
     def _get_bounds(self, data: np.ndarray, as_tuple: bool = True, **kwargs
                     ) -> Union[dict, tuple]:
         bounds = super()._get_bounds(data, as_tuple, **kwargs)
@@ -164,34 +188,24 @@ class multivariate_skewed_t_gen(multivariate_gen_hyperbolic_gen):
     def _etas_deltas_zetas(self, data: np.ndarray, params: tuple, h: float
                            ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         _, dof, _, loc, shape, gamma = params
-        shape_inv: np.ndarray = np.linalg.inv(shape)
         d: int = loc.size
-        p: float = float(gamma.T @ shape_inv @ gamma)
+        n: int = data.shape[0]
+
+        # conditional GIG parameters for every observation at once
+        mahalanobis, _, p, _ = self._quad_forms(data, loc, shape, gamma)
+        q: np.ndarray = dof + mahalanobis
         s: float = 0.5 * (dof + d)
-        etas: deque = deque()
-        deltas: deque = deque()
-        zetas: deque = deque()
-
-        for xi in data:
-            xi = xi.reshape((d, 1))
-            qi: float = float(dof + ((xi - loc).T @ shape_inv @ (xi - loc)))
-
-            cond_params: tuple = (-s, qi, p)
-            eta_i: float = multivariate_gen_hyperbolic_gen._UNIVAR._exp_w(
-                cond_params)
-            delta_i: float = multivariate_gen_hyperbolic_gen._UNIVAR._exp_w(
-                (s, p, qi))
-            zeta_i: float = multivariate_gen_hyperbolic_gen._exp_log_w(
-                cond_params, h)
-
-            deltas.append(delta_i)
-            etas.append(eta_i)
-            zetas.append(zeta_i)
-
-        n: int = len(etas)
-        return (np.asarray(etas).reshape((n, 1)),
-                np.asarray(deltas).reshape((n, 1)),
-                np.asarray(zetas).reshape((n, 1)))
+
+        cond_params: tuple = (-s, q, p)
+        etas: np.ndarray = multivariate_gen_hyperbolic_gen._UNIVAR._exp_w(
+            cond_params)
+        deltas: np.ndarray = multivariate_gen_hyperbolic_gen._UNIVAR._exp_w(
+            (s, p, q))
+        zetas: np.ndarray = multivariate_gen_hyperbolic_gen._exp_log_w(
+            cond_params, h)
+        return (np.asarray(etas, dtype=float).reshape((n, 1)),
+                np.asarray(deltas, dtype=float).reshape((n, 1)),
+                np.asarray(zetas, dtype=float).reshape((n, 1)))
 
     def _add_randomness(self, params: tuple, bounds: tuple, d: int,
                         randomness_var: float, copula: bool) -> tuple:
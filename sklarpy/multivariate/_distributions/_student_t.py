@@ -2,6 +2,7 @@
 import numpy as np
 import pandas as pd
 import scipy.stats
+import scipy.special
 import scipy.integrate
 import scipy.optimize
 from typing import Tuple, Union
@@ -80,6 +81,18 @@ class multivariate_student_t_gen(PreFitContinuousMultivariate):
             size=size, loc=loc.flatten(), shape=params[2],
             df=params[0]).reshape((size, loc.size))
 
+    def _num_rvs_uniforms(self, params: tuple) -> int:
+        return self._get_dim(params) + 1
+
+    def _rvs_from_uniforms(self, u: np.ndarray, params: tuple) -> np.ndarray:
+        # normal mixture with W ~ InverseGamma(dof / 2, dof / 2)
+        dof: float = params[0]
+        w: np.ndarray = scipy.stats.invgamma.ppf(u[:, :1], a=dof / 2,
+                                                 scale=dof / 2)
+        z: np.ndarray = scipy.special.ndtri(u[:, 1:])
+        return params[1].flatten() \
+            + np.sqrt(w) * (z @ np.linalg.cholesky(params[2]).T)
+
     def _get_bounds(self, data: np.ndarray, as_tuple: bool, **kwargs
                     ) -> Union[dict, tuple]:
         default_bounds: dict = {'dof': (2.01, 100.0)}
@@ -179,6 +192,18 @@ class multivariate_student_t_gen(PreFitContinuousMultivariate):
             For the 'em' algorithm, if params0 specified by the user, function
             outcome ~ deterministic between runs and therefore having a
             min_retries and max_retries greater than 1 has little benefit.
+        workers: Union[int, Callable]
+            When fitting to data only.
+            The number of processes to evaluate each differential evolution
+            population over in parallel, -1 to use all available cores, or a
+            map-like callable such as multiprocessing.Pool.map.
+            Default value is 1.
+        vectorized: bool
+            When fitting to data only.
+            True to evaluate each differential evolution population in a
+            single call of the objective function. Ignored if workers is not
+            1.
+            Default value is False.
         kwargs:
             kwargs for CorrelationMatrix.cov
 
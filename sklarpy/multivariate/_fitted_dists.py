@@ -7,11 +7,13 @@ from sklarpy.utils._params import Params
 from sklarpy.utils._type_keeper import TypeKeeper
 from sklarpy.utils._copy import Copyable
 from sklarpy.utils._serialize import Savable
+from sklarpy.utils._sample_cache import SampleCacheable
+from sklarpy.utils._sampling import check_sampling
 
 __all__ = ['FittedContinuousMultivariate']
 
 
-class FittedContinuousMultivariate(Savable, Copyable):
+class FittedContinuousMultivariate(Savable, Copyable, SampleCacheable):
     """A fitted continuous multivariate model."""
     def __init__(self, obj, fit_info: dict):
         """
@@ -106,13 +108,20 @@ class FittedContinuousMultivariate(Savable, Copyable):
 
     def mc_cdf(self, x: Union[pd.DataFrame, np.ndarray],
                match_datatype: bool = True, num_generate: int = 10 ** 4,
-               show_progress: bool = False, **kwargs
-               ) -> Union[pd.DataFrame, np.ndarray]:
+               show_progress: bool = False, seed: int = None,
+               atol: float = None, rtol: float = None,
+               max_num_generate: int = 10 ** 7, return_stderr: bool = False,
+               sampling: str = 'random', **kwargs
+               ) -> Union[pd.DataFrame, np.ndarray, tuple]:
         """The monte-carlo numerical approximation of the multivariate cdf
         function. The standard cdf function may take time to evaluate for
         certain distributions, due to d-dimensional numerical integration. In
         these cases, mc_cdf will likely evaluate faster.
 
+        If atol or rtol is given, batches of num_generate random variables are
+        drawn until the standard error of every value is within tolerance,
+        or max_num_generate random variables have been drawn.
+
         Parameters
         ----------
         x: Union[pd.DataFrame, np.ndarray]
@@ -123,23 +132,58 @@ class FittedContinuousMultivariate(Savable, Copyable):
             Default is True.
         num_generate: int
             The number of random numbers to generate to use when numerically
-            approximating the multivariate cdf using monte-carlo.
+            approximating the multivariate cdf using monte-carlo. If atol or
+            rtol is given, the number generated in each batch.
         show_progress: bool
             True to display the progress of the mc-cdf calculations.
             Default is False.
+        seed: int
+            The seed of the random sample used. None to use numpy's global
+            random state. If the sample cache is enabled, samples with the
+            same seed are reused and extended by later calls.
+            Default is None.
+        atol: float
+            The target absolute standard error of each value. None for no
+            absolute target.
+            Default is None.
+        rtol: float
+            The target standard error of each value, relative to the value.
+            Useful for small probabilities. None for no relative target.
+            Default is None.
+        max_num_generate: int
+            The maximum number of random numbers to generate for each value,
+            if atol or rtol is given.
+            Default is 10 ** 7.
+        return_stderr: bool
+            True to also return the standard error of each value.
+            Default is False.
+        sampling: str
+            The sampling method used to generate the random variables. See
+            rvs for the options.
+            Default is 'random'.
 
         Returns
         -------
-        mc_cdf: Union[pd.DataFrame, np.ndarray]
+        mc_cdf: Union[pd.DataFrame, np.ndarray, tuple]
             numerical cdf values transformed into the user's original datatype,
-            if desired.
+            if desired. If return_stderr is True, a tuple of these and their
+            standard errors.
         """
+        check_sampling(sampling)
+        kwargs.setdefault('mc_sampler', self._mc_batches(
+            lambda size: self.__mc_sampler(size, sampling), seed, sampling))
         return self.__obj.mc_cdf(
             x, params=self.params, match_datatype=match_datatype,
-            num_generate=num_generate, show_progress=show_progress, **kwargs)
+            num_generate=num_generate, show_progress=show_progress,
+            atol=atol, rtol=rtol, max_num_generate=max_num_generate,
+            return_stderr=return_stderr, sampling=sampling, **kwargs)
 
-    def rvs(self, size: tuple, match_datatype: bool = True
-            ) -> Union[pd.DataFrame, np.ndarray]:
+    def __mc_sampler(self, size: int, sampling: str = 'random'
+                     ) -> np.ndarray:
+        return self.__obj.rvs(size, self.params, sampling)
+
+    def rvs(self, size: tuple, match_datatype: bool = True,
+            sampling: str = 'random') -> Union[pd.DataFrame, np.ndarray]:
         """The random variable generator function.
 
         Parameters
@@ -151,6 +195,13 @@ class FittedContinuousMultivariate(Savable, Copyable):
             Optional. True to return the generated random variables in the same
             format as the fitted dataset (if the model was fitted to data).
             Default is True.
+        sampling: str
+            The sampling method. 'random' for pseudo-random sampling, or
+            'sobol', 'antithetic' or 'lhs' to generate the random variables
+            from a scrambled Sobol sequence, antithetic pairs or a Latin
+            hypercube of uniform random numbers respectively, for variance
+            reduction.
+            Default is 'random'.
 
         Returns
         -------
@@ -158,7 +209,7 @@ class FittedContinuousMultivariate(Savable, Copyable):
             Multivariate array of random variables, sampled from the
             multivariate distribution.
         """
-        rvs_array: np.ndarray = self.__obj.rvs(size, self.params)
+        rvs_array: np.ndarray = self.__obj.rvs(size, self.params, sampling)
         type_keeper: TypeKeeper = self.__fit_info['type_keeper']
         return type_keeper.type_keep_from_2d_array(rvs_array, match_datatype)
 
@@ -313,7 +364,7 @@ class FittedContinuousMultivariate(Savable, Copyable):
                      var2_range: np.ndarray, color: str, alpha: float,
                      figsize: tuple, grid: bool, axes_names: Iterable,
                      zlim: tuple, num_points: int, show_progress, show: bool,
-                     mc_num_generate: int = None) -> None:
+                     mc_num_generate: int = None, seed: int = None) -> None:
         """Utility function able to implement pdf_plot, cdf_plot and
         mc_cdf_plot methods without duplicate code.
 
@@ -377,6 +428,11 @@ class FittedContinuousMultivariate(Savable, Copyable):
             The number of multivariate random variables to generate when
             evaluating monte-carlo functions.
             Default is 10,000.
+        seed: int
+            For mc_cdf_plot only.
+            The seed of the random sample used. None to use numpy's global
+            random state.
+            Default is None.
         """
         # argument checks
         if axes_names is None:
@@ -403,13 +459,18 @@ class FittedContinuousMultivariate(Savable, Copyable):
                 fitted_bounds[1][0], fitted_bounds[1][1],
                 num_points, dtype=float)
 
+        # monte-carlo sample, reused across the plot's grid
+        mc_rvs: np.ndarray = self._mc_sample(
+            self.__mc_sampler, mc_num_generate, seed) \
+            if 'mc' in func_name else None
+
         # plotting
         self.__obj._threeD_plot(
             func_name, var1_range=var1_range, var2_range=var2_range,
             params=self.params, color=color, alpha=alpha, figsize=figsize,
             grid=grid, axes_names=axes_names, zlim=zlim, num_generate=0,
             num_points=num_points, show_progress=show_progress, show=show,
-            mc_num_generate=mc_num_generate)
+            mc_num_generate=mc_num_generate, mc_rvs=mc_rvs)
 
     def pdf_plot(self, var1_range: np.ndarray = None,
                  var2_range: np.ndarray = None, color: str = 'royalblue',
@@ -560,7 +621,7 @@ class FittedContinuousMultivariate(Savable, Copyable):
                     grid: bool = True, axes_names: tuple = None,
                     zlim: tuple = (None, None), num_points: int = 100,
                     show_progress: bool = True, show: bool = True,
-                    **kwargs) -> None:
+                    seed: int = None, **kwargs) -> None:
         """Produces a 3D plot of the multivariate distribution's cdf /
         cumulative density function, using monte-carlo numerical approximation.
 
@@ -624,13 +685,18 @@ class FittedContinuousMultivariate(Savable, Copyable):
         show: bool
             True to display the plot when the method is called.
             Default is True.
+        seed: int
+            The seed of the random sample used. None to use numpy's global
+            random state. If the sample cache is enabled, samples with the
+            same seed are reused and extended by later calls.
+            Default is None.
         """
         self._threeD_plot(
             'mc_cdf', var1_range=var1_range, var2_range=var2_range,
             color=color, alpha=alpha, figsize=figsize, grid=grid,
             axes_names=axes_names, zlim=zlim, num_points=num_points,
             show_progress=show_progress, show=show,
-            mc_num_generate=mc_num_generate)
+            mc_num_generate=mc_num_generate, seed=seed)
 
     @property
     def params(self) -> Params:
@@ -0,0 +1,242 @@
+# Contains code for counting the number of points in the lower orthant of
+# each of a set of query points, as required by monte-carlo cdf estimators
+import numpy as np
+
+from sklarpy.utils._iterator import get_iterator
+
+__all__ = ['orthant_counts']
+
+_MAX_BLOCK_SIZE: int = 2 ** 24  # max number of elements compared at once
+_LEAF_SIZE: int = 64  # approx number of points in each k-d tree leaf
+_QUERY_CHUNK_SIZE: int = 256  # number of queries walking the k-d tree at once
+
+
+def _blockwise_counts(points: np.ndarray, queries: np.ndarray,
+                      show_progress: bool) -> np.ndarray:
+    """Counts the points dominated by each query by direct comparison, for
+    blocks of queries at a time so memory use is bounded.
+
+    Parameters
+    ----------
+    points: np.ndarray
+        The (n, d) array of points.
+    queries: np.ndarray
+        The (m, d) array of query points.
+    show_progress: bool
+        True to display the progress of the calculations.
+
+    Returns
+    -------
+    counts: np.ndarray
+        The number of points less than or equal to each query in every
+        dimension.
+    """
+    block: int = max(1, _MAX_BLOCK_SIZE // max(points.size, 1))
+    starts: range = range(0, queries.shape[0], block)
+    counts: np.ndarray = np.empty(queries.shape[0], dtype=np.int64)
+    for start in get_iterator(starts, show_progress,
+                              "calculating monte-carlo cdf values"):
+        chunk: np.ndarray = queries[start: start + block]
+        dominated: np.ndarray = points[None, :, 0] <= chunk[:, 0, None]
+        for j in range(1, points.shape[1]):
+            dominated &= points[None, :, j] <= chunk[:, j, None]
+        counts[start: start + block] = dominated.sum(axis=1)
+    return counts
+
+
+def _fenwick_counts(points: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """Counts the points dominated by each query in 2 dimensions.
+
+    The points are sorted by their first coordinate, so the points whose
+    first coordinate is at most a query's form a prefix of length k. A
+    static Fenwick (binary indexed) tree of this order splits any prefix into
+    at most log2(n) aligned blocks, one per set bit of k. Processing one
+    level of the tree at a time, the blocks are sorted by the rank of the
+    second coordinate, so the number of points in a block below a query is
+    found by binary search, for all queries at once.
+
+    Parameters
+    ----------
+    points: np.ndarray
+        The (n, 2) array of points.
+    queries: np.ndarray
+        The (m, 2) array of query points.
+
+    Returns
+    -------
+    counts: np.ndarray
+        The number of points less than or equal to each query in both
+        dimensions.
+    """
+    n: int = points.shape[0]
+    order: np.ndarray = np.argsort(points[:, 0], kind='stable')
+    prefix_lengths: np.ndarray = np.searchsorted(
+        points[order, 0], queries[:, 0], side='right')
+
+    # ranks of the second coordinate, so ties are resolved exactly
+    y_order: np.ndarray = np.argsort(points[:, 1], kind='stable')
+    y_ranks: np.ndarray = np.empty(n, dtype=np.int64)
+    y_ranks[y_order] = np.arange(n)
+    y_ranks = y_ranks[order]
+    query_ranks: np.ndarray = np.searchsorted(
+        points[y_order, 1], queries[:, 1], side='right')
+
+    counts: np.ndarray = np.zeros(queries.shape[0], dtype=np.int64)
+    positions: np.ndarray = np.arange(n, dtype=np.int64)
+    for level in range(int(n).bit_length()):
+        has_block: np.ndarray = (prefix_lengths >> level) & 1 == 1
+        if not has_block.any():
+            continue
+        # the block of this level in each prefix starts where the prefix's
+        # higher bits end
+        block_ids: np.ndarray = prefix_lengths[has_block] >> (level + 1) << 1
+        keys: np.ndarray = np.sort((positions >> level) * n + y_ranks)
+        counts[has_block] += np.searchsorted(
+            keys, block_ids * n + query_ranks[has_block], side='left') \
+            - (block_ids << level)
+    return counts
+
+
+class _KDTree:
+    """A static, implicitly stored k-d tree of points, supporting batched
+    orthant counting queries.
+
+    Level t of the tree has 2^t nodes, node k spanning the points with
+    indices in [k * n // 2^t, (k + 1) * n // 2^t) of the tree's ordering.
+    Each node stores the bounding box of its points.
+    """
+
+    def __init__(self, points: np.ndarray):
+        n, d = points.shape
+        self._n: int = n
+        self._depth: int = max(0, int(np.ceil(np.log2(max(n / _LEAF_SIZE,
+                                                          1)))))
+
+        # splitting each node at the median of cycling dimensions, sorting
+        # by node and then by the rank of the point in that dimension
+        ranks: np.ndarray = np.empty((d, n), dtype=np.int64)
+        for j in range(min(d, self._depth)):
+            ranks[j, np.argsort(points[:, j])] = np.arange(n)
+        order: np.ndarray = np.arange(n)
+        positions: np.ndarray = np.arange(n)
+        for level in range(self._depth):
+            node_ids: np.ndarray = np.searchsorted(
+                self._starts(level), positions, side='right') - 1
+            order = order[np.argsort(node_ids * n + ranks[level % d, order])]
+        self._points: np.ndarray = points[order]
+
+        # bounding boxes, from the leaves up
+        self._mins: list = [None] * (self._depth + 1)
+        self._maxs: list = [None] * (self._depth + 1)
+        starts: np.ndarray = self._starts(self._depth)
+        self._mins[-1] = np.minimum.reduceat(self._points, starts[:-1])
+        self._maxs[-1] = np.maximum.reduceat(self._points, starts[:-1])
+        for level in range(self._depth - 1, -1, -1):
+            self._mins[level] = np.minimum(self._mins[level + 1][0::2],
+                                           self._mins[level + 1][1::2])
+            self._maxs[level] = np.maximum(self._maxs[level + 1][0::2],
+                                           self._maxs[level + 1][1::2])
+
+        # leaves padded with nans, which are never dominated
+        sizes: np.ndarray = np.diff(starts)
+        self._leaves: np.ndarray = np.full((d, sizes.size, sizes.max()),
+                                           np.nan)
+        leaf_ids: np.ndarray = np.repeat(np.arange(sizes.size), sizes)
+        self._leaves[:, leaf_ids, np.arange(n) - starts[leaf_ids]] = \
+            self._points.T
+
+    def _starts(self, level: int) -> np.ndarray:
+        return (np.arange(2 ** level + 1, dtype=np.int64) * self._n) \
+            >> level
+
+    def _node_sizes(self, level: int, nodes: np.ndarray) -> np.ndarray:
+        return ((nodes + 1) * self._n >> level) - (nodes * self._n >> level)
+
+    def counts(self, queries: np.ndarray) -> np.ndarray:
+        """Returns the number of points dominated by each query."""
+        counts: np.ndarray = np.zeros(queries.shape[0], dtype=np.int64)
+        query_ids: np.ndarray = np.arange(queries.shape[0])
+        nodes: np.ndarray = np.zeros(queries.shape[0], dtype=np.int64)
+        for level in range(self._depth + 1):
+            q: np.ndarray = queries[query_ids]
+            inside: np.ndarray = np.all(self._maxs[level][nodes] <= q, axis=1)
+            overlaps: np.ndarray = ~inside & np.all(
+                self._mins[level][nodes] <= q, axis=1)
+            np.add.at(counts, query_ids[inside],
+                      self._node_sizes(level, nodes[inside]))
+            query_ids, nodes = query_ids[overlaps], nodes[overlaps]
+            if level < self._depth:
+                # descending into both children
+                query_ids = np.repeat(query_ids, 2)
+                nodes = (np.repeat(nodes, 2) << 1) + np.tile(
+                    [0, 1], nodes.size)
+
+        # comparing against the points of partially covered leaves
+        d, _, leaf_size = self._leaves.shape
+        block: int = max(1, _MAX_BLOCK_SIZE // (d * leaf_size))
+        for start in range(0, query_ids.size, block):
+            ids: np.ndarray = query_ids[start: start + block]
+            leaves: np.ndarray = nodes[start: start + block]
+            dominated: np.ndarray = self._leaves[0, leaves] \
+                <= queries[ids, 0, None]
+            for j in range(1, d):
+                dominated &= self._leaves[j, leaves] <= queries[ids, j, None]
+            np.add.at(counts, ids, dominated.sum(axis=1))
+        return counts
+
+
+def orthant_counts(points: np.ndarray, queries: np.ndarray,
+                   show_progress: bool = False) -> np.ndarray:
+    """Counts, for each query point q, the number of points p with p <= q in
+    every dimension.
+
+    A sorted search is used in 1 dimension, a static Fenwick tree of sorted
+    blocks in 2 dimensions and a k-d tree in higher dimensions, with direct
+    blockwise comparisons when there are few points or queries. All give
+    exactly the same counts as np.all(points <= q, axis=1).sum().
+
+    Parameters
+    ----------
+    points: np.ndarray
+        The (n, d) array of points. Rows containing nans are never counted.
+    queries: np.ndarray
+        The (m, d) array of query points.
+    show_progress: bool
+        True to display the progress of the calculations.
+        Default is False.
+
+    Returns
+    -------
+    counts: np.ndarray
+        The number of points less than or equal to each query in every
+        dimension.
+    """
+    points = points[~np.isnan(points).any(axis=1)]
+    queries = np.asarray(queries, dtype=float)
+    n, d = points.shape
+    m: int = queries.shape[0]
+    if n == 0 or m == 0:
+        return np.zeros(m, dtype=np.int64)
+
+    if (m * n <= _MAX_BLOCK_SIZE // 16) or (min(n, m) <= _LEAF_SIZE):
+        return _blockwise_counts(points, queries, show_progress)
+
+    # nans in queries dominate no points
+    counts: np.ndarray = np.zeros(m, dtype=np.int64)
+    valid: np.ndarray = ~np.isnan(queries).any(axis=1)
+    if d == 1:
+        counts[valid] = np.searchsorted(np.sort(points[:, 0]),
+                                        queries[valid, 0], side='right')
+        return counts
+    if d == 2:
+        counts[valid] = _fenwick_counts(points, queries[valid])
+        return counts
+
+    tree: _KDTree = _KDTree(points)
+    valid_ids: np.ndarray = np.flatnonzero(valid)
+    starts: range = range(0, valid_ids.size, _QUERY_CHUNK_SIZE)
+    for start in get_iterator(starts, show_progress,
+                              "calculating monte-carlo cdf values"):
+        ids: np.ndarray = valid_ids[start: start + _QUERY_CHUNK_SIZE]
+        counts[ids] = tree.counts(queries[ids])
+    return counts
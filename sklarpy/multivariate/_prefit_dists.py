@@ -1,6 +1,7 @@
 # Contains code for pre-fitted multivariate models
 from typing import Union, Callable, Tuple, Iterable
 import numpy as np
+import warnings
 import pandas as pd
 from abc import abstractmethod
 from collections import deque
@@ -12,10 +13,12 @@ from sklarpy.utils._iterator import get_iterator
 from sklarpy.utils._not_implemented import NotImplementedBase
 from sklarpy.utils._params import Params
 from sklarpy.utils._input_handlers import check_multivariate_data
+from sklarpy.utils._sampling import check_sampling, uniform_rvs
 from sklarpy.utils._errors import FitError
 from sklarpy.plotting._pair_plot import pair_plot
 from sklarpy.plotting._threeD_plot import threeD_plot
 from sklarpy.multivariate._fitted_dists import FittedContinuousMultivariate
+from sklarpy.multivariate._orthant_counts import orthant_counts
 from sklarpy.misc import CorrelationMatrix
 
 __all__ = ['PreFitContinuousMultivariate']
@@ -334,6 +337,43 @@ class PreFitContinuousMultivariate(NotImplementedBase):
         """
         self._not_implemented('rvs')
 
+    def _num_rvs_uniforms(self, params: tuple) -> int:
+        """The number of uniform random numbers transformed into each
+        multivariate random variable by _rvs_from_uniforms.
+
+        Parameters
+        ----------
+        params : tuple
+            The parameters which define the multivariate model, in tuple form.
+
+        Returns
+        -------
+        num_uniforms: int
+            The number of uniform random numbers required.
+        """
+        return self._get_dim(params)
+
+    def _rvs_from_uniforms(self, u: np.ndarray, params: tuple) -> np.ndarray:
+        """Transforms uniform random numbers into random variables of the
+        multivariate distribution, allowing variance reduced sampling.
+
+        To be overwritten by child classes.
+
+        Parameters
+        ----------
+        u: np.ndarray
+            A (size, num_uniforms) array of uniform random numbers.
+        params : tuple
+            The parameters which define the multivariate model, in tuple form.
+
+        Returns
+        -------
+        rvs_array: np.ndarray
+            Multivariate array of random variables, sampled from the
+            multivariate distribution.
+        """
+        self._not_implemented('variance reduced sampling')
+
     def _logpdf_pdf_cdf(self, func_str: str,
                         x: Union[pd.DataFrame, np.ndarray],
                         params: Union[Params, tuple],
@@ -496,12 +536,26 @@ class PreFitContinuousMultivariate(NotImplementedBase):
     def mc_cdf(self, x: Union[pd.DataFrame, np.ndarray],
                params: Union[Params, tuple], match_datatype: bool = True,
                num_generate: int = 10 ** 4, show_progress: bool = False,
-               **kwargs) -> Union[pd.DataFrame, np.ndarray]:
+               atol: float = None, rtol: float = None,
+               max_num_generate: int = 10 ** 7, return_stderr: bool = False,
+               sampling: str = 'random', **kwargs
+               ) -> Union[pd.DataFrame, np.ndarray, tuple]:
         """The monte-carlo numerical approximation of the multivariate cdf
         function. The standard cdf function may take time to evaluate for
         certain distributions, due to d-dimensional numerical integration. In
         these cases, mc_cdf will likely evaluate faster.
 
+        If atol or rtol is given, batches of num_generate random variables are
+        drawn until the standard error of every value is within tolerance,
+        or max_num_generate random variables have been drawn. Each batch is
+        shared by all values still above tolerance and values stop being
+        updated once they are within it, so values in the tails of the
+        distribution receive more samples than those in its body.
+
+        Standard errors are binomial, sqrt(p * (1 - p) / n), with
+        p = (k + 1) / (n + 2) for k of the n random variables less than or
+        equal to the value, so values with no hits are not treated as exact.
+
         Parameters
         ----------
         x: Union[pd.DataFrame, np.ndarray]
@@ -516,16 +570,45 @@ class PreFitContinuousMultivariate(NotImplementedBase):
             Default is True.
         num_generate: int
             The number of random numbers to generate to use when numerically
-            approximating the multivariate cdf using monte-carlo.
+            approximating the multivariate cdf using monte-carlo. If atol or
+            rtol is given, the number generated in each batch.
         show_progress: bool
             True to display the progress of the mc-cdf calculations.
             Default is False.
+        atol: float
+            The target absolute standard error of each value. None for no
+            absolute target.
+            Default is None.
+        rtol: float
+            The target standard error of each value, relative to the value.
+            Useful for small probabilities. None for no relative target.
+            Default is None.
+        max_num_generate: int
+            The maximum number of random numbers to generate for each value,
+            if atol or rtol is given.
+            Default is 10 ** 7.
+        return_stderr: bool
+            True to also return the standard error of each value.
+            Default is False.
+        sampling: str
+            The sampling method used to generate random variables. See rvs
+            for the options. Standard errors assume independent random
+            variables, so do not reflect any variance reduction.
+            Default is 'random'.
+        kwargs:
+            rvs: np.ndarray
+                The random variables to use, in place of generating the first
+                num_generate.
+            mc_sampler: Callable
+                A function taking a number of random variables and returning
+                that many new ones, in place of rvs.
 
         Returns
         -------
-        mc_cdf: Union[pd.DataFrame, np.ndarray]
+        mc_cdf: Union[pd.DataFrame, np.ndarray, tuple]
             numerical cdf values transformed into the user's original datatype,
-            if desired.
+            if desired. If return_stderr is True, a tuple of these and their
+            standard errors.
         """
         # checking arguments
         x_array: np.ndarray = self._get_x_array(x)
@@ -533,38 +616,72 @@ class PreFitContinuousMultivariate(NotImplementedBase):
         self._check_dim(data=x_array, params=params_tuple)
         if not isinstance(num_generate, int) or (num_generate <= 0):
             raise TypeError("num_generate must be a positive integer")
-
-        shape: tuple = x_array.shape
+        check_sampling(sampling)
+        adaptive: bool = (atol is not None) or (rtol is not None)
+        for tol in (atol, rtol):
+            if (tol is not None) and not (isinstance(tol, (int, float))
+                                          and tol > 0):
+                raise TypeError("atol and rtol must be None or positive "
+                                "scalars.")
+        if adaptive and ((not isinstance(max_num_generate, int))
+                         or (max_num_generate < num_generate)):
+            raise TypeError("max_num_generate must be an integer no smaller "
+                            "than num_generate.")
 
         # only calculating for non-nan rows
         output: np.ndarray = np.full((x_array.shape[0], ), np.nan)
+        stderrs: np.ndarray = output.copy()
         mask: np.ndarray = np.isnan(x_array).any(axis=1)
-        if mask.sum() == shape[0]:
-            # all provided data is nans
-            return output
+        active: np.ndarray = np.flatnonzero(~mask)
+        counts: np.ndarray = np.zeros(x_array.shape[0], dtype=np.int64)
+        num_rvs: np.ndarray = np.zeros(x_array.shape[0], dtype=np.int64)
 
-        # whether to show progress
-        iterator = get_iterator(x_array[~mask], show_progress,
-                                "calculating monte-carlo cdf values")
-
-        # generating rvs
+        # generating rvs in batches
         rvs = kwargs.get("rvs", None)
-        rvs_array: np.ndarray = self.rvs(num_generate, params) if rvs is None \
-            else check_multivariate_data(rvs, num_variables=x_array.shape[1])
-
-        # calculating cdf values via mc
-        mc_cdf_values: deque = deque()
-        for row in iterator:
-            mc_cdf_val: float = np.all(rvs_array <= row, axis=1).sum() / \
-                                num_generate
-            mc_cdf_values.append(mc_cdf_val)
-        mc_cdf_values: np.ndarray = np.asarray(mc_cdf_values)
-
-        output[~mask] = mc_cdf_values
-        return TypeKeeper(x).type_keep_from_1d_array(
+        sampler: Callable = kwargs.get(
+            "mc_sampler", lambda size: self.rvs(size, params, sampling))
+        while active.size > 0:
+            rvs_array: np.ndarray = sampler(num_generate) if rvs is None \
+                else check_multivariate_data(rvs,
+                                             num_variables=x_array.shape[1])
+            rvs = None
+
+            # calculating cdf values via mc, counting the rvs dominated by
+            # each row for all rows at once
+            counts[active] += orthant_counts(rvs_array, x_array[active],
+                                             show_progress=show_progress)
+            num_rvs[active] += rvs_array.shape[0]
+            p: np.ndarray = (counts[active] + 1) / (num_rvs[active] + 2)
+            stderrs[active] = np.sqrt(p * (1 - p) / num_rvs[active])
+            if not adaptive:
+                break
+
+            # stopping early for rows within tolerance
+            converged: np.ndarray = np.zeros(active.size, dtype=bool)
+            if atol is not None:
+                converged |= stderrs[active] <= atol
+            if rtol is not None:
+                converged |= stderrs[active] <= rtol * p
+            active = active[~converged]
+            if (active.size > 0) and \
+                    (num_rvs[active[0]] + num_generate > max_num_generate):
+                warnings.warn(f"{active.size} mc cdf values did not reach "
+                              f"their target standard error within "
+                              f"max_num_generate={max_num_generate} random "
+                              f"variables.")
+                break
+
+        output[~mask] = counts[~mask] / num_rvs[~mask]
+        type_keeper: TypeKeeper = TypeKeeper(x)
+        mc_cdf_values = type_keeper.type_keep_from_1d_array(
             output, match_datatype, col_name=['mc cdf'])
+        if return_stderr:
+            return mc_cdf_values, type_keeper.type_keep_from_1d_array(
+                stderrs, match_datatype, col_name=['mc cdf stderr'])
+        return mc_cdf_values
 
-    def rvs(self, size: int, params: Union[Params, tuple]) -> np.ndarray:
+    def rvs(self, size: int, params: Union[Params, tuple],
+            sampling: str = 'random') -> np.ndarray:
         """The random variable generator function.
 
         Parameters
@@ -576,6 +693,15 @@ class PreFitContinuousMultivariate(NotImplementedBase):
             The parameters which define the multivariate model. These can be a
             Params object of the specific multivariate distribution or a tuple
             containing these parameters in the correct order.
+        sampling: str
+            The sampling method. 'random' for pseudo-random sampling.
+            Otherwise, random variables are generated by transforming uniform
+            random numbers, through the normal mixture representation for
+            normal mixture models and the frailty representation for
+            archimedean models, which are generated using 'sobol' for a
+            scrambled Sobol sequence, 'antithetic' for antithetic pairs
+            u and 1 - u, or 'lhs' for a Latin hypercube.
+            Default is 'random'.
 
         Returns
         -------
@@ -589,10 +715,15 @@ class PreFitContinuousMultivariate(NotImplementedBase):
         elif size <= 0:
             raise ValueError("size must be a positive integer")
 
+        check_sampling(sampling)
         params_tuple: tuple = self._get_params(params)
 
         # returning rvs
-        return self._rvs(size, params_tuple)
+        if sampling == 'random':
+            return self._rvs(size, params_tuple)
+        u: np.ndarray = uniform_rvs(
+            size, self._num_rvs_uniforms(params_tuple), sampling)
+        return self._rvs_from_uniforms(u, params_tuple)
 
     def likelihood(self, data: Union[pd.DataFrame, np.ndarray],
                    params: Union[Params, tuple]) -> float:
@@ -637,13 +768,56 @@ class PreFitContinuousMultivariate(NotImplementedBase):
         loglikelihood: float
             log-likelihood function value.
         """
+        # checking arguments, excluding rows containing nan values
+        data_array: np.ndarray = self._get_x_array(data)
+        params_tuple: tuple = self._get_params(params, **kwargs)
+        self._check_dim(data=data_array, params=params_tuple)
+        data_array = data_array[~np.isnan(data_array).any(axis=1)]
+        if data_array.shape[0] == 0:
+            # all provided data is nans
+            return np.nan
+
         try:
-            logpdf_values: np.ndarray = self.logpdf(data, params, False,
-                                                    **kwargs)
+            return self._loglikelihood(data_array, params_tuple, **kwargs)
         except NotImplementedError:
             # raising a function specific exception
             self._not_implemented('log-likelihood')
 
+    def _loglikelihood(self, data: np.ndarray, params: tuple, **kwargs
+                       ) -> float:
+        """The log-likelihood function, without any checks on the data or
+        parameters. Called by loglikelihood once its inputs are checked, and
+        used directly when repeatedly evaluating the log-likelihood of the
+        same, already checked, data during optimization.
+
+        Callers must pass a parameter tuple which has already been validated,
+        or which is valid by construction, as it is only converted into the
+        model's tuple form, without calling _check_params.
+
+        Parameters
+        ----------
+        data: np.ndarray
+            A 2-dimensional array of multivariate data, of the same dimension
+            as the parameters and containing no nan values.
+        params: tuple
+            The validated parameters which define the multivariate model, in
+            tuple form.
+        kwargs:
+            Model specific kwargs to pass to the log-pdf function.
+
+        Returns
+        -------
+        loglikelihood: float
+            log-likelihood function value.
+        """
+        params_tuple: tuple = self._get_params(params, check_params=False)
+        try:
+            logpdf_values: np.ndarray = self._logpdf(data, params_tuple,
+                                                     **kwargs)
+        except NotImplementedError:
+            logpdf_values: np.ndarray = np.log(
+                self._pdf(data, params_tuple, **kwargs))
+
         mask: np.ndarray = np.isnan(logpdf_values)
         if np.any(np.isinf(logpdf_values)):
             # returning -np.inf instead of nan
@@ -653,6 +827,33 @@ class PreFitContinuousMultivariate(NotImplementedBase):
             return np.nan
         return float(np.sum(logpdf_values[~mask]))
 
+    def _batch_loglikelihood(self, data: np.ndarray, params: list, **kwargs
+                             ) -> np.ndarray:
+        """The log-likelihood function evaluated for multiple sets of
+        parameters, without any checks on the data or parameters. Used when
+        evaluating a whole population of parameters during optimization.
+
+        To be overwritten by child classes able to evaluate the log-pdf for
+        all sets of parameters at once.
+
+        Parameters
+        ----------
+        data: np.ndarray
+            A 2-dimensional array of multivariate data, containing no nan
+            values.
+        params: list
+            A list of parameter tuples, each defining a multivariate model.
+        kwargs:
+            Model specific kwargs to pass to the log-pdf function.
+
+        Returns
+        -------
+        loglikelihoods: np.ndarray
+            The log-likelihood function value of each set of parameters.
+        """
+        return np.array([self._loglikelihood(data, params_tuple, **kwargs)
+                         for params_tuple in params], dtype=float)
+
     def aic(self, data: Union[pd.DataFrame, np.ndarray],
             params: Union[Params, tuple], **kwargs) -> float:
         """The Akaike Information Criterion (AIC) function.
@@ -781,7 +982,8 @@ class PreFitContinuousMultivariate(NotImplementedBase):
                      color: str, alpha: float, figsize: tuple, grid: bool,
                      axes_names: Iterable, zlim: tuple, num_generate: int,
                      num_points: int, show_progress: bool, show: bool,
-                     mc_num_generate: int = None) -> None:
+                     mc_num_generate: int = None, mc_rvs: np.ndarray = None
+                     ) -> None:
         """Utility function able to implement pdf_plot, cdf_plot and
         mc_cdf_plot methods without duplicate code.
 
@@ -850,6 +1052,12 @@ class PreFitContinuousMultivariate(NotImplementedBase):
             The number of multivariate random variables to generate when
             evaluating monte-carlo functions.
             Default is 10,000.
+        mc_rvs: np.ndarray
+            For mc_cdf_plot only.
+            The multivariate random variables to use when evaluating
+            monte-carlo functions. If None, mc_num_generate random variables
+            are generated.
+            Default is None.
         """
         # checking arguments
         if (var1_range is not None) and (var2_range is not None):
@@ -881,7 +1089,8 @@ class PreFitContinuousMultivariate(NotImplementedBase):
 
         # func kwargs
         if 'mc' in func_str:
-            rvs = self.rvs(mc_num_generate, params)
+            rvs = self.rvs(mc_num_generate, params) if mc_rvs is None \
+                else mc_rvs
         else:
             rvs = None
         func_kwargs: dict = {'params': params, 'match_datatype': False,
@@ -1373,6 +1582,9 @@ class PreFitContinuousMultivariate(NotImplementedBase):
         ----------
         theta: np.ndarray
             An array of scalar values representing the distribution parameters.
+            May also be a (num_scalar_params, S) array, with each column
+            representing a set of distribution parameters, in which case all S
+            sets are evaluated together.
         data: np.ndarray
             An array of multivariate data to optimize parameters over.
         kwargs: dict
@@ -1380,17 +1592,26 @@ class PreFitContinuousMultivariate(NotImplementedBase):
 
         Returns
         -------
-        neg_loglikelihood: float
+        neg_loglikelihood: Union[float, np.ndarray]
             The negative log-likelihood value associated with the theta array.
+            An array of S values when theta is 2-dimensional.
         """
+        if theta.ndim == 2:
+            params: list = [self._theta_to_params(theta=theta_i, **kwargs)
+                            for theta_i in theta.T]
+            loglikelihoods: np.ndarray = self._batch_loglikelihood(
+                data=data, params=params)
+            return np.where(np.isnan(loglikelihoods), np.inf,
+                            -loglikelihoods)
+
         params: tuple = self._theta_to_params(theta=theta, **kwargs)
-        loglikelihood: float = self.loglikelihood(data=data, params=params,
-                                                  definiteness=None)
+        loglikelihood: float = self._loglikelihood(data=data, params=params)
         return np.inf if np.isnan(loglikelihood) else -loglikelihood
 
     def _mle(self, data: np.ndarray, params0: np.ndarray, bounds: tuple,
-             maxiter: int, tol: float, show_progress: bool, **kwargs
-             ) -> Tuple[tuple, bool]:
+             maxiter: int, tol: float, show_progress: bool,
+             workers: Union[int, Callable] = 1, vectorized: bool = False,
+             **kwargs) -> Tuple[tuple, bool]:
         """Performs Maximum Likelihood Estimation (MLE) to fit / estimate the
         parameters of the distribution from the data.
 
@@ -1420,6 +1641,16 @@ class PreFitContinuousMultivariate(NotImplementedBase):
         show_progress: bool
             True to display the progress of the differential evolution
             optimizer calculations.
+        workers: Union[int, Callable]
+            The number of processes to evaluate the differential evolution
+            population over in parallel, -1 to use all available cores, or a
+            map-like callable such as multiprocessing.Pool.map.
+            Default is 1.
+        vectorized: bool
+            True to evaluate the whole differential evolution population in
+            a single call of the objective function. Ignored if workers is not
+            1.
+            Default is False.
         kwargs:
             Model specific keyword arguments.
 
@@ -1445,7 +1676,8 @@ class PreFitContinuousMultivariate(NotImplementedBase):
         mle_res = differential_evolution(
             self._mle_objective_func, bounds, args=(data, mle_kwargs),
             maxiter=maxiter, tol=tol, x0=theta0, disp=show_progress,
-            constraints=constraints)
+            constraints=constraints, workers=workers,
+            vectorized=vectorized and workers == 1)
 
         # extracting params from results
         theta: np.ndarray = mle_res['x']
@@ -1505,7 +1737,8 @@ class PreFitContinuousMultivariate(NotImplementedBase):
             kwargs: dict = {'copula': copula, 'bounds': bounds,
                             'maxiter': 1000, 'tol': 0.5,
                             'cov_method': 'pp_kendall', 'min_eig': None,
-                            'show_progress': False}
+                            'show_progress': False, 'workers': 1,
+                            'vectorized': False}
             kwargs['params0'] = self._get_params0(
                 data=data, **{**kwargs, **user_kwargs})
 
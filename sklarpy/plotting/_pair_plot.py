@@ -1,7 +1,5 @@
 # Contains code for producing pair-plots of variables
-import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
 # from collections import deque
 # import math
 
@@ -40,6 +38,8 @@ def pair_plot(plot_df: pd.DataFrame, title: str, color: str = 'royalblue',
         True to display the pair-plots when the method is called.
         Default is True.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
 
     # checking arguments
     if not isinstance(plot_df, pd.DataFrame):
@@ -1,7 +1,6 @@
 # Contains code for producing 3D plots
 from typing import Callable, Iterable
 import numpy as np
-import matplotlib.pyplot as plt
 import warnings
 
 from sklarpy.utils._iterator import get_iterator
@@ -72,6 +71,7 @@ def threeD_plot(func: Callable, var1_range: np.ndarray, var2_range: np.ndarray,
         True to display the plot when the function is called.
         Default is True.
     """
+    import matplotlib.pyplot as plt
 
     # checking arguments
     if not callable(func):
@@ -286,3 +286,78 @@ def test_fitted_names(all_mvt_data, copula_params_2d, all_mdists_2d):
         _, fcopula, _s = get_dist(name, copula_params_2d, mdists, data)
         assert isinstance(fcopula.name, str), \
             f"name of {name} is not a string."
+
+
+def test_fitted_sample_cache(all_mvt_data, copula_params_2d, all_mdists_2d):
+    """Testing the monte-carlo sample cache of fitted copula models."""
+    data: np.ndarray = all_mvt_data['mvt_mixed']
+    mdists = all_mdists_2d['mvt_mixed']
+    _, fcopula, _ = get_dist('gh_copula', copula_params_2d, mdists, data)
+    x: np.ndarray = data[:20]
+    u: np.ndarray = np.random.uniform(size=(20, 2))
+
+    uncached: np.ndarray = fcopula.mc_cdf(x, match_datatype=False, seed=1)
+    fcopula.enable_sample_cache()
+    for _ in range(2):
+        assert np.array_equal(
+            uncached, fcopula.mc_cdf(x, match_datatype=False, seed=1)), \
+            "cached copula mc_cdf values do not match uncached values."
+    assert np.array_equal(
+        fcopula.copula_mc_cdf(u, match_datatype=False, seed=3),
+        fcopula.copula_mc_cdf(u, match_datatype=False, seed=3)), \
+        "cached copula_mc_cdf values are not reproducible."
+    assert len(fcopula.sample_cache._entries) == 2, \
+        "samples not cached by seed."
+
+    # adaptive mc_cdf values and their standard errors
+    for func in (fcopula.mc_cdf, fcopula.copula_mc_cdf):
+        values, stderrs = func(u if 'copula' in func.__name__ else x,
+                               match_datatype=False, seed=1, atol=0.01,
+                               return_stderr=True)
+        assert values.shape == stderrs.shape == (20, ), \
+            f"{func.__name__} standard errors of incorrect shape."
+        assert np.all(stderrs <= 0.01), \
+            f"{func.__name__} standard errors above target."
+
+
+def test_fitted_variance_reduced_rvs(all_mvt_data, copula_params_2d,
+                                     all_mdists_2d):
+    """Testing the variance reduced sampling methods of fitted copula
+    models."""
+    data: np.ndarray = all_mvt_data['mvt_mixed']
+    mdists = all_mdists_2d['mvt_mixed']
+    size: int = 1000
+    for name in ('gaussian_copula', 'student_t_copula', 'clayton_copula'):
+        _, fcopula, _ = get_dist(name, copula_params_2d, mdists, data)
+        for sampling in ('sobol', 'antithetic', 'lhs'):
+            u: np.ndarray = fcopula.copula_rvs(size, sampling=sampling)
+            assert u.shape == (size, 2), \
+                f"{sampling} copula_rvs of {name} have the wrong shape."
+            assert np.all((u > 0) & (u < 1)), \
+                f"{sampling} copula_rvs of {name} not in (0, 1)."
+            assert np.allclose(u.mean(axis=0), 0.5, atol=0.05), \
+                f"{sampling} copula_rvs of {name} are not uniform."
+            rvs: np.ndarray = fcopula.rvs(100, match_datatype=False,
+                                          sampling=sampling)
+            assert rvs.shape == (100, 2) and np.all(np.isfinite(rvs)), \
+                f"{sampling} rvs of {name} are invalid."
+
+        # latin hypercube samples have one value in each stratum
+        u = fcopula.copula_rvs(size, sampling='lhs')
+        assert np.all(np.floor(np.sort(u, axis=0) * size)
+                      == np.arange(size)[:, None]), \
+            f"lhs copula_rvs of {name} are not stratified."
+
+    # samples of different methods cached separately
+    fcopula.enable_sample_cache()
+    u = np.random.uniform(size=(20, 2))
+    sobol: np.ndarray = fcopula.copula_mc_cdf(u, match_datatype=False,
+                                              seed=1, sampling='sobol')
+    fcopula.copula_mc_cdf(u, match_datatype=False, seed=1)
+    assert len(fcopula.sample_cache._entries) == 2, \
+        "samples not cached by sampling method."
+    assert np.array_equal(sobol, fcopula.copula_mc_cdf(
+        u, match_datatype=False, seed=1, sampling='sobol')), \
+        "cached sobol copula_mc_cdf values are not reproducible."
+    with pytest.raises(ValueError):
+        fcopula.copula_rvs(10, sampling='halton')
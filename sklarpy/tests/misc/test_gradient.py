@@ -1,6 +1,7 @@
 # Contains code for testing SklarPy's numerical derivative functions
 import numpy as np
 import pandas as pd
+import pytest
 
 from sklarpy.misc import gradient_1d
 from sklarpy.tests.misc.helpers import XCubed, Exp, Log
@@ -44,3 +45,34 @@ def test_gradient_1d():
             assert np.allclose(dfdx, dfdx_approx), \
                 f"gradient_1d values are poor approximations of {func} " \
                 f"when x is {datatype}"
+
+
+def test_gradient_1d_stencils():
+    """Testing gradient_1d's higher order stencil and domain handling."""
+    x: np.ndarray = np.linspace(0.5, 4, 50)
+    for func in (XCubed, Exp, Log):
+        dfdx: np.ndarray = func.dfdx(x)
+        errors: dict = {}
+        for order in (2, 4):
+            dfdx_approx: np.ndarray = gradient_1d(func.f, x, 10 ** -2,
+                                                  (0, 5), order)
+            errors[order] = np.abs(dfdx_approx - dfdx).max()
+        assert errors[4] < errors[2], \
+            f"order 4 stencil is not more accurate than order 2 for {func}"
+
+    # checking points outside the domain are nan and func is only evaluated
+    # within the domain
+    def f(xi: float) -> float:
+        assert 0 <= xi <= 1, "func evaluated outside of domain"
+        return xi ** 2
+
+    for order in (2, 4):
+        dfdx_approx = gradient_1d(f, [-1.0, 0.0, 0.5, 1.0, 2.0], 10 ** -2,
+                                  (0, 1), order)
+        assert np.isnan(dfdx_approx[[0, 4]]).all(), \
+            "gradient_1d values outside of domain are not nan"
+        assert np.allclose(dfdx_approx[1:4], [0, 1, 2], atol=0.05), \
+            "gradient_1d values at domain edges are poor approximations"
+
+    with pytest.raises(ValueError):
+        gradient_1d(Exp.f, x, order=3)
@@ -40,11 +40,26 @@ def test_kv():
                     assert np.isnan(func(v, -z)), \
                         f'{func_str}({v}, -{z}) is not nan.'
 
-        # checking fails for non-scalar values
-        with pytest.raises(TypeError, match="all arguments / keyword "
-                                            "arguments must be scalars."):
-            func(0.1, z_values)
-
-        with pytest.raises(TypeError, match="all arguments / keyword "
-                                            "arguments must be scalars."):
-            func(v_values, 5)
+        # checking array values match scalar values
+        array_vals: np.ndarray = func(np.array(v_values).reshape(-1, 1),
+                                      np.array(z_values))
+        assert isinstance(array_vals, np.ndarray) and array_vals.shape == \
+               (len(v_values), len(z_values)), \
+            f'{func_str} does not broadcast array arguments.'
+        for i, v in enumerate(v_values):
+            for j, z in enumerate(z_values):
+                assert array_vals[i, j] == func(v, z), \
+                    f'{func_str} array value does not match scalar value ' \
+                    f'for ({v}, {z}).'
+
+        # checking finite log values in the tails
+        if func_str == 'logkv':
+            for v, z in ((9.7, 1000), (500, 1.5)):
+                assert np.isfinite(func(v, z)), \
+                    f'{func_str}({v}, {z}) is not finite.'
+
+        # checking fails for non-scalar keyword arguments
+        with pytest.raises(TypeError, match="small_value and large_value "
+                                            "keyword arguments must be "
+                                            "scalars."):
+            func(0.1, 5, small_value=[0.1, 0.2])
@@ -222,3 +222,37 @@ def test_fitted_summaries(mv_dists_to_test, params_2d, mvt_continuous_data):
         # testing non-empty
         assert len(fitted.summary) > 0, \
             f"summary of fitted {name} is an empty dataframe."
+
+
+def test_fitted_sample_cache(params_2d, mvt_continuous_data):
+    """Testing the monte-carlo sample cache of fitted multivariate
+    distributions."""
+    _, fitted, _ = get_dist('mvt_student_t', params_2d, mvt_continuous_data)
+    x: np.ndarray = mvt_continuous_data[:20]
+
+    # seeded samples are reproducible, with or without the cache
+    uncached: np.ndarray = fitted.mc_cdf(x, match_datatype=False,
+                                         num_generate=15000, seed=1)
+    fitted.enable_sample_cache(max_bytes=5 * 10 ** 5)
+    assert fitted.sample_cache is not None, "sample cache not enabled."
+    small: np.ndarray = fitted.mc_cdf(x, match_datatype=False,
+                                      num_generate=5000, seed=1)
+    cached: np.ndarray = fitted.mc_cdf(x, match_datatype=False,
+                                       num_generate=15000, seed=1)
+    assert np.array_equal(uncached, cached), \
+        "extended cached sample does not match the uncached sample."
+    assert np.array_equal(small, fitted.mc_cdf(
+        x, match_datatype=False, num_generate=5000, seed=1)), \
+        "cached sample not reused."
+
+    # memory cap and eviction of the least recently used samples
+    for seed in range(2, 6):
+        fitted.mc_cdf(x, match_datatype=False, seed=seed)
+    assert fitted.sample_cache.nbytes <= 5 * 10 ** 5, "memory cap exceeded."
+    assert 1 not in fitted.sample_cache._entries, \
+        "least recently used sample not evicted."
+
+    # copies do not carry samples
+    assert fitted.copy().sample_cache.nbytes == 0, "samples were copied."
+    fitted.disable_sample_cache()
+    assert fitted.sample_cache is None, "sample cache not disabled."
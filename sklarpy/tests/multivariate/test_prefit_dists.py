@@ -4,10 +4,13 @@ import pytest
 from typing import Callable
 import matplotlib.pyplot as plt
 import scipy.stats
+import scipy.special
 
 from sklarpy.multivariate import *
 from sklarpy.multivariate._prefit_dists import PreFitContinuousMultivariate
+from sklarpy.multivariate.distributions import mvt_gumbel, mvt_clayton
 from sklarpy.multivariate._fitted_dists import FittedContinuousMultivariate
+from sklarpy.univariate._distributions._gh import _gh
 from sklarpy.utils._params import Params
 from sklarpy.tests.multivariate.helpers import get_dist
 
@@ -311,3 +314,333 @@ def test_prefit_integers(mv_dists_to_test, params_2d, mvt_continuous_data):
         assert dist.num_params == len(params), \
             f"num_params of {name} does not match the length of its params " \
             f"object."
+
+
+def test_prefit_batch_logpdf(mv_dists_to_test, params_2d, params_3d,
+                             mvt_continuous_data):
+    """Testing the batched log-pdf of the Generalized Hyperbolic family
+    matches the row by row log-pdf."""
+    for params_dict in (params_2d, params_3d):
+        for name in mv_dists_to_test:
+            dist, _, params = get_dist(name, params_dict, mvt_continuous_data)
+            if '_singular_logpdf' not in dir(dist):
+                continue
+
+            params_tuple: tuple = dist._get_params(params)
+            d: int = dist._get_dim(params_tuple)
+            data: np.ndarray = np.random.normal(size=(50, d))
+            batch_values: np.ndarray = dist._batch_logpdf(data, params_tuple)
+            row_values: np.ndarray = np.array([
+                dist._singular_logpdf(xrow, params_tuple) for xrow in data])
+            assert np.allclose(batch_values, row_values), \
+                f"batched logpdf values for {name} do not match row by row " \
+                f"logpdf values."
+
+
+def test_prefit_em_weights(mv_dists_to_test, params_2d, mvt_continuous_data):
+    """Testing the vectorized E-step of the Generalized Hyperbolic family
+    matches the row by row conditional expectations."""
+    for name in mv_dists_to_test:
+        dist, _, params = get_dist(name, params_2d, mvt_continuous_data)
+        if '_etas_deltas_zetas' not in dir(dist):
+            continue
+
+        params_tuple: tuple = dist._get_params(params)
+        lamb, chi, psi, loc, shape, gamma = params_tuple
+        d: int = loc.size
+        shape_inv: np.ndarray = np.linalg.inv(shape)
+        p: float = psi + (gamma.T @ shape_inv @ gamma).item()
+        v: float = lamb - 0.5 * d
+
+        etas, deltas, _ = dist._etas_deltas_zetas(mvt_continuous_data,
+                                                  params_tuple, 10 ** -5)
+        for i, xi in enumerate(mvt_continuous_data[:10]):
+            xi = xi.reshape((d, 1))
+            qi: float = chi + ((xi - loc).T @ shape_inv @ (xi - loc)).item()
+            assert np.isclose(etas[i, 0], _gh._exp_w((v, qi, p))), \
+                f"vectorized eta values for {name} do not match row by " \
+                f"row values."
+            assert np.isclose(deltas[i, 0], _gh._exp_w((-v, p, qi))), \
+                f"vectorized delta values for {name} do not match row by " \
+                f"row values."
+
+
+def test_prefit_unchecked_loglikelihood(mv_dists_to_test, params_2d,
+                                        mvt_continuous_data):
+    """Testing the unchecked log-likelihood used during optimization matches
+    the log-likelihood function."""
+    for name in mv_dists_to_test:
+        dist, _, params = get_dist(name, params_2d, mvt_continuous_data)
+        unchecked: float = dist._loglikelihood(mvt_continuous_data, params)
+        checked: float = dist.loglikelihood(mvt_continuous_data, params)
+        assert np.isclose(unchecked, checked, equal_nan=True), \
+            f"unchecked log-likelihood of {name} does not match the " \
+            f"log-likelihood function."
+
+        # rows containing nan values are excluded by the checks
+        nan_data: np.ndarray = mvt_continuous_data.copy()
+        nan_data[0, 0] = np.nan
+        assert np.isclose(
+            dist.loglikelihood(nan_data, params),
+            dist._loglikelihood(mvt_continuous_data[1:], params),
+            equal_nan=True), \
+            f"log-likelihood of {name} does not exclude nan rows."
+        assert np.isnan(dist.loglikelihood(np.full((3, 2), np.nan), params)), \
+            f"log-likelihood of {name} is not nan for all nan data."
+
+
+def test_prefit_vectorized_mle_objective(mv_dists_to_test,
+                                         mvt_continuous_data):
+    """Testing the MLE objective function gives the same values when
+    evaluating a whole population of parameters at once."""
+    for name in mv_dists_to_test:
+        dist = eval(name)
+        if 'mle' not in dist._DATA_FIT_METHODS or name == 'mvt_normal':
+            continue
+
+        fit_kwargs: dict = dist._fit_given_data_kwargs(
+            'mle', mvt_continuous_data)
+        bounds: tuple = fit_kwargs.pop('bounds')
+        fit_kwargs.pop('params0')
+        mle_kwargs: dict = dist._get_mle_objective_func_kwargs(
+            data=mvt_continuous_data, **fit_kwargs)
+        mle_kwargs.pop('constraints', None)
+
+        thetas: np.ndarray = np.array([np.random.uniform(*bound, size=20)
+                                       for bound in bounds])
+        vectorized: np.ndarray = dist._mle_objective_func(
+            thetas, mvt_continuous_data, mle_kwargs)
+        looped: np.ndarray = np.array([
+            dist._mle_objective_func(theta, mvt_continuous_data, mle_kwargs)
+            for theta in thetas.T])
+        assert vectorized.shape == (thetas.shape[1], ), \
+            f"vectorized mle objective of {name} has the wrong shape."
+        assert np.allclose(vectorized, looped, equal_nan=True), \
+            f"vectorized mle objective of {name} does not match the " \
+            f"objective evaluated for each set of parameters."
+
+
+def test_gumbel_derivatives():
+    """Testing the derivatives of the Gumbel generator inverse match those
+    obtained by repeatedly applying the Leibniz rule."""
+    t: np.ndarray = np.array([0.01, 0.7, 3.0, 25.0])
+    for theta in (1.001, 1.5, 4.0):
+        a: float = 1 / theta
+        derivatives: list = [np.exp(-np.power(t, a))]
+        for K in range(1, 9):
+            # D^K psi = -D^(K-1) (a t^(a-1) psi)
+            derivatives.append(-sum(
+                scipy.special.comb(K - 1, j) * derivatives[j]
+                * np.prod(a - np.arange(K - j)) * np.power(t, a - K + j)
+                for j in range(K)))
+            assert np.allclose(mvt_gumbel._DK_psi(t, (theta, K), K),
+                               derivatives[K], rtol=10 ** -8, atol=0), \
+                f"derivative {K} of the Gumbel generator inverse is " \
+                f"incorrect."
+
+
+@pytest.mark.test_local_only
+def test_archimedean_high_dimensional():
+    """Testing Gumbel and Clayton copulas can be evaluated and fitted in up
+    to 20 dimensions."""
+    for d in (2, 5, 10, 15, 20):
+        for dist in (mvt_gumbel, mvt_clayton):
+            params: tuple = (2.0, d)
+            u: np.ndarray = dist.rvs(1000, params)
+
+            logpdf_values: np.ndarray = dist.logpdf(u, params)
+            assert np.isfinite(logpdf_values).all(), \
+                f"{dist.name} logpdf values are not finite when d={d}"
+
+            fitted = dist.fit(u, copula=True)
+            assert fitted.num_variables == d, \
+                f"{dist.name} fitted to the wrong dimension when d={d}"
+            assert np.isfinite(fitted.loglikelihood()), \
+                f"{dist.name} fitted loglikelihood is not finite when d={d}"
+
+
+def test_gaussian_kde_binned():
+    """Testing the binned gaussian kde logpdf and cdf values match those
+    evaluated exactly, and that it falls back to exact evaluation when
+    required."""
+    data: np.ndarray = scipy.stats.multivariate_t.rvs(
+        np.zeros(2), [[1, 0.8], [0.8, 1]], df=4, size=2000)
+    kde = scipy.stats.gaussian_kde(data.T)
+    params: tuple = (kde, )
+    x: np.ndarray = np.concatenate([data[:200] + 0.1, [[30.0, -30.0]]])
+
+    exact: np.ndarray = mvt_gaussian_kde.logpdf(x, params,
+                                                kde_method='exact')
+    binned: np.ndarray = mvt_gaussian_kde.logpdf(x, params,
+                                                 kde_method='binned')
+    assert np.allclose(binned, exact, rtol=0, atol=0.011), \
+        "binned gaussian kde logpdf values do not match exact values."
+    assert np.isfinite(binned).all(), \
+        "binned gaussian kde logpdf values are not finite far from the data."
+
+    exact_cdf: np.ndarray = mvt_gaussian_kde.cdf(x[:5], params,
+                                                 kde_method='exact')
+    binned_cdf: np.ndarray = mvt_gaussian_kde.cdf(x, params,
+                                                  kde_method='binned')
+    assert np.allclose(binned_cdf[:5], exact_cdf, rtol=0, atol=10 ** -3), \
+        "binned gaussian kde cdf values do not match exact values."
+    assert np.all((binned_cdf >= 0) & (binned_cdf <= 1)), \
+        "binned gaussian kde cdf values are not in [0, 1]."
+
+    # grids too large to build in higher dimensions
+    data_5d: np.ndarray = np.random.normal(size=(200, 5))
+    params_5d: tuple = (scipy.stats.gaussian_kde(data_5d.T), )
+    assert np.allclose(
+        mvt_gaussian_kde.logpdf(data_5d[:20], params_5d, kde_method='binned'),
+        mvt_gaussian_kde.logpdf(data_5d[:20], params_5d, kde_method='exact')
+    ), "binned gaussian kde does not fall back to exact evaluation."
+
+    with pytest.raises(ValueError):
+        mvt_gaussian_kde.logpdf(x, params, kde_method='tree')
+
+
+def test_normal_mixture_cdf():
+    """Testing the quasi-monte-carlo cdfs of the generalized hyperbolic
+    family match their univariate marginals and scipy's student-t cdf, to
+    within their error tolerance."""
+    from sklarpy.univariate import gh
+    from sklarpy.multivariate._distributions._normal_mixture_cdf import \
+        normal_mixture_cdf
+
+    loc: np.ndarray = np.array([[0.1], [-0.2], [0.3]])
+    shape: np.ndarray = np.array([[1.0, 0.4, 0.2], [0.4, 0.8, -0.1],
+                                  [0.2, -0.1, 1.2]])
+    gamma: np.ndarray = np.array([[0.3], [-0.2], [0.1]])
+    x: np.ndarray = np.random.normal(size=(50, 3))
+    params: tuple = (-0.5, 1.3, 0.7, loc, shape, gamma)
+
+    # the marginal of the first variable is univariate gh
+    x[:10, 1:] = np.inf
+    cdf_values: np.ndarray = mvt_gh.cdf(x, params, match_datatype=False)
+    gh_values: np.ndarray = gh.cdf(x[:10, 0], (-0.5, 1.3, 0.7, 0.1, 1.0,
+                                               0.3))
+    assert np.allclose(cdf_values[:10], gh_values, rtol=0,
+                       atol=2 * 10 ** -4), \
+        "gh qmc cdf values do not match its univariate marginal."
+    assert np.all((cdf_values >= 0) & (cdf_values <= 1)), \
+        "gh qmc cdf values are not in [0, 1]."
+
+    # W ~ InvGamma(dof / 2, dof / 2) with no skewness is student-t
+    dof: float = 4.0
+    t_values, errors = normal_mixture_cdf(
+        x[10:], loc, shape, np.zeros(3),
+        lambda q: scipy.stats.invgamma.ppf(q, dof / 2, scale=dof / 2),
+        abseps=10 ** -4)
+    assert np.all(errors <= 10 ** -4), "qmc cdf tolerance not met."
+    scipy_values: np.ndarray = scipy.stats.multivariate_t.cdf(
+        x[10:], loc.flatten(), shape, df=dof)
+    assert np.allclose(t_values, scipy_values, rtol=0, atol=3 * 10 ** -4), \
+        "qmc cdf values do not match scipy's student-t cdf."
+
+
+def test_orthant_counts():
+    """Testing the orthant counts used by mc_cdf match a direct comparison,
+    including ties, nans and infinite values."""
+    from sklarpy.multivariate._orthant_counts import orthant_counts
+
+    for d in (1, 2, 3):
+        points: np.ndarray = np.round(np.random.normal(size=(3000, d)), 1)
+        points[0] = np.nan
+        queries: np.ndarray = np.round(np.random.normal(size=(600, d)), 1)
+        queries[0] = np.nan
+        queries[1] = np.inf
+        queries[2] = -np.inf
+        counts: np.ndarray = orthant_counts(points, queries)
+        expected: np.ndarray = np.array([
+            np.all(points <= q, axis=1).sum() for q in queries])
+        assert np.array_equal(counts, expected), \
+            f"orthant counts incorrect when d={d}."
+
+    # mc_cdf is the proportion of the sample in each lower orthant
+    params: tuple = (4.0, np.zeros((3, 1)), np.eye(3))
+    x: np.ndarray = np.random.normal(size=(600, 3))
+    rvs: np.ndarray = mvt_student_t.rvs(3000, params)
+    mc_cdf_values: np.ndarray = mvt_student_t.mc_cdf(
+        x, params, match_datatype=False, rvs=rvs)
+    expected = np.array([np.all(rvs <= row, axis=1).mean() for row in x])
+    assert np.allclose(mc_cdf_values, expected, rtol=0, atol=10 ** -12), \
+        "mc_cdf values do not match the sample proportions."
+
+
+def test_adaptive_mc_cdf():
+    """Testing mc_cdf draws random variables until the standard error of
+    each value is within tolerance."""
+    shape: np.ndarray = np.array([[1.0, 0.5], [0.5, 1.0]])
+    params: tuple = (np.zeros((2, 1)), shape)
+    x: np.ndarray = np.array([[0.0, 0.0], [1.0, 1.0], [-2.5, -2.5],
+                              [np.nan, 0.0]])
+    exact: np.ndarray = scipy.stats.multivariate_normal.cdf(
+        x[:3], np.zeros(2), shape)
+
+    for kwargs in ({'atol': 2 * 10 ** -3}, {'rtol': 0.05}):
+        values, stderrs = mvt_normal.mc_cdf(
+            x, params, match_datatype=False, return_stderr=True, **kwargs)
+        assert np.isnan(values[3]) and np.isnan(stderrs[3]), \
+            "nan rows do not have nan mc_cdf values."
+        target: np.ndarray = np.full(3, kwargs['atol']) if 'atol' in kwargs \
+            else kwargs['rtol'] * values[:3]
+        assert np.all(stderrs[:3] <= target * 1.01), \
+            f"adaptive mc_cdf did not reach its target for {kwargs}."
+        assert np.all(np.abs(values[:3] - exact) <= 5 * stderrs[:3]), \
+            f"adaptive mc_cdf values inaccurate for {kwargs}."
+
+    # stopping at max_num_generate
+    with pytest.warns(UserWarning):
+        mvt_normal.mc_cdf(x, params, rtol=10 ** -3, max_num_generate=10 ** 5)
+    with pytest.raises(TypeError):
+        mvt_normal.mc_cdf(x, params, rtol=-1.0)
+
+
+def test_variance_reduced_rvs():
+    """Testing the variance reduced sampling methods of rvs."""
+    loc: np.ndarray = np.array([[1.0], [-1.0]])
+    shape: np.ndarray = np.array([[1.0, 0.5], [0.5, 2.0]])
+    gamma: np.ndarray = np.array([[0.3], [-0.2]])
+    dists_params: dict = {
+        'mvt_normal': (mvt_normal, (loc, shape)),
+        'mvt_student_t': (mvt_student_t, (6.0, loc, shape)),
+        'mvt_gh': (mvt_gh, (-0.5, 1.5, 1.2, loc, shape, gamma)),
+        'mvt_clayton': (mvt_clayton, (2.0, 2)),
+        'mvt_gumbel': (mvt_gumbel, (2.0, 2))}
+    size: int = 4000
+    for name, (dist, params) in dists_params.items():
+        reference: np.ndarray = dist.rvs(10 ** 5, params)
+        for sampling in ('sobol', 'antithetic', 'lhs'):
+            rvs: np.ndarray = dist.rvs(size, params, sampling=sampling)
+            assert rvs.shape == (size, 2), \
+                f"{sampling} rvs of {name} have the wrong shape."
+            assert np.all(np.isfinite(rvs)), \
+                f"{sampling} rvs of {name} are not finite."
+            assert np.allclose(rvs.mean(axis=0), reference.mean(axis=0),
+                               atol=0.1), \
+                f"{sampling} rvs of {name} have the wrong mean."
+            assert abs(np.corrcoef(rvs.T)[0, 1]
+                       - np.corrcoef(reference.T)[0, 1]) < 0.1, \
+                f"{sampling} rvs of {name} have the wrong correlation."
+
+    # antithetic normal rvs are symmetric about the location
+    rvs = mvt_normal.rvs(size, (loc, shape), sampling='antithetic')
+    assert np.allclose(rvs[:size // 2] + rvs[size // 2:], 2 * loc.T), \
+        "antithetic normal rvs are not symmetric."
+
+    # sobol points give a more accurate mc_cdf than pseudo-random ones
+    x: np.ndarray = np.array([[1.0, -1.0], [0.0, 0.0]])
+    exact: np.ndarray = scipy.stats.multivariate_normal.cdf(
+        x, loc.flatten(), shape)
+    errors: dict = {sampling: np.mean([np.abs(mvt_normal.mc_cdf(
+        x, (loc, shape), match_datatype=False, num_generate=2 ** 12,
+        sampling=sampling) - exact).max() for _ in range(10)])
+        for sampling in ('random', 'sobol')}
+    assert errors['sobol'] < errors['random'], \
+        "sobol mc_cdf is not more accurate than random mc_cdf."
+
+    with pytest.raises(ValueError):
+        mvt_normal.rvs(10, (loc, shape), sampling='halton')
+    kde = mvt_gaussian_kde.fit(np.random.normal(size=(100, 2)))
+    with pytest.raises(NotImplementedError):
+        kde.rvs(10, sampling='sobol')
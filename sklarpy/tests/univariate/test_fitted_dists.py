@@ -8,7 +8,9 @@ import matplotlib.pyplot as plt
 
 from sklarpy.tests.univariate.helpers import get_data, get_fitted_dict
 from sklarpy.utils._errors import SaveError, FitError
-from sklarpy.univariate import distributions_map
+from sklarpy.univariate import distributions_map, normal, empirical, \
+    discrete_empirical
+from sklarpy.utils._serialize import load
 from sklarpy.univariate._fitted_dists import FittedContinuousUnivariate, \
     FittedDiscreteUnivariate
 
@@ -480,3 +482,87 @@ def test_fitted_continuous_or_discretes(discrete_data, continuous_data,
             assert correct_value, \
                 f"continuous_or_discrete value is incorrect for {name}" \
                 f" when {fitted_type}"
+
+
+def test_fitted_approx_caches(continuous_data, uniform_data):
+    """Testing the interpolations used by ppf_approx and cdf_approx are saved
+    and reused by fitted univariate distributions."""
+    fitted = normal.fit(continuous_data)
+    num_points: int = 10
+    eps: float = 10 ** -3
+
+    # checking ppf_approx saves and reuses its interpolation
+    ppf_values: np.ndarray = fitted.ppf_approx(uniform_data, num_points)
+    assert len(fitted._approx_cache) == 1, "ppf_approx interpolation not saved"
+    approx = list(fitted._approx_cache.values())[0]
+    assert np.allclose(fitted.ppf_approx(uniform_data, num_points),
+                       ppf_values), "ppf_approx values changed when reused"
+    assert list(fitted._approx_cache.values())[0] is approx, \
+        "ppf_approx interpolation refitted when reused"
+    assert np.allclose(ppf_values, fitted.ppf(uniform_data), atol=0.5), \
+        "ppf_approx values are not close to ppf values"
+
+    # checking cdf_approx reuses interpolations covering the given values,
+    # with enough points for the linear interpolation to be within tolerance
+    cdf_num_points: int = 5 * num_points
+    fitted.cdf_approx(continuous_data, cdf_num_points)
+    assert len(fitted._approx_cache) == 2, "cdf_approx interpolation not saved"
+    cdf_values: np.ndarray = fitted.cdf_approx(continuous_data[:num_points],
+                                               cdf_num_points)
+    assert len(fitted._approx_cache) == 2, \
+        "cdf_approx interpolation refitted for values within its range"
+    assert np.allclose(cdf_values, fitted.cdf(continuous_data[:num_points]),
+                       atol=eps * 10), \
+        "cdf_approx values are not close to cdf values"
+
+    # checking rvs sampled using the saved ppf_approx interpolation
+    rvs: np.ndarray = fitted.rvs((5, 2), ppf_approx=True,
+                                 num_points=num_points, eps=eps)
+    assert rvs.shape == (5, 2) and np.all(np.isfinite(rvs)), \
+        "rvs sampled using ppf_approx are invalid"
+    assert len(fitted._approx_cache) == 2, \
+        "rvs did not reuse the saved ppf_approx interpolation"
+    assert fitted.rvs((5, ), ppf_approx=True).shape == (5, ), \
+        "rvs sampled using the default ppf_approx have the wrong shape"
+
+    # checking the number of saved interpolations is bounded
+    for i in range(2 * fitted._APPROX_CACHE_SIZE):
+        fitted.ppf_approx(uniform_data, num_points + i, eps)
+    assert len(fitted._approx_cache) == fitted._APPROX_CACHE_SIZE, \
+        "number of saved interpolations is not bounded"
+
+    # checking saved interpolations survive saving and loading
+    save_location: str = f'{os.getcwd()}/{fitted.name}_approx.pickle'
+    fitted.save(save_location)
+    try:
+        loaded = load(save_location)
+    finally:
+        Path(save_location).unlink()
+    assert list(loaded._approx_cache) == list(fitted._approx_cache), \
+        "saved interpolations not kept when saving and loading"
+    assert np.allclose(
+        loaded.ppf_approx(uniform_data, num_points + 20, eps),
+        fitted.ppf_approx(uniform_data, num_points + 20, eps)), \
+        "loaded ppf_approx values differ"
+
+
+def test_fitted_empirical_counts():
+    """Testing fitted empirical distributions match direct counts of the data,
+    including when the data contains ties."""
+    rng = np.random.default_rng(0)
+    continuous_data: np.ndarray = np.round(rng.normal(size=500), 1)
+    discrete_data: np.ndarray = rng.poisson(4, size=500)
+    for dist, data in ((empirical, continuous_data),
+                       (discrete_empirical, discrete_data)):
+        fitted = dist.fit(data)
+        unique_values: np.ndarray = np.unique(data)
+        target_cdf: np.ndarray = np.array(
+            [(data <= x).mean() for x in unique_values])
+        assert np.allclose(fitted.cdf(unique_values), target_cdf), \
+            f"{dist.name} cdf does not match the empirical cdf of the data."
+
+    x: np.ndarray = np.arange(-1, 20)
+    target_pdf: np.ndarray = np.array([(discrete_data == xi).mean()
+                                       for xi in x])
+    assert np.allclose(fitted.pdf(x), target_pdf), \
+        "discrete_empirical pdf does not match the empirical pdf of the data."
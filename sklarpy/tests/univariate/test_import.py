@@ -0,0 +1,46 @@
+# Contains tests and a cold-start benchmark for importing sklarpy's
+# univariate distributions
+import json
+import subprocess
+import sys
+
+_COLD_START_SCRIPT: str = """
+import json, sys, time
+start = time.perf_counter()
+import sklarpy.univariate
+import_time = time.perf_counter() - start
+import sklarpy.univariate.distributions as distributions
+built = sorted(name for name in distributions.__all__
+               if name in vars(distributions))
+start = time.perf_counter()
+from sklarpy.univariate import normal
+access_time = time.perf_counter() - start
+print(json.dumps({
+    'import_time': import_time, 'access_time': access_time, 'built': built,
+    'plotting': [name for name in ('matplotlib', 'seaborn')
+                 if name in sys.modules],
+}))
+"""
+
+
+def _cold_start() -> dict:
+    """Imports sklarpy.univariate in a fresh interpreter, returning the time
+    taken and which distributions and plotting libraries were loaded."""
+    res = subprocess.run([sys.executable, '-c', _COLD_START_SCRIPT],
+                         capture_output=True, text=True, check=True)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def test_cold_start(record_property):
+    """Testing importing sklarpy builds no distributions and does not import
+    plotting libraries, reporting the cold-start import and first access
+    times (seconds) as test properties, e.g. in pytest's --junitxml
+    report."""
+    res: dict = _cold_start()
+    record_property('import_time', res['import_time'])
+    record_property('access_time', res['access_time'])
+
+    assert res['built'] == [], \
+        f"distributions built at import: {res['built']}."
+    assert res['plotting'] == [], \
+        f"plotting libraries imported at import: {res['plotting']}."
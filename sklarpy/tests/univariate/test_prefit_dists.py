@@ -4,9 +4,13 @@ import pandas as pd
 from typing import Callable
 import pytest
 import matplotlib.pyplot as plt
+import scipy.integrate
+import scipy.stats
 
 from sklarpy.univariate import *
 from sklarpy.univariate._prefit_dists import PreFitUnivariateBase
+from sklarpy.univariate._distributions import _gig, _gh, _skewed_t
+from sklarpy.univariate._distributions._base_gen import base_gen
 from sklarpy.tests.univariate.helpers import get_data, get_target_fit, get_dist
 
 
@@ -339,6 +343,47 @@ def test_prefit_logpdfs(discrete_data, continuous_data,
             assert np.isnan(logpdf_values).sum() == 0, \
                 f"nan values present in {name} pre-fit log-pdf"
 
+            # checking log-pdf values agree with the pdf where it does not
+            # underflow
+            pdf_values: np.ndarray = dist.pdf(data, params)
+            mask: np.ndarray = pdf_values > 10 ** -300
+            assert np.allclose(logpdf_values[mask],
+                               np.log(pdf_values[mask])), \
+                f"log-pdf values for {name} do not match the pdf."
+
+
+def test_logpdf_tails():
+    """Testing native log-pdfs remain finite in the tails, where the pdf
+    underflows, and that likelihoods are calculated in log space."""
+    x: np.ndarray = np.array([-2000.0, 2000.0])
+    for dist, params in ((normal, (0.0, 1.0)),
+                         (gh, (-0.5, 1.0, 1.0, 0.0, 1.0, 0.2))):
+        assert np.all(dist.pdf(x, params) == 0), \
+            f"{dist.name} pdf does not underflow."
+        assert np.all(np.isfinite(dist.logpdf(x, params))), \
+            f"{dist.name} log-pdf not finite in the tails."
+
+    data: np.ndarray = np.random.normal(size=1000)
+    loglikelihood: float = normal.loglikelihood(data, (0.0, 1.0))
+    assert np.isclose(loglikelihood,
+                      scipy.stats.norm.logpdf(data).sum()), \
+        "normal log-likelihood incorrect."
+
+    # likelihood representable on a small sample
+    small_data: np.ndarray = data[:10]
+    assert np.isclose(normal.likelihood(small_data, (0.0, 1.0)),
+                      np.prod(scipy.stats.norm.pdf(small_data))), \
+        "normal likelihood incorrect."
+
+    # fit statistics finite where the product of pdf values underflows
+    assert np.prod(scipy.stats.norm.pdf(data)) == 0, \
+        "product of pdf values does not underflow."
+    fitted = normal.fit(data)
+    assert np.isclose(fitted.loglikelihood(),
+                      scipy.stats.norm.logpdf(data, *fitted.params).sum()), \
+        "fitted normal log-likelihood incorrect where the likelihood " \
+        "underflows."
+
 
 def test_prefit_scalars(discrete_data, continuous_data, dists_to_test):
     """Testing the likelihood, loglikelihood, AIC, BIC and SSE functions of
@@ -401,6 +446,38 @@ def test_prefit_gofs(discrete_data, continuous_data, dists_to_test):
             assert len(gof) > 0, f"gof for {name} is empty."
 
 
+def test_gof_values(discrete_data, continuous_data):
+    """Testing goodness of fit tests derived from a single evaluation of the
+    cdf agree with scipy's implementations."""
+    params: tuple = normal.fit(continuous_data).params
+    gof: pd.Series = normal.gof(continuous_data, params)['normal']
+    cvm_res = scipy.stats.cramervonmises(continuous_data, 'norm', params)
+    ks_res = scipy.stats.kstest(continuous_data, 'norm', params)
+    assert np.allclose([gof['Cramér-von Mises statistic'],
+                        gof['Cramér-von Mises p-value'],
+                        gof['Kolmogorov-Smirnov statistic'],
+                        gof['Kolmogorov-Smirnov p-value']],
+                       [cvm_res.statistic, cvm_res.pvalue, ks_res.statistic,
+                        ks_res.pvalue]), "gof tests differ from scipy."
+
+    ad_stat: float = gof['Anderson-Darling statistic']
+    assert 0 <= gof['Anderson-Darling p-value'] <= 1, \
+        "Anderson-Darling p-value not a probability."
+    assert ad_stat > 0, "Anderson-Darling statistic not positive."
+
+    # checking chi-square counts, against counting each value separately
+    params = poisson.fit(discrete_data).params
+    gof = poisson.gof(discrete_data, params)['poisson']
+    xrange: np.ndarray = np.arange(poisson.ppf(1e-4, params),
+                                   poisson.ppf(1 - 1e-4, params) + 1)
+    observed: np.ndarray = np.array([np.count_nonzero(discrete_data == x)
+                                     for x in xrange])
+    expected: np.ndarray = poisson.pdf(xrange, params) * len(discrete_data)
+    assert np.isclose(gof['chi-square statistic'],
+                      np.sum((expected - observed) ** 2 / expected)), \
+        "chi-square statistic incorrect."
+
+
 def test_prefit_plots(discrete_data, continuous_data, dists_to_test):
     """Testing the plot functions of pre-fit distributions"""
     for name in dists_to_test:
@@ -422,3 +499,144 @@ def test_prefit_plots(discrete_data, continuous_data, dists_to_test):
             # checking we can plot without errors
             dist.plot(params, show=False)
             plt.close()
+
+
+def test_prefit_tabulated_cdfs(uniform_data):
+    """Testing the tabulated cdf and ppf functions of the GIG, GH and
+    skewed-T distributions match numerical integration."""
+    eps: float = 10 ** -8
+    cases: tuple = ((_gig, (-1.2, 2.0, 3.0), 0.0),
+                    (_gh, (-1.2, 2.0, 3.0, 0.3, 1.5, 0.7), -np.inf),
+                    (_skewed_t, (5.0, 0.3, 1.5, 0.7), -np.inf))
+    for dist, params, left in cases:
+        x: np.ndarray = dist.ppf(uniform_data, *params)
+        cdf_values: np.ndarray = dist.cdf(x, *params)
+        assert np.allclose(cdf_values, uniform_data, atol=eps), \
+            f"ppf of {dist} is not the inverse of its cdf."
+
+        for xi, cdf_value in list(zip(x, cdf_values))[:5]:
+            target: float = scipy.integrate.quad(
+                lambda t: float(dist.pdf(t, *params)), left, 0.3
+            )[0] + scipy.integrate.quad(
+                lambda t: float(dist.pdf(t, *params)), 0.3, xi)[0]
+            assert abs(cdf_value - target) <= eps, \
+                f"tabulated cdf of {dist} does not match numerical " \
+                f"integration."
+
+    # tables reused across calls and invalid parameters rejected
+    params = cases[1][1]
+    assert _gh._tabulate(params) is _gh._tabulate(params), \
+        "gh tabulated cdf not reused for the same parameters."
+    _gig.ppf(uniform_data, *cases[0][1])
+    gig_table = _gig._tables.get(cases[0][1], None)
+    _gig.cdf(uniform_data, *cases[0][1])
+    assert _gig._tables.get(cases[0][1], None) is gig_table, \
+        "gig tabulated cdf not reused for the same parameters."
+    for func in (_gh.cdf, _gh.ppf):
+        with pytest.raises(ValueError):
+            func(0.5, -1.2, 2.0, -3.0, 0.3, 1.5, 0.7)
+    for func in (_skewed_t.cdf, _skewed_t.ppf):
+        with pytest.raises(ValueError):
+            func(0.5, 5.0, 0.0, -1.0, 0.3)
+
+
+def test_base_gen_tabulated_cdfs():
+    """Testing the tabulated cdf and ppf functions available to all base_gen
+    subclasses match scipy."""
+    class t_gen(base_gen):
+        _NAME, _NUM_PARAMS = 't', 3
+
+        def _logpdf_single(self, xi: float, *params) -> float:
+            return scipy.stats.t.logpdf(xi, *params)
+
+        def support(self, *params) -> tuple:
+            return -np.inf, np.inf
+
+    class gamma_gen(base_gen):
+        _NAME, _NUM_PARAMS = 'gamma', 1
+
+        def _logpdf(self, x: np.ndarray, *params) -> np.ndarray:
+            return scipy.stats.gamma.logpdf(x, *params)
+
+        def _logpdf_single(self, xi: float, *params) -> float:
+            return float(self._logpdf(np.asarray(xi, dtype=float), *params))
+
+        def support(self, *params) -> tuple:
+            return 0.0, np.inf
+
+    eps: float = 10 ** -8
+    rng = np.random.default_rng(0)
+    q: np.ndarray = rng.uniform(size=(20, 2))
+    for dist, target in ((t_gen(), scipy.stats.t(3, 0.5, 0.01)),
+                         (gamma_gen(), scipy.stats.gamma(0.7))):
+        params: tuple = target.args
+        x: np.ndarray = target.ppf(q)
+        cdf_values: np.ndarray = dist.cdf(x, *params)
+        assert cdf_values.shape == x.shape, \
+            f"cdf values for {dist._NAME} do not have the same shape as input"
+        assert np.allclose(cdf_values, q, atol=eps), \
+            f"cdf values for {dist._NAME} are incorrect"
+
+        ppf_values: np.ndarray = dist.ppf(q, *params)
+        assert ppf_values.shape == q.shape, \
+            f"ppf values for {dist._NAME} do not have the same shape as input"
+        assert np.allclose(target.cdf(ppf_values), q, atol=eps), \
+            f"ppf values for {dist._NAME} are incorrect"
+
+        left, right = dist.support(*params)
+        assert np.array_equal(
+            dist.cdf(np.array([left, right, np.nan]), *params),
+            [0.0, 1.0, np.nan], equal_nan=True), \
+            f"cdf values for {dist._NAME} are incorrect at support edges"
+        assert np.array_equal(
+            dist.ppf(np.array([0.0, 1.0, np.nan]), *params),
+            [left, right, np.nan], equal_nan=True), \
+            f"ppf values for {dist._NAME} are incorrect at 0 and 1"
+
+
+def test_binned_kde(continuous_data):
+    """Testing the binned gaussian kde matches scipy's exact kde."""
+    fitted = gaussian_kde.fit(continuous_data)
+    kde = scipy.stats.gaussian_kde(continuous_data)
+    q: np.ndarray = np.linspace(0.01, 0.99, 50)
+    x: np.ndarray = np.quantile(continuous_data, q)
+    eps: float = 10 ** -5
+
+    assert np.allclose(fitted.pdf(x), kde.pdf(x), atol=eps), \
+        "binned kde pdf values incorrect."
+    target_cdf: np.ndarray = np.array(
+        [kde.integrate_box_1d(-np.inf, xi) for xi in x])
+    assert np.allclose(fitted.cdf(x), target_cdf, atol=eps), \
+        "binned kde cdf values incorrect."
+    assert np.allclose(fitted.ppf(target_cdf), x, atol=10 ** -3), \
+        "binned kde ppf values incorrect."
+
+    with pytest.raises(ValueError):
+        gaussian_kde.fit(np.ones(10))
+
+
+def test_prefit_parallel_vectorized_fits(continuous_data):
+    """Testing the differential evolution options of the gh fit are reachable
+    through the fit method, and that a vectorized population matches
+    evaluating each member in turn."""
+    for kwargs in ({'workers': 2}, {'vectorized': True}):
+        fitted = gh.fit(continuous_data, **kwargs)
+        assert np.isfinite(fitted.params).all(), \
+            f"gh not fitted with {kwargs}."
+
+    rng = np.random.default_rng(0)
+    for dist_gen in (_gh, _skewed_t):
+        args: tuple = dist_gen._get_additional_args(continuous_data)
+        bounds: np.ndarray = np.array(
+            dist_gen._get_default_bounds(continuous_data))
+        thetas: np.ndarray = bounds[:, [0]] + (
+            bounds[:, [1]] - bounds[:, [0]]) * rng.random((len(bounds), 8))
+        vectorized: np.ndarray = dist_gen._neg_loglikelihood(
+            thetas, continuous_data, *args)
+        looped: np.ndarray = np.array([dist_gen._neg_loglikelihood(
+            theta, continuous_data, *args) for theta in thetas.T])
+        assert vectorized.shape == (thetas.shape[1], ), \
+            f"vectorized {dist_gen._NAME} objective has the wrong shape."
+        assert np.allclose(vectorized, looped), \
+            f"vectorized {dist_gen._NAME} objective does not match the " \
+            f"looped objective."
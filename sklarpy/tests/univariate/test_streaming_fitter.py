@@ -0,0 +1,133 @@
+# Contains tests for sklarpy's StreamingUnivariateFitter class
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklarpy.univariate import StreamingUnivariateFitter, UnivariateFitter, \
+    normal, expon, uniform, poisson, discrete_uniform, empirical
+from sklarpy.univariate._fitted_dists import FittedContinuousUnivariate, \
+    FittedDiscreteUnivariate
+from sklarpy.univariate._sketches import KLLSketch, BinnedDensity
+from sklarpy.utils._errors import FitError
+
+
+def test_sketches():
+    """Testing the quantile sketch and histogram summarise a sample
+    accurately, including when merged."""
+    data: np.ndarray = np.random.standard_t(5, size=100000)
+    sketches: list = [KLLSketch(200, seed=i) for i in range(2)]
+    densities: list = [BinnedDensity(256) for _ in range(2)]
+    for i, chunk in enumerate(np.array_split(data, 50)):
+        sketches[i % 2].update(chunk)
+        densities[i % 2].update(chunk)
+    sketches[0].merge(sketches[1])
+    densities[0].merge(densities[1])
+
+    # checking the ranks of the sketch
+    items, weights = sketches[0].weighted()
+    assert weights.sum() == data.size, "quantile sketch weights incorrect."
+    ranks: np.ndarray = np.searchsorted(np.sort(data), items, side='right')
+    assert np.abs(np.cumsum(weights) - ranks).max() / data.size < 0.05, \
+        "quantile sketch ranks inaccurate."
+    assert sketches[0].size < 2000, "quantile sketch not bounded in size."
+
+    # checking the histogram
+    density: BinnedDensity = densities[0]
+    edges: np.ndarray = np.append(density.centers - density.width / 2,
+                                  density.centers[-1] + density.width / 2)
+    assert density.counts.size <= 256, "too many bins in histogram."
+    assert np.array_equal(np.histogram(data, edges)[0], density.counts), \
+        "histogram counts incorrect."
+
+
+def test_streaming_fit(continuous_data, discrete_data):
+    """Testing StreamingUnivariateFitter fits distributions to a sample
+    consumed in chunks."""
+    for data, datatype in ((continuous_data, float), (discrete_data, int)):
+        chunks = (chunk for chunk in np.array_split(data, 7))
+        fitter = StreamingUnivariateFitter(seed=0).fit(chunks)
+        assert fitter.num_data_points == len(data), \
+            "incorrect number of data points consumed."
+
+        summary: pd.DataFrame = fitter.get_summary()
+        assert len(summary) > 0, "no distributions fitted."
+        fitted_type = FittedContinuousUnivariate if datatype == float \
+            else FittedDiscreteUnivariate
+        for name, dist in fitter.fitted_distributions.items():
+            assert isinstance(dist, fitted_type), \
+                f"{name} not a fitted distribution."
+            assert dist.fitted_num_data_points == len(data), \
+                f"{name} number of fitted data points incorrect."
+            for func in ('pdf', 'cdf', 'ppf'):
+                values: np.ndarray = eval(f"dist.{func}(np.linspace("
+                                          f"0.1, 0.9, 5))")
+                assert np.all(np.isfinite(values)), \
+                    f"{func} values of {name} not finite."
+            assert dist.rvs((3, 2)).shape == (3, 2), \
+                f"rvs of {name} has incorrect shape."
+        fitter.get_best(significant=False)
+
+    # checking closed-form fits match fitting to the full sample
+    fitter = StreamingUnivariateFitter().fit(np.array_split(continuous_data,
+                                                            4))
+    for dist in (normal, expon, uniform):
+        assert np.allclose(fitter.fitted_distributions[dist.name].params,
+                           dist.fit(continuous_data).params), \
+            f"streamed {dist.name} parameters differ from full fit."
+    fitter = StreamingUnivariateFitter().fit(np.array_split(discrete_data, 4))
+    for dist in (poisson, discrete_uniform):
+        assert np.allclose(fitter.fitted_distributions[dist.name].params,
+                           dist.fit(discrete_data).params), \
+            f"streamed {dist.name} parameters differ from full fit."
+
+    # checking the sketch-backed empirical distribution, which is exact for
+    # samples smaller than the sketch
+    fitter = StreamingUnivariateFitter().fit(continuous_data)
+    fitted_empirical = empirical.fit(continuous_data)
+    q: np.ndarray = np.linspace(0, 1, 11)
+    assert np.allclose(fitter.fitted_distributions['empirical'].ppf(q),
+                       fitted_empirical.ppf(q)), "empirical ppf incorrect."
+    assert np.allclose(
+        fitter.fitted_distributions['empirical'].cdf(continuous_data),
+        fitted_empirical.cdf(continuous_data)), "empirical cdf incorrect."
+
+    # checking goodness of fit tests are not performed for the
+    # sketch-backed empirical distribution, which their sample is drawn from
+    summary = fitter.get_summary()
+    pvalue_cols: list = [col for col in summary.columns
+                         if col.endswith('p-value')]
+    assert summary.loc['empirical', pvalue_cols].isna().all(), \
+        "goodness of fit tests performed for sketch-backed empirical."
+    assert summary.loc['normal', pvalue_cols].notna().all(), \
+        "goodness of fit tests not performed for normal."
+    assert 'empirical' not in fitter.get_summary(significant=True).index, \
+        "sketch-backed empirical treated as significant."
+    assert not isinstance(fitter, UnivariateFitter), \
+        "StreamingUnivariateFitter is a UnivariateFitter."
+
+    # checking errors raised
+    with pytest.raises(FitError):
+        StreamingUnivariateFitter().get_summary()
+
+    with pytest.raises(TypeError):
+        StreamingUnivariateFitter().fit(5)
+
+
+def test_merge(continuous_data):
+    """Testing StreamingUnivariateFitters fitted to different parts of a
+    sample can be merged."""
+    half: int = len(continuous_data) // 2
+    merged = StreamingUnivariateFitter(seed=0).partial_fit(
+        continuous_data[:half])
+    merged.merge(StreamingUnivariateFitter(seed=1).partial_fit(
+        continuous_data[half:]))
+    single = StreamingUnivariateFitter(seed=0).fit(continuous_data)
+
+    assert merged.num_data_points == single.num_data_points, \
+        "merged number of data points incorrect."
+    assert np.allclose(merged.fitted_distributions['normal'].params,
+                       single.fitted_distributions['normal'].params), \
+        "merged normal parameters incorrect."
+
+    with pytest.raises(TypeError):
+        merged.merge(continuous_data)
@@ -1,9 +1,14 @@
 # Contains tests for sklarpy's UnivariateFitter class
+import numpy as np
 import pandas as pd
 import pytest
 import matplotlib.pyplot as plt
+import time
 
-from sklarpy.univariate import UnivariateFitter, distributions_map
+from sklarpy.univariate import UnivariateFitter, distributions_map, normal, \
+    laplace, logistic, empirical, FitPool
+from sklarpy.univariate._fit_context import FitContext
+from sklarpy.univariate._racing import race
 from sklarpy.univariate._fitted_dists import FittedContinuousUnivariate, \
     FittedDiscreteUnivariate
 from sklarpy.utils._errors import FitError, SignificanceError
@@ -164,3 +169,152 @@ def test_fitted_distributions(discrete_data, continuous_data):
 
         assert len(ufitter.fitted_distributions) > 0, \
             f"fitted_distributions is empty for {dtype} data."
+
+
+def test_shared_fit_statistics(continuous_data):
+    """Testing distributions fitted by UnivariateFitter share the empirical
+    distribution of the data, with the same fit statistics as when fitted
+    individually."""
+    names: tuple = ('normal', 'laplace', 'empirical')
+    ufitter = UnivariateFitter(continuous_data).fit(names, numerical=True)
+    fitted_dists: dict = ufitter.fitted_distributions
+    assert set(fitted_dists) == set(names), "not all distributions fitted."
+
+    fit_infos: list = [fitted._FittedUnivariateBase__fit_info
+                       for fitted in fitted_dists.values()]
+    for key in ('empirical_pdf', 'empirical_cdf', 'empirical_ppf'):
+        assert len({id(fit_info[key]) for fit_info in fit_infos}) == 1, \
+            f"{key} is not shared between fitted distributions."
+
+    for name, fitted in fitted_dists.items():
+        individual = eval(name).fit(continuous_data)
+        assert fitted.summary.equals(individual.summary), \
+            f"{name} fit statistics differ when fitted individually."
+
+    # checking numerical distributions are not left fitted
+    with pytest.raises(NotImplementedError):
+        empirical.pdf(continuous_data)
+
+
+def _sleep_task(*args):
+    """A FitPool task sleeping for the number of seconds given by its
+    distribution name, returning when it started."""
+    start: float = time.time()
+    time.sleep(float(args[5]))
+    return args[5], start
+
+
+class _SleepFitPool(FitPool):
+    _task = staticmethod(_sleep_task)
+
+
+def test_fit_pool(continuous_data):
+    """Testing UnivariateFitter fits distributions in a FitPool, with the same
+    results as when fitted sequentially."""
+    names: tuple = ('normal', 'laplace', 'empirical')
+    sequential = UnivariateFitter(continuous_data).fit(names, numerical=True)
+    with FitPool(max_workers=2) as pool:
+        for _ in range(2):
+            # reusing the same pool
+            pooled = UnivariateFitter(continuous_data).fit(
+                names, numerical=True, pool=pool)
+            assert pooled.get_summary().sort_index().equals(
+                sequential.get_summary().sort_index()), \
+                "distributions fitted in a FitPool differ from those fitted " \
+                "sequentially."
+
+        # checking tasks which time out are cancelled, with the pool usable
+        # afterwards
+        data: np.ndarray = continuous_data.reshape(-1, 1)
+        results: list = list(pool.fit(data, {'gh': (0, float, 'gh', float,
+                                                    10 ** -3)}))
+        assert (len(results) == 1) and isinstance(results[0][1],
+                                                  TimeoutError), \
+            "task did not time out."
+        pooled = UnivariateFitter(continuous_data).fit('normal', pool=pool)
+        assert 'normal' in pooled.fitted_distributions, \
+            "FitPool not usable after a task timed out."
+
+    # checking a hung task does not hold up the others, with timeouts
+    # measured from when each task starts running
+    data = continuous_data.reshape(-1, 1)
+    tasks: dict = {key: (0, float, seconds, float, 1.0) for key, seconds in
+                   (('a', '0.5'), ('b', '0.5'), ('hung', '30'), ('c', '0.5'),
+                    ('d', '0.5'))}
+    with _SleepFitPool(max_workers=1) as pool:
+        start: float = time.monotonic()
+        results: dict = dict(pool.fit(data, tasks))
+        elapsed: float = time.monotonic() - start
+    assert isinstance(results.pop('hung'), TimeoutError), \
+        "hung task did not time out."
+    assert {key: res[0] for key, res in results.items()} \
+        == {key: '0.5' for key in 'abcd'}, \
+        "queued tasks timed out or did not complete."
+    assert elapsed < 30, "hung task held up the other tasks."
+
+    # checking a timeout only stops the worker running the timed-out task,
+    # with tasks running alongside it not restarted
+    tasks = {'hung': (0, float, '30', float, 0.5),
+             'slow': (0, float, '2', float, 10.0)}
+    with _SleepFitPool(max_workers=2) as pool:
+        start = time.time()
+        results = dict(pool.fit(data, tasks))
+    assert isinstance(results['hung'], TimeoutError), \
+        "hung task did not time out."
+    assert results['slow'][1] - start < 0.5, \
+        "task restarted when another task timed out."
+
+    with pytest.raises(TypeError):
+        UnivariateFitter(continuous_data).fit(pool='pool')
+
+
+def test_racing(continuous_data):
+    """Testing UnivariateFitter prunes candidate distributions by racing."""
+    names: tuple = ('common continuous', 'empirical')
+    for criterion in ('aic', 'bic', 'sse'):
+        fitter = UnivariateFitter(continuous_data).fit(
+            names, numerical=True, racing=True, racing_criterion=criterion,
+            shortlist=3)
+        fitted: set = set(fitter.fitted_distributions)
+        assert 'empirical' in fitted, "numerical distributions raced."
+        assert 1 <= len(fitted.difference({'empirical'})) <= 3, \
+            f"more than shortlist distributions fitted when racing with " \
+            f"{criterion}."
+
+    # checking distributions whose support excludes the data are dropped
+    negative_data: np.ndarray = -np.abs(continuous_data)
+    fitter = UnivariateFitter(negative_data).fit(('normal', 'gig'),
+                                                 racing=True)
+    assert set(fitter.fitted_distributions) == {'normal'}, \
+        "distribution with invalid support not pruned when racing."
+
+    # checking candidates are only raced on subsamples of the data
+    class _SampleSizeRecorder:
+        def __init__(self, dist):
+            self._dist = dist
+            self.sample_sizes: list = []
+
+        def _fit(self, data: np.ndarray) -> tuple:
+            self.sample_sizes.append(len(data))
+            return self._dist._fit(data)
+
+        def __getattr__(self, name: str):
+            return getattr(self._dist, name)
+
+    for num_data_points in (10, 300, 1000):
+        data: np.ndarray = np.random.normal(size=num_data_points)
+        candidates: dict = {name: _SampleSizeRecorder(dist) for name, dist
+                            in (('normal', normal), ('laplace', laplace),
+                                ('logistic', logistic))}
+        survivors: list = race(candidates, FitContext(data), shortlist=1)
+        assert len(survivors) == 1, "racing did not stop at the shortlist."
+        for name, recorder in candidates.items():
+            assert all(size < num_data_points
+                       for size in recorder.sample_sizes), \
+                f"{name} fitted to the full dataset when racing."
+
+    # checking errors raised
+    for kwargs in ({'racing': 'yes'}, {'shortlist': 0},
+                   {'racing_criterion': 'mse'}):
+        with pytest.raises((TypeError, ValueError)):
+            UnivariateFitter(continuous_data).fit(**kwargs)
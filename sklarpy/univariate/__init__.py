@@ -1,4 +1,20 @@
 # Contains univariate probability distributions and fitter functions/objects
 from sklarpy.univariate.distributions_map import distributions_map
-from sklarpy.univariate.distributions import *
+from sklarpy.univariate import distributions
 from sklarpy.univariate.univariate_fitter import UnivariateFitter
+from sklarpy.univariate._fit_pool import FitPool
+from sklarpy.univariate.streaming_fitter import StreamingUnivariateFitter
+
+__all__ = ['distributions_map', *distributions.__all__, 'UnivariateFitter',
+           'FitPool', 'StreamingUnivariateFitter']
+
+
+def __getattr__(name: str):
+    # distributions are built on first access
+    if name in distributions.__all__:
+        return getattr(distributions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted({*globals(), *__all__})
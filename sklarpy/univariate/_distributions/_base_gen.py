@@ -1,8 +1,10 @@
 # Contains a base class for SklarPy univariate probability models.
+from typing import Callable, Union
 import numpy as np
 import scipy.optimize
-import scipy.integrate
 
+from sklarpy.univariate._distributions._tabulated_cdf import TabulatedCdf, \
+    TableCache
 from sklarpy.utils._errors import FitError
 from sklarpy.utils._input_handlers import check_params
 
@@ -45,6 +47,24 @@ class base_gen:
             The log-pdf value for a single observation.
         """
 
+    def _logpdf(self, x: np.ndarray, *params) -> np.ndarray:
+        """Returns the log-pdf values for an array of observations.
+        By default, this vectorizes _logpdf_single.
+
+        Parameters
+        ----------
+        x: np.ndarray
+            An array of observations.
+        params: tuple
+            The parameters which define the univariate model.
+
+        Returns
+        -------
+        logpdf_values: np.ndarray
+            An array of logpdf values
+        """
+        return np.vectorize(self._logpdf_single, otypes=[float])(x, *params)
+
     def logpdf(self, x, *params) -> np.ndarray:
         """The logarithm of the probability density/mass function.
 
@@ -61,7 +81,7 @@ class base_gen:
             An array of logpdf values
         """
         self._argcheck(params)
-        return np.vectorize(self._logpdf_single, otypes=[float])(x, *params)
+        return self._logpdf(np.asarray(x, dtype=float), *params)
 
     def pdf(self, x, *params) -> np.ndarray:
         """The probability density/mass function.
@@ -80,34 +100,48 @@ class base_gen:
         """
         return np.exp(self.logpdf(x, *params))
 
-    def _pdf_single(self, xi: float, *params) -> float:
-        """Returns the pdf value for a single observation.
+    def _pdf(self, x: np.ndarray, *params) -> np.ndarray:
+        """Returns the pdf values for an array of observations.
 
-        Used when computing the cdf via numerical integreation.
+        Used when tabulating the cdf.
         """
-        return np.exp(self._logpdf_single(xi, *params))
-
-    def _cdf_single(self, xi: float, *params) -> float:
-        """Returns the cdf value for a single observation.
+        return np.exp(self._logpdf(x, *params))
+
+    def _tabulation_guess(self, *params) -> tuple:
+        """Returns initial guesses of the location of the mode and the scale
+        of the distribution, used to place the grid its cdf is tabulated
+        on."""
+        return 0.0, 1.0
+
+    def _new_table(self, params: tuple) -> TabulatedCdf:
+        """Tabulates the cdf of the distribution for the given parameters."""
+        center, scale = self._tabulation_guess(*params)
+        return TabulatedCdf(pdf=lambda x: self._pdf(x, *params),
+                            support=self.support(*params), center=center,
+                            scale=scale)
+
+    def _tabulate(self, params: tuple) -> TabulatedCdf:
+        """Tabulates the cdf of the distribution, allowing vectorized cdf and
+        ppf evaluation. The most recently used tables are kept, so repeated
+        calls with the same parameters reuse them.
 
         Parameters
         ----------
-        xi: float
-            A single observation.
         params: tuple
             The parameters which define the univariate model.
 
         Returns
         -------
-        single_cdf : float
-            The cdf value for a single observation.
+        table: TabulatedCdf
+            The tabulated cdf.
         """
-        left: float = self.support(params)[0]
-        if xi <= left:
-            return 0
-        return float(
-            scipy.integrate.quad(self._pdf_single, left, xi, params)[0]
-        )
+        tables: TableCache = self.__dict__.setdefault('_tables', TableCache())
+        return tables.get(params, self._new_table)
+
+    def _cdf(self, x: np.ndarray, *params) -> np.ndarray:
+        """Returns the cdf values for an array of observations, using the
+        tabulated cdf of the distribution."""
+        return self._tabulate(params).cdf(x)
 
     def cdf(self, x, *params) -> np.ndarray:
         """The cumulative distribution function.
@@ -125,7 +159,7 @@ class base_gen:
             An array of cdf values
         """
         self._argcheck(params)
-        return np.vectorize(self._cdf_single, otypes=[float])(x, *params)
+        return self._cdf(np.asarray(x, dtype=float), *params)
 
     def support(self, *params) -> tuple:
         """The support function of the distribution.
@@ -141,33 +175,6 @@ class base_gen:
             The support of the specified distribution.
         """
 
-    def _ppf_to_solve(self, xi, qi, *params) -> float:
-        """Used to calculate the ppf function value using numerical
-        optimization."""
-        return self._cdf_single(xi, *params) - qi
-
-    def _ppf_single(self, qi: float, *params) -> float:
-        """Returns the ppf value for a single cdf observation."""
-        # Code adapted from scipy code
-        factor = 2.
-        left, right = self.support(*params)
-
-        if np.isinf(left):
-            left = min(-factor, right)
-            while self._ppf_to_solve(left, qi, *params) > 0.:
-                left, right = left * factor, left
-            # left is now such that cdf(left) <= q
-            # if right has changed, then cdf(right) > q
-
-        if np.isinf(right):
-            right = max(factor, left)
-            while self._ppf_to_solve(right, qi, *params) < 0.:
-                left, right = right, right * factor
-            # right is now such that cdf(right) >= q
-
-        return scipy.optimize.brentq(self._ppf_to_solve, left, right,
-                                     args=(qi, *params))
-
     def ppf(self, q, *params) -> np.ndarray:
         """The cumulative inverse / quartile function.
 
@@ -183,7 +190,13 @@ class base_gen:
         ppf_values: np.ndarray
             An array of quantile values.
         """
-        return np.vectorize(self._ppf_single, otypes=[float])(q, *params)
+        self._argcheck(params)
+        return self._ppf(np.asarray(q, dtype=float), *params)
+
+    def _ppf(self, q: np.ndarray, *params) -> np.ndarray:
+        """Returns the ppf values for an array of quantiles, by inverting the
+        tabulated cdf of the distribution."""
+        return self._tabulate(params).ppf(q)
 
     def _get_default_bounds(self, data: np.ndarray, *args) -> tuple:
         pass
@@ -195,19 +208,43 @@ class base_gen:
         return tuple(theta)
 
     def _neg_loglikelihood(self, theta: np.ndarray, data: np.ndarray, *args
-                           ) -> float:
+                           ) -> Union[float, np.ndarray]:
+        if theta.ndim == 2:
+            # evaluating a vectorized population, stored as columns, in a
+            # single call, with each parameter broadcast as a column vector
+            params: tuple = self._theta_to_params(theta[:, :, np.newaxis],
+                                                  *args)
+            if params is None:
+                return np.full(theta.shape[1], np.inf)
+            with np.errstate(all='ignore'):
+                neg_loglikelihoods: np.ndarray = -np.sum(
+                    self._logpdf(data.reshape(-1), *params), axis=-1)
+            return np.where(np.isnan(neg_loglikelihoods), np.inf,
+                            neg_loglikelihoods)
+
         params: tuple = self._theta_to_params(theta, *args)
         if params is None:
             return np.inf
         return -np.sum(self.logpdf(data, *params))
 
-    def fit(self, data: np.ndarray) -> tuple:
+    def fit(self, data: np.ndarray, workers: Union[int, Callable] = 1,
+            vectorized: bool = False) -> tuple:
         """Used to fit the distribution to the data.
 
         Parameters
         -----------
         data : data_iterable
             The data to fit to the distribution too.
+        workers: Union[int, Callable]
+            The number of processes to evaluate the differential evolution
+            population over in parallel, -1 to use all available cores, or a
+            map-like callable such as multiprocessing.Pool.map.
+            Default is 1.
+        vectorized: bool
+            True to evaluate the whole differential evolution population in
+            a single call of the objective function. Ignored if workers is not
+            1.
+            Default is False.
 
         Returns
         -------
@@ -217,8 +254,12 @@ class base_gen:
         """
         bounds: tuple = self._get_default_bounds(data=data)
         args: tuple = self._get_additional_args(data)
+        vectorized = vectorized and workers == 1
+        updating: str = 'immediate' if (workers == 1) and not vectorized \
+            else 'deferred'
         res = scipy.optimize.differential_evolution(
-            self._neg_loglikelihood, bounds, args=(data, *args))
+            self._neg_loglikelihood, bounds, args=(data, *args),
+            updating=updating, workers=workers, vectorized=vectorized)
 
         if not res['success']:
             raise FitError(f"Unable to fit {self._NAME} Distribution to data.")
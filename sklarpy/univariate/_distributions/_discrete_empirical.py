@@ -11,9 +11,11 @@ from sklarpy.utils._errors import DiscreteError
 __all__ = ['discrete_empirical_fit']
 
 
-def discrete_empirical_pdf(x, data, N):
+def discrete_empirical_pdf(x, values, counts, N):
     """the pdf function for a discrete empirical distribution."""
-    return np.array([np.count_nonzero(data == i) / N for i in x])
+    x = np.asarray(x)
+    idx: np.ndarray = np.clip(np.searchsorted(values, x), 0, values.size - 1)
+    return np.where(values[idx] == x, counts[idx], 0) / N
 
 
 def discrete_empirical_fit(data: np.ndarray) -> tuple:
@@ -34,8 +36,9 @@ def discrete_empirical_fit(data: np.ndarray) -> tuple:
     num_data_points: int = data.size
 
     # Fitting pdf function
-    pdf_: Callable = partial(discrete_empirical_pdf, data=data,
-                             N=num_data_points)
+    values, counts = np.unique(data, return_counts=True)
+    pdf_: Callable = partial(discrete_empirical_pdf, values=values,
+                             counts=counts, N=num_data_points)
     pdf: Callable = partial(NumericalWrappers.numerical_pdf, pdf_=pdf_)
 
     # Generating cdf and ppf functions via interpolation
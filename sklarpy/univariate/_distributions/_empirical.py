@@ -1,6 +1,5 @@
 # Contains code for fitting a continuous empirical distribution
 import numpy as np
-from collections import deque
 import scipy.interpolate
 from typing import Callable
 from functools import partial
@@ -31,11 +30,8 @@ def continuous_empirical_fit(data: np.ndarray) -> tuple:
     sorted_data: np.ndarray = np.sort(data)
 
     # calculating empirical cdf
-    empirical_cdf_values = deque()
-    for x in sorted_data:
-        p: float = (sorted_data <= x).sum() / num_data_points
-        empirical_cdf_values.append(p)
-    empirical_cdf_values: np.ndarray = np.asarray(empirical_cdf_values)
+    empirical_cdf_values: np.ndarray = np.searchsorted(
+        sorted_data, sorted_data, side='right') / num_data_points
     cdf_: Callable = scipy.interpolate.interp1d(
         sorted_data, empirical_cdf_values, 'linear', bounds_error=False
     )
@@ -1,5 +1,6 @@
 # Standard parametrization of the Generalized Hyperbolic distribution
 import numpy as np
+from typing import Union
 
 from sklarpy.misc import kv
 from sklarpy.univariate._distributions._base_gen import base_gen
@@ -16,31 +17,33 @@ class gh_gen(base_gen):
     def _argcheck(self, params) -> None:
         super()._argcheck(params)
 
-        if not (params[1] > 0) and (params[2] > 0) and (params[-2] > 0):
+        if not ((params[1] > 0) and (params[2] > 0) and (params[-2] > 0)):
             raise ValueError("chi, psi and scale parameters must all be "
                              "strictly positive.")
 
-    def _logpdf_single(self, xi: float, lamb: float, chi: float, psi: float,
-                       loc: float, scale: float, skew: float) -> float:
-        q: float = chi + (((xi - loc) / scale) ** 2)
+    def _logpdf(self, x: np.ndarray, lamb: float, chi: float, psi: float,
+                loc: float, scale: float, skew: float) -> np.ndarray:
+        q: np.ndarray = chi + (((x - loc) / scale) ** 2)
         p: float = psi + ((skew / scale) ** 2)
         r: float = np.sqrt(chi * psi)
         s: float = 0.5 - lamb
 
-        log_c: float = float(
-            (lamb * (np.log(psi) - np.log(r)))
-            + (s * np.log(p))
-            - (0.5 * np.log(2 * np.pi))
-            - np.log(scale)
+        log_c: float = (lamb * (np.log(psi) - np.log(r))) \
+            + (s * np.log(p)) \
+            - (0.5 * np.log(2 * np.pi)) \
+            - np.log(scale) \
             - kv.logkv(lamb, r)
-        )
-        log_h: float = float(
-            ((xi - loc) * skew * (scale ** - 2))
-            + kv.logkv(-s, np.sqrt(p * q))
+        log_h: np.ndarray = ((x - loc) * skew * (scale ** - 2)) \
+            + kv.logkv(-s, np.sqrt(p * q)) \
             - 0.5 * s * (np.log(p) + np.log(q))
-        )
         return log_c + log_h
 
+    def _logpdf_single(self, xi: float, *params) -> float:
+        return float(self._logpdf(np.asarray(xi, dtype=float), *params))
+
+    def _tabulation_guess(self, *params) -> tuple:
+        return params[-3], params[-2]
+
     def support(self, *params):
         return -np.inf, np.inf
 
@@ -54,8 +57,10 @@ class gh_gen(base_gen):
         return data.mean(), data.var()
 
     @staticmethod
-    def _exp_w_a(params: tuple, a: float) -> float:
+    def _exp_w_a(params: tuple, a: float) -> Union[float, np.ndarray]:
         """Calculates one of the moments of the distribution W, E[W^a].
+        chi and psi may be arrays, in which case the moment is evaluated
+        element-wise.
 
         Parameters
         ----------
@@ -66,16 +71,14 @@ class gh_gen(base_gen):
 
         Returns
         -------
-        exp_w_a : float
+        exp_w_a : Union[float, np.ndarray]
             E[W^a]
         """
         lamb, chi, psi = params[:3]
-        r: float = np.sqrt(chi * psi)
-        if r > 100:
-            # tends to 1 as r -> inf
-            bessel_val: float = 1.0
-        else:
-            bessel_val: float = kv.kv(lamb + a, r) / kv.kv(lamb, r)
+        r: Union[float, np.ndarray] = np.sqrt(chi * psi)
+        # bessel ratio tends to 1 as r -> inf
+        bessel_val: Union[float, np.ndarray] = np.where(
+            r > 100, 1.0, np.exp(kv.logkv(lamb + a, r) - kv.logkv(lamb, r)))
         return ((chi / psi) ** (a / 2)) * bessel_val
 
     @staticmethod
@@ -118,10 +121,15 @@ class gh_gen(base_gen):
         gamma: float = theta[-1]
         loc: float = mean - (exp_w * gamma)
         scale_sq: float = (var - (var_w * (gamma ** 2))) / exp_w
+        if np.ndim(scale_sq) > 0:
+            # population of thetas, with invalid members given a nan scale
+            scale: np.ndarray = np.sqrt(np.where(scale_sq > 0, scale_sq,
+                                                 np.nan))
+            return *theta[:3], loc, scale, gamma
         if scale_sq <= 0:
             return None
 
-        scale: float = scale_sq ** - 0.5
+        scale: float = scale_sq ** 0.5
         return *theta[:3], loc, scale, gamma
 
 
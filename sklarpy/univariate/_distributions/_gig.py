@@ -6,6 +6,8 @@ from scipy.stats._distn_infrastructure import _ShapeInfo
 import scipy.special
 
 from sklarpy.misc import kv
+from sklarpy.univariate._distributions._tabulated_cdf import TabulatedCdf, \
+    TableCache
 
 __all__ = ['_gig']
 
@@ -31,25 +33,60 @@ class gig_gen(rv_continuous):
         ipsi = _ShapeInfo("psi", False, (0, np.inf), (True, False))
         return [ilamb, ichi, ipsi]
 
-    def __pdf_single(self, xi: float, lamb: float, chi: float, psi: float
-                     ) -> float:
-        # k: float = scipy.special.kv(lamb, (chi * psi) ** 0.5)
-        k: float = kv.kv(lamb, (chi * psi) ** 0.5)
-        return float(
-            ((psi / chi) ** (lamb / 2))
-            * (xi ** (lamb - 1))
-            * np.exp(-0.5 * ((chi / xi) + (psi * xi)))
-            / (2 * k)
-        )
+    def _logpdf(self, x: np.ndarray, lamb: float, chi: float, psi: float
+                ) -> np.ndarray:
+        with np.errstate(divide='ignore'):
+            return (0.5 * lamb * (np.log(psi) - np.log(chi))) \
+                + ((lamb - 1) * np.log(x)) \
+                - 0.5 * ((chi / x) + (psi * x)) \
+                - np.log(2) - kv.logkv(lamb, (chi * psi) ** 0.5)
 
     def _pdf(self, x: np.ndarray, lamb: float, chi: float, psi: float
              ) -> np.ndarray:
-        return np.vectorize(self.__pdf_single,
-                            otypes=[float])(x, lamb, chi, psi)
+        return np.exp(self._logpdf(x, lamb, chi, psi))
+
+    @staticmethod
+    def _mode(lamb: float, chi: float, psi: float) -> float:
+        """Returns the mode of the distribution."""
+        if psi == 0:
+            return chi / (2 * (1 - lamb))
+        return ((lamb - 1) + np.sqrt(((lamb - 1) ** 2) + chi * psi)) / psi
+
+    def _tabulated(self, func_str: str, x: np.ndarray, lamb: np.ndarray,
+                   chi: np.ndarray, psi: np.ndarray) -> np.ndarray:
+        """Evaluates the cdf or ppf using a tabulated cdf for each unique set
+        of parameters. The most recently used tables are kept, so repeated
+        calls with the same parameters reuse them."""
+        x, lamb, chi, psi = np.broadcast_arrays(x, lamb, chi, psi)
+        params: np.ndarray = np.stack([lamb, chi, psi], axis=-1).reshape(
+            (-1, 3))
+        unique_params, inverse = np.unique(params, axis=0,
+                                           return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        values: np.ndarray = np.empty(x.size, dtype=float)
+        flat_x: np.ndarray = x.reshape(-1)
+        tables: TableCache = self.__dict__.setdefault('_tables', TableCache())
+        for k, params_k in enumerate(unique_params):
+            table: TabulatedCdf = tables.get(
+                params_k, lambda key: TabulatedCdf(
+                    pdf=lambda xi: self._pdf(xi, *key),
+                    support=(0.0, np.inf), center=self._mode(*key)))
+            mask: np.ndarray = inverse == k
+            values[mask] = getattr(table, func_str)(flat_x[mask])
+        return values.reshape(x.shape)
+
+    def _cdf(self, x: np.ndarray, lamb: float, chi: float, psi: float
+             ) -> np.ndarray:
+        return self._tabulated('cdf', x, lamb, chi, psi)
+
+    def _ppf(self, q: np.ndarray, lamb: float, chi: float, psi: float
+             ) -> np.ndarray:
+        return self._tabulated('ppf', q, lamb, chi, psi)
+
     def fit(self, data: np.ndarray) -> tuple:
         def neg_loglikelihood(params: np.ndarray):
-            pdf_vals: np.ndarray = self.pdf(data, *params)
-            return -np.sum(np.log(pdf_vals))
+            return -np.sum(self.logpdf(data, *params))
 
         res = scipy.optimize.fmin(neg_loglikelihood, x0=(1.0, 1.0, 1.0),
                                   disp=False)
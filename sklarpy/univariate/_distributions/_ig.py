@@ -22,22 +22,30 @@ class ig_gen(rv_continuous):
         ibeta = _ShapeInfo("beta", False, (0, np.inf), (False, False))
         return [ialpha, ibeta]
 
-    def __pdf_single(self, xi: float, alpha: float, beta: float) -> float:
-        return float(
-            (beta ** alpha)
-            * (xi ** - (alpha + 1))
-            * np.exp(-beta/xi)
-            / scipy.special.gamma(alpha)
-        )
+    def _logpdf(self, x: np.ndarray, alpha: float, beta: float
+                ) -> np.ndarray:
+        with np.errstate(divide='ignore'):
+            return (alpha * np.log(beta)) - ((alpha + 1) * np.log(x)) \
+                - (beta / x) - scipy.special.gammaln(alpha)
 
     def _pdf(self, x: np.ndarray, alpha: float, beta: float) -> np.ndarray:
-        return np.vectorize(self.__pdf_single, otypes=[float])(x, alpha, beta)
+        return np.exp(self._logpdf(x, alpha, beta))
+
+    def _cdf(self, x: np.ndarray, alpha: float, beta: float) -> np.ndarray:
+        with np.errstate(divide='ignore'):
+            return scipy.special.gammaincc(alpha, beta / x)
+
+    def _sf(self, x: np.ndarray, alpha: float, beta: float) -> np.ndarray:
+        with np.errstate(divide='ignore'):
+            return scipy.special.gammainc(alpha, beta / x)
+
+    def _ppf(self, q: np.ndarray, alpha: float, beta: float) -> np.ndarray:
+        return beta / scipy.special.gammainccinv(alpha, q)
 
     def fit(self, data: np.ndarray) -> tuple:
         def neg_loglikelihood(params: np.ndarray):
             alpha, beta = params
-            pdf_vals: np.ndarray = self.pdf(data, alpha, beta)
-            return -np.sum(np.log(pdf_vals))
+            return -np.sum(self.logpdf(data, alpha, beta))
 
         res = scipy.optimize.fmin(neg_loglikelihood, x0=(1.0, 1.0), disp=False)
         return tuple(res)
@@ -4,45 +4,117 @@ import numpy as np
 import scipy.stats
 from typing import Callable
 from functools import partial
-import scipy.interpolate
 
 from sklarpy.univariate._distributions._numerical_wrappers import \
     NumericalWrappers
 
 __all__ = ['kde_fit']
 
+_NUM_GRID_POINTS: int = 2 ** 14  # number of points in the kde's grid
+_NUM_BANDWIDTHS: float = 6.0  # kernel truncation and grid padding
 
-def kde_cdf(x, kde):
-    """calculates the cdf of a fitted gaussian kde"""
-    return np.array([kde.integrate_box_1d(-np.inf, v) for v in x])
 
+def linear_binning(data: np.ndarray, grid_min: float, delta: float,
+                   num_points: int) -> np.ndarray:
+    """Linearly bins data onto a regular grid, splitting each observation
+    between its two neighbouring grid points in proportion to its distance
+    from each.
 
-def kde_rvs(kde, size: tuple):
-    """A function used to ensure the output of the gaussian_kde rvs function
-    is correct.
+    Parameters
+    ----------
+    data: np.ndarray
+        The flattened sample.
+    grid_min: float
+        The first point of the grid.
+    delta: float
+        The spacing of the grid.
+    num_points: int
+        The number of points in the grid.
+
+    Returns
+    -------
+    counts: np.ndarray
+        The (fractional) number of observations assigned to each grid point.
+    """
+    position: np.ndarray = (data - grid_min) / delta
+    idx: np.ndarray = np.clip(np.floor(position).astype(np.int64), 0,
+                              num_points - 2)
+    frac: np.ndarray = np.clip(position - idx, 0.0, 1.0)
+    return np.bincount(idx, 1 - frac, num_points) \
+        + np.bincount(idx + 1, frac, num_points)
+
+
+def binned_kde_pdf(counts: np.ndarray, delta: float, bandwidth: float
+                   ) -> np.ndarray:
+    """Evaluates a gaussian kde at the points of a grid, by convolving the
+    binned counts with the kernel using the FFT.
+
+    Parameters
+    ----------
+    counts: np.ndarray
+        The number of observations assigned to each grid point.
+    delta: float
+        The spacing of the grid.
+    bandwidth: float
+        The standard deviation of the gaussian kernel.
+
+    Returns
+    -------
+    pdf_values: np.ndarray
+        The kde's pdf at each grid point.
+    """
+    num_points: int = counts.size
+    half_width: int = int(min(np.ceil(_NUM_BANDWIDTHS * bandwidth / delta),
+                              num_points - 1))
+    kernel: np.ndarray = scipy.stats.norm.pdf(
+        np.arange(-half_width, half_width + 1) * delta / bandwidth) \
+        / bandwidth
+
+    # zero-padding to a power of 2, so the convolution is linear
+    fft_size: int = 1 << int(np.ceil(np.log2(num_points + 2 * half_width)))
+    convolved: np.ndarray = np.fft.irfft(
+        np.fft.rfft(counts, fft_size) * np.fft.rfft(kernel, fft_size),
+        fft_size)[half_width: half_width + num_points]
+    return np.clip(convolved, 0.0, None) / counts.sum()
+
+
+def kde_rvs(size: tuple, data: np.ndarray, bandwidth: float) -> np.ndarray:
+    """Samples a gaussian kde, by perturbing observations chosen uniformly
+    from the data with gaussian noise.
 
     Parameters
     ----------
-    kde:
-        A scipy.stats.gaussian_kde fitted to data
     size: tuple
         The size/dimensions of the random variables to generate.
+    data: np.ndarray
+        The sample the kde was fitted to.
+    bandwidth: float
+        The standard deviation of the gaussian kernel.
 
     Returns
     -------
     rvs: np.ndarray
         rvs
     """
-    num_to_generate: int = 1
-    for dim in size:
-        num_to_generate *= dim
-    return kde.resample(num_to_generate).reshape(size)
+    num_to_generate: int = int(np.prod(size))
+    idx: np.ndarray = np.random.randint(0, data.size, num_to_generate)
+    rvs: np.ndarray = data[idx] \
+        + np.random.normal(0, bandwidth, num_to_generate)
+    return rvs.reshape(size)
 
 
 def kde_fit(data: np.ndarray) -> tuple:
     """Fitting function for a univariate gaussian kernel density estimator
     distribution.
 
+    The kde is binned: the data is linearly binned onto a regular grid
+    extending several bandwidths beyond its range, and convolved with the
+    gaussian kernel using the FFT, giving the pdf on the grid in
+    O(n + G log G) time. The cdf on the grid is its cumulative integral and
+    the ppf the inverse of this table, with all three interpolated linearly
+    between grid points. The bandwidth is given by Scott's rule, as in
+    scipy.stats.gaussian_kde.
+
     Parameters
     ----------
     data : np.ndarray
@@ -55,20 +127,35 @@ def kde_fit(data: np.ndarray) -> tuple:
         fitted pdf, cdf, ppf, support, rvs functions
     """
     xmin, xmax = data.min(), data.max()
-
-    kde = scipy.stats.gaussian_kde(data)
-    cdf_: Callable = partial(kde_cdf, kde=kde)
+    bandwidth: float = float(np.std(data, ddof=1)) * data.size ** (-1 / 5)
+    if not (np.isfinite(bandwidth) and bandwidth > 0):
+        raise ValueError("cannot fit a gaussian kde to data with zero "
+                         "variance.")
+
+    # evaluating the kde on a grid
+    padding: float = _NUM_BANDWIDTHS * bandwidth
+    grid: np.ndarray = np.linspace(xmin - padding, xmax + padding,
+                                   _NUM_GRID_POINTS)
+    delta: float = grid[1] - grid[0]
+    counts: np.ndarray = linear_binning(data, grid[0], delta,
+                                        _NUM_GRID_POINTS)
+    pdf_grid: np.ndarray = binned_kde_pdf(counts, delta, bandwidth)
+    cdf_grid: np.ndarray = np.concatenate([
+        [0.0], np.cumsum((pdf_grid[1:] + pdf_grid[:-1]) * delta / 2)])
+    cdf_grid /= cdf_grid[-1]
 
     # fitting our distribution functions
-    pdf: Callable = partial(NumericalWrappers.numerical_pdf, pdf_=kde.pdf)
+    pdf_: Callable = partial(np.interp, xp=grid, fp=pdf_grid, left=0.0,
+                             right=0.0)
+    cdf_: Callable = partial(np.interp, xp=grid, fp=cdf_grid, left=0.0,
+                             right=1.0)
+    pdf: Callable = partial(NumericalWrappers.numerical_pdf, pdf_=pdf_)
     cdf: Callable = partial(NumericalWrappers.numerical_cdf, cdf_=cdf_,
                             xmin=xmin, xmax=xmax)
 
     F_xmin, F_xmax = cdf(np.array([xmin, xmax]))
-    empirical_range: np.ndarray = np.linspace(xmin, xmax, 100)
-    ppf_: Callable = scipy.interpolate.interp1d(
-        cdf(empirical_range), empirical_range, 'linear', bounds_error=False
-    )
+    unique_cdf, idx = np.unique(cdf_grid, return_index=True)
+    ppf_: Callable = partial(np.interp, xp=unique_cdf, fp=grid[idx])
     ppf: Callable = partial(
         NumericalWrappers.numerical_ppf, ppf_=ppf_, xmin=xmin,
         xmax=xmax, F_xmin=F_xmin, F_xmax=F_xmax
@@ -76,6 +163,6 @@ def kde_fit(data: np.ndarray) -> tuple:
     support: Callable = partial(
         NumericalWrappers.numerical_support, xmin=xmin, xmax=xmax
     )
-    rvs: Callable = partial(kde_rvs, kde=kde)
+    rvs: Callable = partial(kde_rvs, data=data.copy(), bandwidth=bandwidth)
 
     return pdf, cdf, ppf, support, rvs
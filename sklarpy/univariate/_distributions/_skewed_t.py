@@ -19,27 +19,23 @@ class skewed_t_gen(gh_gen):
     def _argcheck(self, params) -> None:
         base_gen._argcheck(self, params)
 
-        if not (params[0] > 0) and (params[2] > 0):
+        if not ((params[0] > 0) and (params[2] > 0)):
             raise ValueError("dof and scale parameters must be strictly "
                              "positive.")
 
-    def _logpdf_single(self, xi: float, dof: float, loc: float, scale: float,
-                       skew: float) -> float:
-        q: float = dof + (((xi - loc) * scale) ** 2)
+    def _logpdf(self, x: np.ndarray, dof: float, loc: float, scale: float,
+                skew: float) -> np.ndarray:
+        q: np.ndarray = dof + (((x - loc) / scale) ** 2)
         p: float = (skew / scale) ** 2
         s: float = 0.5 * (1 + dof)
-        m: float = np.sqrt(q * p)
+        m: np.ndarray = np.sqrt(q * p)
 
-        log_c: float = float(
-            ((1 - s) * np.log(2))
-            - scipy.special.loggamma(dof / 2)
+        log_c: float = ((1 - s) * np.log(2)) \
+            - scipy.special.loggamma(dof / 2) \
             - 0.5 * np.log(np.pi * dof * (scale ** 2))
-        )
-        log_h: float = float(
-            ((xi - loc) * skew * (scale ** -2))
-            + kv.logkv(s, m)
+        log_h: np.ndarray = ((x - loc) * skew * (scale ** -2)) \
+            + kv.logkv(s, m) \
             - s * (np.log(q / dof) - np.log(m))
-        )
         return log_c + log_h
 
     @staticmethod
@@ -60,7 +56,8 @@ class skewed_t_gen(gh_gen):
     def _theta_to_params(self, theta: np.ndarray, mean: np.ndarray, var: float
                          ) -> tuple:
         dof, gamma = theta
-        gh_theta: np.ndarray = np.array([-0.5 * dof, dof, 0, gamma])
+        gh_theta: np.ndarray = np.stack(np.broadcast_arrays(
+            -0.5 * dof, dof, 0.0, gamma))
         gh_params = super()._theta_to_params(gh_theta, mean, var)
 
         if gh_params is None:
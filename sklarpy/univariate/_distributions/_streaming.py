@@ -0,0 +1,247 @@
+# Contains code for fitting numerical distributions to summaries of samples
+# too large to hold in memory
+import numpy as np
+import scipy.stats
+from typing import Callable
+from functools import partial
+
+from sklarpy.univariate._distributions._numerical_wrappers import \
+    NumericalWrappers
+from sklarpy.univariate._distributions._discrete_empirical import \
+    discrete_empirical_pdf
+
+__all__ = ['sketch_empirical_fit', 'sketch_discrete_empirical_fit',
+           'binned_kde_fit']
+
+_CHUNK_SIZE: int = 1024  # number of points to evaluate binned kdes at once
+_NUM_PPF_POINTS: int = 1000  # number of points to interpolate kde ppfs with
+
+
+def _step_cdf(x, values: np.ndarray, cumulative: np.ndarray) -> np.ndarray:
+    """the cdf function for a discrete distribution with the given
+    cumulative probabilities at values."""
+    idx: np.ndarray = np.searchsorted(values, np.asarray(x), side='right')
+    return np.where(idx > 0, cumulative[np.clip(idx - 1, 0, None)], 0.0)
+
+
+def _step_ppf(q, values: np.ndarray, cumulative: np.ndarray) -> np.ndarray:
+    """the ppf function for a discrete distribution with the given
+    cumulative probabilities at values."""
+    idx: np.ndarray = np.searchsorted(cumulative, np.asarray(q), side='left')
+    return values[np.clip(idx, 0, values.size - 1)]
+
+
+def _combine_weights(items: np.ndarray, weights: np.ndarray) -> tuple:
+    """Returns the unique items of a weighted sample and their cumulative
+    probabilities."""
+    values, inverse = np.unique(items, return_inverse=True)
+    counts: np.ndarray = np.bincount(inverse, weights=weights)
+    return values, counts, np.cumsum(counts) / counts.sum()
+
+
+def sketch_empirical_fit(items: np.ndarray, weights: np.ndarray, xmin: float,
+                         xmax: float, window: float = 0.02) -> tuple:
+    """Fitting function for a univariate continuous empirical distribution,
+    backed by a quantile sketch of the sample.
+
+    The pdf at each item of the sketch is the probability mass of a window
+    of quantiles around it, divided by the width of that window. This
+    averages out the rank errors of the sketch, which differentiating the
+    cdf over a fixed step would amplify.
+
+    Parameters
+    ----------
+    items: np.ndarray
+        The sorted observations held in the quantile sketch.
+    weights: np.ndarray
+        The number of observations of the sample each item represents.
+    xmin: float
+        The smallest observation of the sample.
+    xmax: float
+        The largest observation of the sample.
+    window: float
+        The probability mass of the window of quantiles used to calculate
+        pdf values. Should be several times the rank error of the sketch.
+        Default is 0.02.
+
+    Returns
+    --------
+    fitted_funcs: tuple
+        fitted pdf, cdf, ppf, support, rvs functions
+    """
+    knots, _, cumulative = _combine_weights(items, weights)
+
+    # extending the sketch to the exact range of the sample
+    values: np.ndarray = knots
+    if xmin < values[0]:
+        values, cumulative = np.append(xmin, values), \
+            np.append(0.0, cumulative)
+    if xmax > values[-1]:
+        values, cumulative = np.append(values, xmax), \
+            np.append(cumulative, 1.0)
+
+    # calculating empirical cdf
+    cdf_: Callable = partial(np.interp, xp=values, fp=cumulative)
+    cdf: Callable = partial(
+        NumericalWrappers.numerical_cdf, cdf_=cdf_, xmin=xmin, xmax=xmax
+    )
+
+    # calculating empirical ppf
+    unique_cumulative, idx = np.unique(cumulative, return_index=True)
+    ppf_: Callable = partial(np.interp, xp=unique_cumulative,
+                             fp=values[idx])
+    F_xmin, F_xmax = cdf(np.array([xmin, xmax]))
+    ppf: Callable = partial(
+        NumericalWrappers.numerical_ppf, ppf_=ppf_, xmin=xmin,
+        xmax=xmax, F_xmin=F_xmin, F_xmax=F_xmax
+    )
+
+    # calculating empirical pdf
+    knots_cdf: np.ndarray = cdf_(knots)
+    lower: np.ndarray = np.clip(knots_cdf - window / 2, 0.0, 1.0 - window)
+    upper: np.ndarray = lower + window
+    with np.errstate(divide='ignore', invalid='ignore'):
+        knots_pdf: np.ndarray = window / (ppf_(upper) - ppf_(lower))
+    knots_pdf = np.where(np.isfinite(knots_pdf), knots_pdf, 0.0)
+    pdf_: Callable = partial(np.interp, xp=knots, fp=knots_pdf, left=0.0,
+                             right=0.0)
+    pdf: Callable = partial(NumericalWrappers.numerical_pdf, pdf_=pdf_)
+
+    # empirical support
+    support: Callable = partial(
+        NumericalWrappers.numerical_support, xmin=xmin, xmax=xmax
+    )
+    return pdf, cdf, ppf, support, None
+
+
+def sketch_discrete_empirical_fit(items: np.ndarray, weights: np.ndarray,
+                                  xmin: int, xmax: int) -> tuple:
+    """Fitting function for a univariate discrete empirical distribution,
+    backed by a quantile sketch of the sample.
+
+    Parameters
+    ----------
+    items: np.ndarray
+        The sorted observations held in the quantile sketch.
+    weights: np.ndarray
+        The number of observations of the sample each item represents.
+    xmin: int
+        The smallest observation of the sample.
+    xmax: int
+        The largest observation of the sample.
+
+    Returns
+    --------
+    fitted_funcs: tuple
+        fitted pdf, cdf, ppf, support, rvs functions
+    """
+    values, counts, cumulative = _combine_weights(items, weights)
+    pdf_: Callable = partial(discrete_empirical_pdf, values=values,
+                             counts=counts, N=counts.sum())
+    pdf: Callable = partial(NumericalWrappers.numerical_pdf, pdf_=pdf_)
+    cdf_: Callable = partial(_step_cdf, values=values, cumulative=cumulative)
+    cdf: Callable = partial(
+        NumericalWrappers.numerical_cdf, cdf_=cdf_, xmin=xmin, xmax=xmax
+    )
+    F_xmin, F_xmax = cdf(np.array([xmin, xmax]))
+    ppf_: Callable = partial(_step_ppf, values=values, cumulative=cumulative)
+    ppf: Callable = partial(
+        NumericalWrappers.numerical_ppf, ppf_=ppf_, xmin=xmin,
+        xmax=xmax, F_xmin=F_xmin, F_xmax=F_xmax
+    )
+    support: Callable = partial(
+        NumericalWrappers.numerical_support, xmin=xmin, xmax=xmax
+    )
+    return pdf, cdf, ppf, support, None
+
+
+def _binned_kde_eval(x, centers: np.ndarray, probs: np.ndarray,
+                     bandwidth: float, kernel: Callable) -> np.ndarray:
+    """Evaluates a mixture of kernels centered on the bins of a histogram,
+    in chunks to bound memory use."""
+    x = np.asarray(x, dtype=float)
+    flat_x: np.ndarray = x.reshape(-1)
+    values: np.ndarray = np.empty(flat_x.shape)
+    for start in range(0, flat_x.size, _CHUNK_SIZE):
+        z: np.ndarray = (flat_x[start: start + _CHUNK_SIZE, None] - centers) \
+            / bandwidth
+        values[start: start + _CHUNK_SIZE] = kernel(z) @ probs
+    return values.reshape(x.shape)
+
+
+def _binned_kde_rvs(size: tuple, centers: np.ndarray, probs: np.ndarray,
+                    width: float, bandwidth: float) -> np.ndarray:
+    """Samples a binned kde, by jittering the bins chosen uniformly within
+    each bin and by a gaussian kernel."""
+    num_to_generate: int = int(np.prod(size))
+    bins: np.ndarray = np.random.choice(centers.size, num_to_generate,
+                                        p=probs)
+    rvs: np.ndarray = centers[bins] \
+        + np.random.uniform(-width / 2, width / 2, num_to_generate) \
+        + np.random.normal(0, bandwidth, num_to_generate)
+    return rvs.reshape(size)
+
+
+def binned_kde_fit(centers: np.ndarray, counts: np.ndarray, width: float,
+                   std: float, xmin: float, xmax: float) -> tuple:
+    """Fitting function for a univariate gaussian kernel density estimator
+    distribution, fitted to a histogram of the sample.
+
+    Each bin contributes a gaussian kernel at its center, weighted by its
+    count. The bandwidth is given by Scott's rule, with the variance of the
+    observations within each bin, width^2 / 12, added to the kernel variance.
+
+    Parameters
+    ----------
+    centers: np.ndarray
+        The centers of the bins of the histogram.
+    counts: np.ndarray
+        The number of observations in each bin.
+    width: float
+        The width of each bin.
+    std: float
+        The standard deviation of the sample.
+    xmin: float
+        The smallest observation of the sample.
+    xmax: float
+        The largest observation of the sample.
+
+    Returns
+    -------
+    fitted_funcs: tuple
+        fitted pdf, cdf, ppf, support, rvs functions
+    """
+    num_data_points: float = counts.sum()
+    nonzero: np.ndarray = counts > 0
+    centers, probs = centers[nonzero], counts[nonzero] / num_data_points
+
+    scott_bandwidth: float = std * num_data_points ** (-1 / 5)
+    bandwidth: float = np.sqrt(scott_bandwidth ** 2 + width ** 2 / 12)
+
+    pdf_: Callable = partial(
+        _binned_kde_eval, centers=centers, probs=probs / bandwidth,
+        bandwidth=bandwidth, kernel=scipy.stats.norm.pdf)
+    cdf_: Callable = partial(
+        _binned_kde_eval, centers=centers, probs=probs,
+        bandwidth=bandwidth, kernel=scipy.stats.norm.cdf)
+
+    # fitting our distribution functions
+    pdf: Callable = partial(NumericalWrappers.numerical_pdf, pdf_=pdf_)
+    cdf: Callable = partial(NumericalWrappers.numerical_cdf, cdf_=cdf_,
+                            xmin=xmin, xmax=xmax)
+
+    F_xmin, F_xmax = cdf(np.array([xmin, xmax]))
+    empirical_range: np.ndarray = np.linspace(xmin, xmax, _NUM_PPF_POINTS)
+    empirical_cdf, idx = np.unique(cdf(empirical_range), return_index=True)
+    ppf_: Callable = partial(np.interp, xp=empirical_cdf,
+                             fp=empirical_range[idx])
+    ppf: Callable = partial(
+        NumericalWrappers.numerical_ppf, ppf_=ppf_, xmin=xmin,
+        xmax=xmax, F_xmin=F_xmin, F_xmax=F_xmax
+    )
+    support: Callable = partial(
+        NumericalWrappers.numerical_support, xmin=xmin, xmax=xmax
+    )
+    rvs: Callable = partial(_binned_kde_rvs, centers=centers, probs=probs,
+                            width=width, bandwidth=bandwidth)
+    return pdf, cdf, ppf, support, rvs
@@ -0,0 +1,341 @@
+# Contains code for tabulating the cdf of continuous univariate distributions
+import numpy as np
+from collections import OrderedDict
+import scipy.integrate
+import scipy.optimize
+from typing import Callable, Union
+
+__all__ = ['TabulatedCdf', 'TableCache']
+
+
+class TabulatedCdf:
+    """Tabulates the cdf of a continuous univariate distribution in a single
+    pass over its pdf.
+
+    The pdf is interpolated by Legendre polynomials on each panel of a grid
+    which is sinh spaced for distributions supported on the real line and log
+    spaced for distributions supported on a half-line, with the grid centered
+    on the mode of the distribution. These interpolants are integrated
+    exactly, so the cdf can be evaluated on whole arrays without any further
+    pdf evaluations, with the ppf obtained by inverting the tabulated cdf and
+    refining with safeguarded Newton steps. Values outside the grid fall back
+    to numerical integration / root finding.
+    """
+    _NUM_PANELS: int = 400
+    _NUM_LOCATE_POINTS: int = 801
+    _MAX_NEWTON_STEPS: int = 20
+    _NEWTON_TOL: float = 10 ** -12
+    _SINH_RANGE: float = 12.0
+    _LOG_RANGE: float = 40.0
+    _DEGREE: int = 9
+
+    def __init__(self, pdf: Callable, support: tuple, center: float,
+                 scale: float = 1.0):
+        """Tabulates the cdf of a continuous univariate distribution.
+
+        Parameters
+        ----------
+        pdf: Callable
+            The pdf function of the distribution. Must accept and return numpy
+            arrays.
+        support: tuple
+            The support of the distribution. Must be either the real line or
+            a half-line of the form (left, inf).
+        center: float
+            An initial guess of the location of the mode of the distribution.
+        scale: float
+            An initial guess of the scale of the distribution. Only used for
+            distributions supported on the real line.
+            Default is 1.0.
+        """
+        left, right = support
+        if not np.isposinf(right):
+            raise ValueError("support must be the real line or a half-line "
+                             "of the form (left, inf).")
+        self._pdf: Callable = pdf
+        self._left: float = float(left)
+        self._right: float = float(right)
+        self._half_line: bool = not np.isneginf(left)
+        self._u_range: float = self._LOG_RANGE if self._half_line \
+            else self._SINH_RANGE
+
+        # initial guesses
+        self._center: float = max(float(center) - self._left, 1.0) \
+            if self._half_line else float(center)
+        self._scale: float = float(scale) if (np.isfinite(scale) and
+                                              scale > 0) else 1.0
+        if not np.isfinite(self._center):
+            self._center = 1.0 if self._half_line else 0.0
+
+        # locating the mode twice, refining the grid each time
+        for _ in range(2):
+            self._locate()
+
+        # interpolating the pdf on each panel at the Gauss-Legendre nodes
+        self._u_edges: np.ndarray = np.linspace(
+            -self._u_range, self._u_range, self._NUM_PANELS + 1)
+        self._half_width: float = 0.5 * (self._u_edges[1] - self._u_edges[0])
+        nodes, _ = np.polynomial.legendre.leggauss(self._DEGREE + 1)
+        u: np.ndarray = self._u_edges[:-1, None] \
+            + self._half_width * (nodes + 1)
+        vander: np.ndarray = np.polynomial.legendre.legvander(nodes,
+                                                              self._DEGREE)
+        self._pdf_coefs: np.ndarray = np.linalg.solve(
+            vander, self._integrand(u).T)
+        self._cdf_coefs: np.ndarray = self._half_width * \
+            np.polynomial.legendre.legint(self._pdf_coefs, lbnd=-1)
+
+        # tabulating the cdf
+        self._x_min: float = float(self._x(self._u_edges[0]))
+        self._x_max: float = float(self._x(self._u_edges[-1]))
+        panels: np.ndarray = np.polynomial.legendre.legval(
+            1.0, self._cdf_coefs)
+        left_mass: float = self._quad(self._left, self._x_min)
+        self._cdf_edges: np.ndarray = left_mass + np.concatenate(
+            [[0.0], np.cumsum(panels)])
+
+    def _x(self, u: np.ndarray) -> np.ndarray:
+        """Maps grid coordinates to the support of the distribution."""
+        if self._half_line:
+            return self._left + self._center * np.exp(u)
+        return self._center + self._scale * np.sinh(u)
+
+    def _u(self, x: np.ndarray) -> np.ndarray:
+        """Maps the support of the distribution to grid coordinates."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self._half_line:
+                return np.log((x - self._left) / self._center)
+            return np.arcsinh((x - self._center) / self._scale)
+
+    def _integrand(self, u: np.ndarray) -> np.ndarray:
+        """The pdf of the distribution with respect to grid coordinates."""
+        if self._half_line:
+            dxdu: np.ndarray = self._center * np.exp(u)
+        else:
+            dxdu: np.ndarray = self._scale * np.cosh(u)
+        with np.errstate(all='ignore'):
+            values: np.ndarray = np.asarray(self._pdf(self._x(u)),
+                                            dtype=float) * dxdu
+        return np.where(np.isfinite(values), values, 0.0)
+
+    def _locate(self) -> None:
+        """Moves the center of the grid to the mode of the distribution and,
+        for distributions on the real line, sets the scale of the grid to that
+        of a normal distribution with the same modal density."""
+        u: np.ndarray = np.linspace(-self._u_range, self._u_range,
+                                    self._NUM_LOCATE_POINTS)
+        x: np.ndarray = self._x(u)
+        if self._half_line:
+            density: np.ndarray = self._integrand(u)
+        else:
+            with np.errstate(all='ignore'):
+                density: np.ndarray = np.asarray(self._pdf(x), dtype=float)
+            density = np.where(np.isfinite(density), density, 0.0)
+
+        if not np.any(density > 0):
+            return
+        mode: float = float(x[np.argmax(density)])
+        if self._half_line:
+            self._center = max(mode - self._left, np.finfo(float).tiny)
+        else:
+            self._center = mode
+            self._scale = float(1 / (np.sqrt(2 * np.pi) * density.max()))
+
+    def _quad(self, a: float, b: float) -> float:
+        """Integrates the pdf between a and b, using adaptive quadrature."""
+        if b <= a:
+            return 0.0
+        return float(scipy.integrate.quad(
+            lambda xi: float(np.nan_to_num(self._pdf(np.asarray(xi)))),
+            a, b)[0])
+
+    def _panel_coord(self, u: np.ndarray, i: np.ndarray) -> np.ndarray:
+        """Maps grid coordinates u lying in panels i to [-1, 1]."""
+        return (u - self._u_edges[i]) / self._half_width - 1
+
+    def _cdf_in_panel(self, u: np.ndarray, i: np.ndarray) -> np.ndarray:
+        """Evaluates the cdf at grid coordinates u lying in panels i."""
+        return self._cdf_edges[i] + np.polynomial.legendre.legval(
+            self._panel_coord(u, i), self._cdf_coefs[:, i], tensor=False)
+
+    def _pdf_in_panel(self, u: np.ndarray, i: np.ndarray) -> np.ndarray:
+        """Evaluates the pdf with respect to grid coordinates u lying in
+        panels i."""
+        return np.polynomial.legendre.legval(
+            self._panel_coord(u, i), self._pdf_coefs[:, i], tensor=False)
+
+    def _panel(self, u: np.ndarray) -> np.ndarray:
+        """Returns the index of the panel containing each grid coordinate."""
+        return np.clip(np.searchsorted(self._u_edges, u, side='right') - 1,
+                       0, self._NUM_PANELS - 1)
+
+    def _tail_cdf(self, xi: float) -> float:
+        """Evaluates the cdf at a point lying outside the grid."""
+        if xi <= self._left:
+            return 0.0
+        elif xi < self._x_min:
+            return self._quad(self._left, xi)
+        return self._cdf_edges[-1] + self._quad(self._x_max, xi)
+
+    def _tail_ppf(self, qi: float) -> float:
+        """Evaluates the ppf at a quantile lying outside the grid."""
+        def to_solve(xi: float) -> float:
+            return self._tail_cdf(xi) - qi
+
+        # expanding outwards from the grid until qi is bracketed
+        lower_tail: bool = qi < self._cdf_edges[0]
+        direction: float = -1.0 if lower_tail else 1.0
+        bound: float = self._left if lower_tail else self._right
+        inner: float = self._u_edges[0] if lower_tail else self._u_edges[-1]
+        step: float = 1.0
+        outer: float = inner + direction * step
+        while True:
+            x_outer: float = float(self._x(outer))
+            if (not np.isfinite(x_outer)) or (x_outer == bound):
+                return bound
+            elif direction * to_solve(x_outer) >= 0:
+                break
+            inner, step = outer, 2 * step
+            outer = inner + direction * step
+        return scipy.optimize.brentq(
+            to_solve, *sorted((float(self._x(inner)), x_outer)))
+
+    def cdf(self, x: Union[float, int, np.ndarray]) -> np.ndarray:
+        """The cumulative distribution function.
+
+        Parameters
+        ----------
+        x: Union[float, int, np.ndarray]
+            The value/values to calculate the cdf values, P(X<=x) of.
+
+        Returns
+        -------
+        cdf_values: np.ndarray
+            An array of cdf values.
+        """
+        x = np.asarray(x, dtype=float)
+        flat_x: np.ndarray = x.flatten()
+        u: np.ndarray = self._u(flat_x)
+        inside: np.ndarray = (u >= self._u_edges[0]) \
+            & (u <= self._u_edges[-1])
+
+        cdf_values: np.ndarray = np.full(flat_x.shape, np.nan)
+        cdf_values[flat_x <= self._left] = 0.0
+        cdf_values[flat_x >= self._right] = 1.0
+        cdf_values[inside] = self._cdf_in_panel(u[inside],
+                                                self._panel(u[inside]))
+        outside: np.ndarray = ~inside & (flat_x > self._left) \
+            & (flat_x < self._right)
+        cdf_values[outside] = [self._tail_cdf(xi) for xi in flat_x[outside]]
+        return np.clip(cdf_values, 0.0, 1.0).reshape(x.shape)
+
+    def ppf(self, q: Union[float, int, np.ndarray]) -> np.ndarray:
+        """The cumulative inverse / quartile function.
+
+        Parameters
+        ----------
+        q: Union[float, int, np.ndarray]
+            The quartile values to calculate cdf^-1(q) of.
+
+        Returns
+        -------
+        ppf_values: np.ndarray
+            An array of quantile values.
+        """
+        q = np.asarray(q, dtype=float)
+        flat_q: np.ndarray = q.flatten()
+        ppf_values: np.ndarray = np.full(flat_q.shape, np.nan)
+        ppf_values[flat_q == 0.0] = self._left
+        ppf_values[flat_q == 1.0] = self._right
+
+        valid: np.ndarray = (flat_q > 0.0) & (flat_q < 1.0)
+        inside: np.ndarray = valid & (flat_q >= self._cdf_edges[0]) \
+            & (flat_q <= self._cdf_edges[-1])
+
+        # initial guess from linear interpolation within each panel
+        qi: np.ndarray = flat_q[inside]
+        i: np.ndarray = np.clip(
+            np.searchsorted(self._cdf_edges, qi, side='right') - 1,
+            0, self._NUM_PANELS - 1)
+        lower, upper = self._u_edges[i], self._u_edges[i + 1]
+        mass: np.ndarray = self._cdf_edges[i + 1] - self._cdf_edges[i]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight: np.ndarray = np.where(
+                mass > 0, (qi - self._cdf_edges[i]) / mass, 0.5)
+        u: np.ndarray = lower + weight * (upper - lower)
+
+        # Newton refinement, kept within each panel
+        active: np.ndarray = np.ones(u.shape, dtype=bool)
+        for _ in range(self._MAX_NEWTON_STEPS):
+            error: np.ndarray = self._cdf_in_panel(u[active], i[active]) \
+                - qi[active]
+            derivative: np.ndarray = self._pdf_in_panel(u[active],
+                                                        i[active])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                step: np.ndarray = np.where(derivative > 0,
+                                            error / derivative, 0.0)
+            u[active] = np.clip(u[active] - step, lower[active],
+                                upper[active])
+            active[active] = np.abs(step) > self._NEWTON_TOL
+            if not active.any():
+                break
+        ppf_values[inside] = self._x(u)
+
+        outside: np.ndarray = valid & ~inside
+        ppf_values[outside] = [self._tail_ppf(qi) for qi in flat_q[outside]]
+        return ppf_values.reshape(q.shape)
+
+
+class TableCache:
+    """A least recently used cache of tabulated cdfs, keyed by the parameters
+    of the distribution, so repeated calls with the same parameters reuse
+    their tables. Tables are not pickled or copied with their owner."""
+
+    def __init__(self, max_size: int = 16):
+        """A least recently used cache of tabulated cdfs.
+
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of tables kept.
+            Default is 16.
+        """
+        self._max_size: int = max_size
+        self._tables: OrderedDict = OrderedDict()
+
+    def __getstate__(self) -> dict:
+        return {'_max_size': self._max_size}
+
+    def __setstate__(self, state: dict) -> None:
+        self._max_size = state['_max_size']
+        self._tables = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def get(self, params: tuple, tabulate: Callable) -> TabulatedCdf:
+        """Returns the tabulated cdf for the given parameters, tabulating and
+        storing it if not already kept.
+
+        Parameters
+        ----------
+        params: tuple
+            The parameters of the distribution.
+        tabulate: Callable
+            A function taking the parameters and returning their TabulatedCdf.
+
+        Returns
+        -------
+        table: TabulatedCdf
+            The tabulated cdf.
+        """
+        key: tuple = tuple(float(param) for param in params)
+        if key in self._tables:
+            self._tables.move_to_end(key)
+            return self._tables[key]
+
+        table: TabulatedCdf = tabulate(key)
+        self._tables[key] = table
+        if len(self._tables) > self._max_size:
+            self._tables.popitem(last=False)
+        return table
@@ -0,0 +1,78 @@
+# Contains code for sharing a sample between the distributions fitted to it
+import numpy as np
+import pandas as pd
+from typing import Union, Iterable
+
+from sklarpy.utils._input_handlers import check_univariate_data, \
+    check_array_datatype
+from sklarpy.univariate._distributions import discrete_empirical_fit, \
+    continuous_empirical_fit
+
+__all__ = ['FitContext']
+
+
+class FitContext:
+    """Holds a validated univariate sample and the empirical distributions
+    fitted to it, so these are only calculated once when fitting many
+    distributions to the same sample."""
+
+    def __init__(self, data: Union[pd.DataFrame, pd.Series, np.ndarray,
+                                   Iterable]):
+        """Holds a validated univariate sample and the empirical distributions
+        fitted to it.
+
+        Parameters
+        ----------
+        data : Union[pd.DataFrame, pd.Series, np.ndarray, Iterable]
+            The sample distributions are being fitted to.
+            Can be a pd.DataFrame, pd.Series, np.ndarray or any other iterable
+            containing data.
+        """
+        self._data: np.ndarray = check_univariate_data(data)
+        self._datatype = check_array_datatype(self._data)
+        self._fitted_domain: tuple = (self._data.min(), self._data.max())
+        self._empirical: dict = {}
+
+    def empirical(self, continuous_or_discrete: str) -> tuple:
+        """Returns the empirical distribution of the sample, fitting it if
+        this has not already been done.
+
+        Parameters
+        ----------
+        continuous_or_discrete: str
+            'continuous' or 'discrete'. The type of empirical distribution to
+            return.
+
+        Returns
+        -------
+        empirical: tuple
+            The empirical pdf, cdf and ppf functions, followed by the empirical
+            pdf values of the sample.
+        """
+        if continuous_or_discrete not in self._empirical:
+            if continuous_or_discrete == 'continuous':
+                empirical_fit = continuous_empirical_fit
+            elif continuous_or_discrete == 'discrete':
+                empirical_fit = discrete_empirical_fit
+            else:
+                raise ValueError("continuous_or_discrete must be 'continuous' "
+                                 "or 'discrete'.")
+            pdf, cdf, ppf, _, _ = empirical_fit(self._data)
+            self._empirical[continuous_or_discrete] = (pdf, cdf, ppf,
+                                                       pdf(self._data))
+        return self._empirical[continuous_or_discrete]
+
+    @property
+    def data(self) -> np.ndarray:
+        """The sample as a flattened numpy array."""
+        return self._data
+
+    @property
+    def datatype(self):
+        """The data-type of the sample."""
+        return self._datatype
+
+    @property
+    def fitted_domain(self) -> tuple:
+        """The minimum and maximum values of the sample."""
+        return self._fitted_domain
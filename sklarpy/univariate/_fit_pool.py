@@ -0,0 +1,251 @@
+# Contains code for fitting univariate distributions in parallel
+import numpy as np
+import collections
+import multiprocessing
+import multiprocessing.connection
+import os
+import time
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from typing import Callable, Iterator
+
+from sklarpy.univariate._fit_context import FitContext
+
+__all__ = ['FitPool']
+
+# the shared data and fit contexts held by each worker process
+_WORKER_STATE: dict = {}
+
+
+def _release_shared_data() -> None:
+    """Releases the shared data and fit contexts held by a worker process,
+    unmapping the shared memory block."""
+    shm = _WORKER_STATE.get('shm')
+    _WORKER_STATE.clear()
+    if shm is not None:
+        shm.close()
+
+
+def _worker_context(shm_name: str, shape: tuple, dtype: str, column: int,
+                    column_dtype, data_type) -> FitContext:
+    """Returns the FitContext of a column of the shared data, attaching to the
+    shared memory block if this worker has not already done so."""
+    if _WORKER_STATE.get('name') != shm_name:
+        _release_shared_data()
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _WORKER_STATE.update(name=shm_name, shm=shm, contexts={},
+                             data=np.ndarray(shape, dtype, buffer=shm.buf))
+
+    contexts: dict = _WORKER_STATE['contexts']
+    key: tuple = (column, data_type)
+    if key not in contexts:
+        column_data: np.ndarray = _WORKER_STATE['data'][:, column]
+        contexts[key] = FitContext(
+            column_data.astype(column_dtype).astype(data_type))
+    return contexts[key]
+
+
+def _fit_task(shm_name: str, shape: tuple, dtype: str, column: int,
+              column_dtype, name: str, data_type):
+    """Fits a single distribution to a column of the shared data, inside a
+    worker process."""
+    from sklarpy.univariate.univariate_fitter import UnivariateFitter
+
+    context: FitContext = _worker_context(shm_name, shape, dtype, column,
+                                          column_dtype, data_type)
+    return UnivariateFitter._fit_single_dist(name, context, data_type)
+
+
+def _worker_loop(conn: Connection) -> None:
+    """Runs the tasks sent over a connection inside a worker process, sending
+    back the result of each. A task of None releases the shared data of a
+    finished fit, with the worker stopping when sent None or when the
+    connection is closed."""
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        task, args = message
+        if task is None:
+            _release_shared_data()
+            continue
+
+        try:
+            result = task(*args)
+        except Exception as e:
+            result = e
+        conn.send(result)
+    _release_shared_data()
+
+
+class FitPool:
+    """A long-lived pool of worker processes, used to fit univariate
+    distributions to one or more variables in parallel."""
+    _POLL_INTERVAL: float = 0.05
+    _task: Callable = staticmethod(_fit_task)
+
+    def __init__(self, max_workers: int = None):
+        """A long-lived pool of worker processes, used to fit univariate
+        distributions to one or more variables in parallel.
+
+        The data being fitted is placed in shared memory once, rather than
+        pickled into every task, with each (variable, distribution) task
+        sent to an idle worker process and given its own timeout, measured
+        from when the task is sent. The worker processes are started when
+        first needed and kept until the pool is closed, so the same pool can
+        be reused across many fits. If a task times out, only the worker
+        process running it is terminated, with a new worker started when
+        next required and all other tasks left running.
+
+        Parameters
+        ----------
+        max_workers: int
+            The number of worker processes. If None, the number of processors
+            on the machine is used.
+            Default is None.
+        """
+        if (max_workers is not None) and not (isinstance(max_workers, int)
+                                              and max_workers > 0):
+            raise TypeError("max_workers must be None or a positive integer.")
+        self._max_workers: int = max_workers or os.cpu_count() or 1
+        self._workers: list = []
+
+    def __str__(self) -> str:
+        return f"FitPool(max_workers={self._max_workers})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _start_worker(self) -> tuple:
+        """Starts a new worker process, returning it with the connection its
+        tasks are sent over."""
+        conn, worker_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_worker_loop,
+                                          args=(worker_conn, ), daemon=True)
+        process.start()
+        worker_conn.close()
+        worker: tuple = (process, conn)
+        self._workers.append(worker)
+        return worker
+
+    def _stop_worker(self, worker: tuple) -> None:
+        """Terminates a worker process, including any task it is running."""
+        process, conn = worker
+        process.terminate()
+        process.join()
+        conn.close()
+        self._workers.remove(worker)
+
+    def close(self) -> None:
+        """Shuts down the worker processes."""
+        # connections are inherited by workers started later, so workers are
+        # told to stop rather than waiting for their connection to close
+        for process, conn in self._workers:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for process, conn in self._workers:
+            process.join()
+            conn.close()
+        self._workers.clear()
+
+    def fit(self, data: np.ndarray, tasks: dict) -> Iterator[tuple]:
+        """Fits distributions to the columns of a dataset in parallel,
+        yielding the results as each task completes.
+
+        Parameters
+        ----------
+        data: np.ndarray
+            The 2-dimensional dataset containing the variables to fit
+            distributions to as columns.
+        tasks: dict
+            The fits to perform. Keys identify each task, with values tuples
+            of (column, column_dtype, name, data_type, timeout), where
+            column_dtype is the data-type of the column, name the name of the
+            distribution to fit, data_type the data-type to fit the
+            distribution to and timeout the maximum amount of time (seconds)
+            to fit the distribution. Timeouts are measured from when a task
+            starts running.
+
+        Yields
+        ------
+        key, result:
+            The key of the completed task and its result; either None if the
+            distribution could not be fitted, a tuple of the fitted
+            distribution and its summary, a TimeoutError if the task timed out
+            or any other exception raised when running the task.
+            If the generator is closed early, tasks still running are stopped
+            by terminating their worker processes.
+        """
+        data = np.ascontiguousarray(data)
+        shm = shared_memory.SharedMemory(create=True,
+                                         size=max(data.nbytes, 1))
+        running: dict = {}
+        try:
+            np.ndarray(data.shape, data.dtype, buffer=shm.buf)[:] = data
+            pending: collections.deque = collections.deque(
+                (key, timeout, (shm.name, data.shape, data.dtype.str, column,
+                                column_dtype, name, data_type))
+                for key, (column, column_dtype, name, data_type, timeout)
+                in tasks.items())
+            idle: list = list(self._workers)
+
+            while pending or running:
+                # sending queued tasks to idle workers
+                while pending and (idle or (len(self._workers)
+                                            < self._max_workers)):
+                    worker: tuple = idle.pop() if idle \
+                        else self._start_worker()
+                    key, timeout, args = pending.popleft()
+                    worker[1].send((self._task, args))
+                    running[worker[1]] = (key, timeout, worker,
+                                          time.monotonic())
+
+                # streaming results as tasks complete
+                for conn in multiprocessing.connection.wait(
+                        list(running), timeout=self._POLL_INTERVAL):
+                    key, _, worker, _ = running.pop(conn)
+                    try:
+                        result = conn.recv()
+                    except (EOFError, OSError):
+                        self._stop_worker(worker)
+                        result = RuntimeError(
+                            f"worker process running task {key} exited "
+                            f"unexpectedly.")
+                    else:
+                        idle.append(worker)
+                    yield key, result
+
+                # stopping only the workers running timed-out tasks
+                now: float = time.monotonic()
+                for conn, (key, timeout, worker, start) \
+                        in list(running.items()):
+                    if now - start > timeout:
+                        del running[conn]
+                        self._stop_worker(worker)
+                        yield key, TimeoutError(
+                            f"task {key} did not complete within {timeout} "
+                            f"seconds.")
+        finally:
+            for key, _, worker, _ in running.values():
+                # stopping tasks not yet completed
+                self._stop_worker(worker)
+            for _, conn in self._workers:
+                # workers unmapping the shared data of this fit
+                try:
+                    conn.send((None, ()))
+                except OSError:
+                    pass
+            shm.close()
+            shm.unlink()
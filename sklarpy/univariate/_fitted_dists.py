@@ -1,11 +1,12 @@
 # Contains classes for holding fitted univariate distributions
 from typing import Callable, Union
+from collections import OrderedDict
 import logging
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 from sklarpy.utils._serialize import Savable
+from sklarpy.utils._input_handlers import univariate_num_to_array
 
 __all__ = ['FittedDiscreteUnivariate', 'FittedContinuousUnivariate']
 
@@ -13,6 +14,7 @@ __all__ = ['FittedDiscreteUnivariate', 'FittedContinuousUnivariate']
 class FittedUnivariateBase(Savable):
     """Base class for holding a fitted probability distribution."""
     _OBJ_NAME = "FittedUnivariateBase"
+    _APPROX_CACHE_SIZE: int = 8
 
     def __init__(self, obj, fit_info: dict):
         """
@@ -29,8 +31,7 @@ class FittedUnivariateBase(Savable):
         self.__obj = obj
         self.__fit_info: dict = fit_info
         Savable.__init__(self, self.__obj.name)
-        self._ppf_approx: Callable = None
-        self._ppf_approx_num_points: int = 100
+        self._approx_cache: OrderedDict = OrderedDict()
 
     def __str__(self) -> str:
         """The name of the distribution + parameters"""
@@ -98,11 +99,12 @@ class FittedUnivariateBase(Savable):
         capture tail behavior still. Also, if the number of points in q lying
         inside (eps, 1-eps) if less than or equal to the num_points argument,
         we use ppf, as this will be faster. The first time this method is
-        called, the linear interpolation is calculated and saved. If the user
-        then calls this method again, the same linear interpolation is reused,
-        allowing for faster computation. If the user changes the num points
-        argument, the linear interpolation will be recalculated and saved
-        again.
+        called for a given num_points and eps, the linear interpolation is
+        calculated and saved. If the user then calls this method again with
+        the same arguments, the same linear interpolation is reused, allowing
+        for faster computation. Up to _APPROX_CACHE_SIZE interpolations of
+        the ppf and cdf are saved, with the least recently used discarded
+        first.
 
         Parameters
         ----------
@@ -117,11 +119,20 @@ class FittedUnivariateBase(Savable):
 
         Returns
         -------
-        rvs_values: np.ndarray
-            A random sample of dimension 'size'.
+        ppf_approx_values: np.ndarray
+            An array of quantile values.
         """
-
-        return self.__obj.ppf_approx(q, self.params, num_points, eps, **kwargs)
+        q: np.ndarray = univariate_num_to_array(q)
+        key: tuple = ('ppf', num_points, eps)
+        num_inside: int = ((q >= eps) & (q <= 1 - eps)).sum()
+        if (num_inside <= num_points) and (key not in self._approx_cache):
+            # faster to use ppf directly
+            return self.ppf(q)
+
+        ppf_approx: Callable = self._cached_approx(
+            key, lambda: self.__obj._fit_ppf_approx(self.params, num_points,
+                                                    eps))
+        return self.__obj._eval_ppf_approx(q, self.params, ppf_approx, eps)
 
     def cdf_approx(self, x: Union[float, int, np.ndarray],
                    num_points: int = 100, **kwargs) -> np.ndarray:
@@ -132,7 +143,9 @@ class FittedUnivariateBase(Savable):
         between these values. Then, using this linear interpolation function,
         we calculate the approximate cdf values.
         This is useful when there is no analytical cdf function, as evaluating
-        many numerical integrals can be slow.
+        many numerical integrals can be slow. The linear interpolation is
+        saved and reused by later calls with the same num_points whose values
+        lie within its (xmin, xmax) range.
 
         Parameters
         ---------
@@ -148,7 +161,58 @@ class FittedUnivariateBase(Savable):
         cdf_approx_values: np.ndarray
             An array of cdf values.
         """
-        return self.__obj.cdf_approx(x, self.params, num_points, **kwargs)
+        x: np.ndarray = univariate_num_to_array(x)
+        if x.size == 0:
+            return self.cdf(x)
+        xmin, xmax = x.min(), x.max()
+
+        # reusing any saved interpolation covering the given values
+        for key in reversed(self._approx_cache):
+            if (key[:2] == ('cdf', num_points)) and (key[2] <= xmin) \
+                    and (xmax <= key[3]):
+                cdf_approx: Callable = self._cached_approx(key, None)
+                return np.asarray(cdf_approx(x), dtype=float)
+
+        if x.size <= num_points:
+            # faster to use cdf directly
+            return self.cdf(x)
+
+        bounds: tuple = (xmin, xmax)
+        cdf_approx: Callable = self._cached_approx(
+            ('cdf', num_points, *bounds),
+            lambda: self.__obj._fit_cdf_approx(self.params, num_points,
+                                               bounds))
+        return np.asarray(cdf_approx(x), dtype=float)
+
+    def _cached_approx(self, key: tuple, fit: Callable) -> Callable:
+        """Returns the saved interpolation function for the given key,
+        fitting and saving it if it does not exist. At most
+        _APPROX_CACHE_SIZE interpolation functions are saved, with the least
+        recently used discarded first.
+
+        Parameters
+        ----------
+        key: tuple
+            The type of interpolation function, 'ppf' or 'cdf', followed by
+            the arguments used to fit it.
+        fit: Callable
+            Function with no arguments returning a newly fitted interpolation
+            function.
+
+        Returns
+        -------
+        approx: Callable
+            The interpolation function.
+        """
+        if key in self._approx_cache:
+            self._approx_cache.move_to_end(key)
+            return self._approx_cache[key]
+
+        approx: Callable = fit()
+        self._approx_cache[key] = approx
+        while len(self._approx_cache) > self._APPROX_CACHE_SIZE:
+            self._approx_cache.popitem(last=False)
+        return approx
 
     def rvs(self, size: tuple, ppf_approx: bool = False, **kwargs
             ) -> np.ndarray:
@@ -173,8 +237,12 @@ class FittedUnivariateBase(Savable):
         rvs_values: np.ndarray
             A random sample of dimension 'size'.
         """
-        return self.__obj.rvs(size, params=self.params, ppf_approx=ppf_approx,
-                              ppf_approx_func=self.ppf_approx)
+        # the fitted ppf_approx takes no parameters, using the saved
+        # interpolation instead
+        return self.__obj.rvs(
+            size, params=self.params, ppf_approx=ppf_approx,
+            ppf_approx_func=lambda q, *_, **approx_kwargs: self.ppf_approx(
+                q, **approx_kwargs), **kwargs)
 
     def logpdf(self, x: Union[float, int, np.ndarray]) -> np.ndarray:
         """The logarithm of the probability density/mass function.
@@ -362,6 +430,8 @@ class FittedUnivariateBase(Savable):
             Whether to show the plots.
             Default is True.
         """
+        import matplotlib.pyplot as plt
+
         # checking arguments
         for bool_arg in (include_empirical, grid, show):
             if not isinstance(bool_arg, bool):
@@ -0,0 +1,438 @@
+# Contains a base class for selecting the univariate distribution which best
+# fits a dataset
+import numpy as np
+from typing import Union, Iterable
+import logging
+import pandas as pd
+import math
+
+from sklarpy.univariate import distributions as prefit_distributions
+from sklarpy.utils._errors import SignificanceError, FitError
+from sklarpy.utils._serialize import Savable
+
+__all__ = ['UnivariateFitterBase']
+
+
+class UnivariateFitterBase(Savable):
+    """Base class for determining the best univariate/marginal distribution
+    for a random sample, holding the fitted distributions and their
+    summaries. Child classes fit distributions to the sample, keeping a
+    representative sample of it in _data for plotting."""
+    _OBJ_NAME: str
+
+    def __init__(self, name: str = None):
+        """Base class for determining the best univariate/marginal
+        distribution for a random sample.
+
+        Parameters
+        ----------
+        name: str
+            The name of your object. Used when saving.
+            If none, the name of the class is used as a name.
+            Default is None.
+        """
+        self._data: np.ndarray = None
+        self._datatype = float
+        self._fitted: bool = False
+        self._fitted_dists: dict = {}
+        self._fitted_summaries: dict = {}
+        super().__init__(name)
+
+    def __repr__(self):
+        return self.__str__()
+
+    def _add_fitted(self, res: Union[tuple, None]) -> None:
+        """Stores a fitted distribution and its summary."""
+        if res is not None:
+            self._fitted_dists[res[0].name] = res[0]
+            self._fitted_summaries[res[0].name] = res[1]
+
+    def _fit_finish(self, raise_error: bool):
+        """Marks the fitter as fitted, checking at least one distribution was
+        fitted."""
+        if len(self._fitted_dists) == 0:
+            msg: str = "Unable to fit any distribution to the data."
+            if raise_error:
+                raise FitError(msg)
+            else:
+                logging.warning(msg)
+        self._fitted = True
+        return self
+
+    def _filter(self, pvalue: float) -> tuple:
+        """method to filter out all distributions which do not statistically
+        fit the data for a given p-value."""
+        if not self._fitted:
+            raise FitError(f"{self._OBJ_NAME} has not been fitted to data. "
+                           "Call .fit method.")
+
+        filtered_dists: dict = {}
+        filtered_summaries: dict = {}
+        for name in self._fitted_dists:
+            dist = self._fitted_dists[name]
+            # reusing the gof results stored in the fitted summary
+            summary: pd.DataFrame = self._fitted_summaries[name]
+            gof: pd.Series = summary[summary.columns[0]]
+
+            if dist.continuous_or_discrete == 'continuous':
+                # Cramér-von Mises and Kolmogorov-Smirnov gof tests
+                # for continuous distributions
+                cvm_pvalue: float = gof['Cramér-von Mises p-value']
+                ks_pvalue: float = gof['Kolmogorov-Smirnov p-value']
+
+                # keeping only the distributions which are significant
+                # for BOTH tests
+                if (cvm_pvalue >= pvalue) and (ks_pvalue >= pvalue):
+                    filtered_dists[name] = dist
+                    filtered_summaries[name] = summary
+
+            elif dist.continuous_or_discrete == 'discrete':
+                # Chi-squared gof tests for discrete distributions
+                chisq_pvalue: float = gof['chi-square p-value']
+
+                if chisq_pvalue >= pvalue:
+                    filtered_dists[name] = dist
+                    filtered_summaries[name] = summary
+        return filtered_dists, filtered_summaries
+
+    def get_summary(self, sortby: str = None, significant: bool = False,
+                    pvalue: float = 0.05) -> pd.DataFrame:
+        """Returns a summary of the fitted distributions.
+
+        Parameters
+        ----------
+        sortby: str
+            The metric/column to sort the summary by. None to not sort.
+            Default is None.
+        significant: bool
+            True to remove distributions which fail goodness of fit
+            significance tests.
+            Default is False.
+        pvalue: float
+            The p-value to use when rejecting the null hypothesis in goodness
+            of fit tests.
+            Default is 0.05.
+
+        Returns
+        -------
+        summary: pd.DataFrame
+            The summary of fitted distributions.
+        """
+        if not self._fitted:
+            raise FitError(f"{self._OBJ_NAME} has not been fitted to data. "
+                           "Call .fit method.")
+
+        # argument checks
+        if not isinstance(significant, bool):
+            raise TypeError("significant must be a boolean.")
+
+        if not (isinstance(pvalue, float) or isinstance(pvalue, int)):
+            raise TypeError("pvalue must be a float.")
+        elif (pvalue > 1) or (pvalue < 0):
+            raise ValueError("pvalue must be a valid probability.")
+
+        if significant:
+            _, summaries = self._filter(pvalue)
+        else:
+            summaries = self._fitted_summaries
+
+        if len(summaries) == 0:
+            # No distributions fitted successfully
+            return pd.DataFrame()
+
+        summary: pd.DataFrame = pd.concat(summaries.values(), axis=1
+                                          ).transpose()
+        max_num_params: int = summary['#Params'].max()
+        if max_num_params != 0:
+            # putting columns in desired order
+            cols: list = summary.columns.to_list()
+            param0_index: int = cols.index('param0')
+            param_cols: list = [f'param{i}' for i in range(max_num_params)]
+            non_param_cols: list = [col for col in cols
+                                    if col not in param_cols]
+            new_order: list = [
+                *cols[:param0_index],
+                *param_cols,
+                *non_param_cols[param0_index:]
+            ]
+            summary = summary[new_order]
+
+        if (sortby is None) or (sortby not in summary.columns):
+            return summary
+        return summary.sort_values(by=sortby)
+
+    def get_best(self, significant: bool = True, pvalue: float = 0.05,
+                 raise_error: bool = False, **kwargs):
+        """Returns the fitted probability distribution which minimises the sum
+        of squared error between the empirical and fitted pdfs.
+
+        Parameters
+        ----------
+        significant: bool
+            True to select only from distributions which satisfy goodness of
+            fit significance tests.
+            Default is True.
+        pvalue: float
+            The p-value to use when rejecting the null hypothesis in
+            goodness of fit tests.
+            Default is 0.05.
+        raise_error: bool
+            True to raise an error if no distribution can be returned.
+            If False and no distribution can be returned, an empirical
+            distribution is fitted and returned.
+            Default is False.
+
+        Returns
+        -------
+        best:
+            best fitted distribution.
+        """
+        # argument checks
+        if not isinstance(raise_error, bool):
+            raise TypeError("raise_error must be a boolean.")
+
+        summary: pd.DataFrame = self.get_summary('Sum of Squared Error',
+                                                 significant, pvalue)
+        if len(summary) == 0:
+            # no good distributional fits
+            if raise_error:
+                raise SignificanceError("No statistically significant "
+                                        "distributions fitted.")
+            logging.warning("No statistically significant distributions "
+                            "fitted. Empirical distribution returned.")
+
+            return self._fit_empirical()
+
+        best = summary.index[0]
+        return self._fitted_dists[best]
+
+    def _fit_empirical(self):
+        """Returns the empirical distribution of the data.
+
+        To be overwritten by child classes.
+        """
+
+    def plot(self, which: Union[str, Iterable] = 'all', pvalue: float = 0.05,
+             xrange: np.ndarray = None, include_empirical: bool = True,
+             empirical_color: str = 'black', qqplot_yx_color: str = 'black',
+             alpha: float = 0.5, empirical_alpha: float = 1.0,
+             qqplot_yx_alpha: float = 1.0, pdf_plot_limit: float = 1.0,
+             figsize: tuple = (16, 8), grid: bool = True,
+             num_to_plot: int = 100, show: bool = True) -> None:
+        """Plots the fitted distributions. Produces subplots of the pdf and
+        cdf.
+
+        Parameters
+        ----------
+        which: Union[str, Iterable]
+            'all', 'best', 'significant', 'best significant' to plot all,
+            the best and significant fitted distributions. which can also be
+            the string name of a fitted distribution.
+            If an iterable, the distribution names which are specified in the
+            iterable and have been fitted are plotted.
+            Default is 'all'.
+        pvalue: float
+            The p-value to use when rejecting the null hypothesis in goodness
+            of fit tests. Used if which is 'significant' or 'best significant'.
+            Default is 0.05.
+        xrange: np.ndarray
+            A user supplied range to plot the distribution
+            (and empirical distribution) over.
+            If not provided, this will be generated.
+        include_empirical: bool
+            Whether to include empirical distribution in your plots.
+            Default is True.
+        empirical_color: str
+            The color in which to plot the empirical distribution.
+            Any acceptable value for the matplotlib.pyplot 'color' argument
+            can be given.
+            Default is 'black'.
+        qqplot_yx_color: str
+            The color in which to plot the y=x line in the QQ-plot. Any
+            acceptable value for the matplotlib.pyplot 'color' argument can be
+            given.
+            Default is 'black'.
+        pdf_plot_limit: float
+            The upper limit for pdf values to use in plots. This may be useful
+            as fitted distributions may sometimes have unreasonably large pdf
+            values which skew the proportions of the plots, making analysis
+            difficult.
+            Default is 1.0.
+        alpha: float
+            The alpha/transparency value to use when plotting the distribution.
+            Default is 0.5
+        empirical_alpha: float
+            The alpha/transparency value to use when plotting the empirical
+            distribution.
+            Default is 1.0.
+        qqplot_yx_alpha: float
+            The alpha/transparency value to use when plotting the y=x line in
+            the QQ-plot.
+        figsize: tuple
+            The size/dimensions of the figure.
+            Default is (16, 8).
+        grid: bool
+            Whether to include a grid in the plots.
+            Default is True.
+        num_to_plot: int
+            The number of points to plot.
+            Default is 100.
+        show: bool
+            Whether to show the plots.
+            Default is True.
+        """
+        import matplotlib.pyplot as plt
+
+        if not self._fitted:
+            raise FitError(f"{self._OBJ_NAME} has not been fitted to data. "
+                           "Call .fit method.")
+
+        # argument checks
+        if isinstance(which, str):
+            which = which.lower()
+            if which == 'all':
+                dists = self.get_summary().index
+            elif which == 'significant':
+                summary: pd.DataFrame = self.get_summary(significant=True,
+                                                         pvalue=pvalue)
+                if len(summary) == 0:
+                    raise SignificanceError("No statistically significant "
+                                            "distributions fitted.")
+                dists = summary.index
+            elif which == 'best':
+                dists = [self.get_best().name]
+            elif which == 'best significant':
+                dists = [self.get_best(significant=True, pvalue=pvalue).name]
+            elif which in self._fitted_dists.keys():
+                dists = [which]
+            else:
+                raise ValueError(f"if which is a string, it must be 'all', "
+                                 f"'significant', 'best', 'best significant' "
+                                 f"or the name of a fitted distribution, "
+                                 f"not '{which}'")
+        elif isinstance(which, Iterable):
+            dists = [d for d in which if d in self._fitted_dists.keys()]
+        else:
+            raise TypeError("which must be a string or iterable")
+
+        if xrange is None:
+            if not (isinstance(num_to_plot, int) and num_to_plot >= 1):
+                raise TypeError("invalid argument type in plot. "
+                                "check num_to_plot is a natural number.")
+            xrange: np.ndarray = np.linspace(
+                self._data.min(), self._data.max(), num_to_plot)
+        elif isinstance(xrange, np.ndarray):
+            if xrange.size < 1:
+                raise ValueError("xrange cannot be empty.")
+        else:
+            raise TypeError("xrange must be None or a numpy array.")
+
+        for bool_arg in (include_empirical, grid, show):
+            if not isinstance(bool_arg, bool):
+                raise TypeError("invalid argument type in plot. check "
+                                "include_empirical, grid, show are all "
+                                "boolean.")
+
+        for str_arg in (empirical_color, qqplot_yx_color):
+            if not isinstance(str_arg, str):
+                raise TypeError("invalid argument type in plot. check "
+                                "empirical_color, qqplot_yx_color are all "
+                                "strings.")
+
+        for float_arg in (alpha, empirical_alpha,
+                          qqplot_yx_alpha, pdf_plot_limit):
+            if not isinstance(float_arg, float):
+                raise TypeError("invalid argument type in plot. check alpha, "
+                                "empirical_alpha, qqplot_yx_alpha, "
+                                "pdf_plot_limit are all floats.")
+
+        if not (isinstance(figsize, tuple) and len(figsize) == 2):
+            raise TypeError("invalid argument type in plot. check figsize "
+                            "is a tuple of length 2.")
+
+        # creating qrange
+        qrange: np.ndarray = np.linspace(0, 1, num_to_plot, dtype=float)
+
+        # max pdf value to plot
+        max_pdf_value: float = 0.0
+
+        # creating subplots
+        xlabels: tuple = ("x", "x", "P(X<=q)", "Theoretical Quantiles")
+        ylabels: tuple = ("PDF", "P(X<=x)", "q", "Empirical Quantiles")
+        titles: tuple = ('PDF', 'CDF', 'Inverse CDF', "QQ-Plot")
+        fig, ax = plt.subplots(1, 4, figsize=figsize)
+
+        # fitting empirical dist for plotting
+        if self._datatype == float:
+            empirical_dist = prefit_distributions.empirical.fit(
+                self._data.astype(float))
+        elif self._datatype == int:
+            empirical_dist = prefit_distributions.discrete_empirical.fit(
+                self._data.astype(int))
+
+        # plotting empirical distribution
+        empirical_ppf_values: np.ndarray = empirical_dist.ppf(qrange)
+        if include_empirical:
+            empirical_label: str = 'Empirical'
+            empirical_pdf_values: np.ndarray = empirical_dist.pdf(xrange)
+            ax[0].plot(xrange, empirical_pdf_values, color=empirical_color,
+                       alpha=empirical_alpha, label=empirical_label)
+            ax[1].plot(xrange, empirical_dist.cdf(xrange),
+                       color=empirical_color, alpha=empirical_alpha,
+                       label=empirical_label)
+            ax[2].plot(qrange, empirical_ppf_values, color=empirical_color,
+                       alpha=empirical_alpha, label=empirical_label)
+
+            max_pdf_value = empirical_pdf_values.max()
+
+        # plotting distributions
+        ax[3].plot(xrange, xrange, color=qqplot_yx_color,
+                   alpha=qqplot_yx_alpha, label='y=x')
+        for name in dists:
+            dist = self._fitted_dists[name]
+
+            pdf_values: np.ndarray = dist.pdf(xrange)
+            cdf_values: np.ndarray = dist.cdf(xrange)
+            ppf_values: np.ndarray = dist.ppf(qrange)
+
+            ax[0].plot(xrange, pdf_values, alpha=alpha, label=dist.name)
+            ax[1].plot(xrange, cdf_values, alpha=alpha, label=dist.name)
+            ax[2].plot(qrange, ppf_values, alpha=alpha, label=dist.name)
+            ax[3].scatter(ppf_values, empirical_ppf_values, label='Quartiles',
+                          alpha=alpha)
+
+            max_pdf_value = max(max_pdf_value, pdf_values.max())
+        ax[0].set_ylim(0, min(pdf_plot_limit, max_pdf_value))
+
+        # labelling axes
+        for i in range(4):
+            ax[i].set_xlabel(xlabels[i])
+            ax[i].set_ylabel(ylabels[i])
+            ax[i].set_title(titles[i])
+            ax[i].grid(grid)
+
+        # choosing legend location
+        num_dists: int = len(self._fitted_dists)
+        if num_dists <= 10:
+            ncols: int = num_dists
+        else:
+            ncols: int = 10
+        nrows = math.ceil(num_dists / 4)
+        handles, labels = ax[0].get_legend_handles_labels()
+        fig.legend(handles, labels, loc='lower center', ncol=ncols,
+                   bbox_to_anchor=(0.5, 0), fancybox=True, shadow=True)
+        plt.tight_layout()
+        bottom = max(nrows * 0.2 / figsize[1], 0.12)
+        fig.subplots_adjust(bottom=bottom)
+
+        if show:
+            plt.show()
+
+
+    @property
+    def fitted_distributions(self) -> dict:
+        """All distributions fitted to the dataset."""
+        if self._fitted:
+            return self._fitted_dists
+        raise FitError(f"{self._OBJ_NAME} has not been fitted to data. "
+                       "Call .fit method.")
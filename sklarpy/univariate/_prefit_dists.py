@@ -3,19 +3,19 @@ from typing import Callable, Union, Iterable
 from functools import partial
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import copy
 import scipy.interpolate
 
 from sklarpy.univariate._goodness_of_fit import continuous_gof, discrete_gof
 from sklarpy.univariate._inverse_transform import inverse_transform
 from sklarpy.utils._input_handlers import univariate_num_to_array, \
-    check_univariate_data, check_array_datatype, check_params
+    check_univariate_data, check_params
 from sklarpy.utils._errors import FitError
 from sklarpy.univariate._fitted_dists import FittedContinuousUnivariate, \
     FittedDiscreteUnivariate
 from sklarpy.univariate._distributions import discrete_empirical_fit, \
     continuous_empirical_fit
+from sklarpy.univariate._fit_context import FitContext
 
 __all__ = [
     'PreFitParametricContinuousUnivariate',
@@ -32,7 +32,8 @@ class PreFitUnivariateBase:
     _PARAMETRIC: str
 
     def __init__(self, name: str, pdf: Callable, cdf: Callable, ppf: Callable,
-                 support: Callable, fit: Callable, rvs: Callable = None):
+                 support: Callable, fit: Callable, rvs: Callable = None,
+                 logpdf: Callable = None):
         """Class used to fit a univariate probability distribution
 
         Parameters
@@ -70,6 +71,12 @@ class PreFitUnivariateBase:
             containing the random sample of dimension 'size'. If no random
             sampler function is specified, this is implemented using the
             inverse transform method.
+        logpdf: Callable
+            The logpdf function of the distribution. Must take a flattened
+            numpy array containing variable values and a tuple containing the
+            distribution's parameters as arguments, returning a numpy array of
+            logpdf values. If not specified, the logarithm of the pdf function
+            is used.
         """
         # argument checks
         if not isinstance(name, str):
@@ -94,6 +101,11 @@ class PreFitUnivariateBase:
                             "initialisation.")
 
         self._rvs: Callable = rvs
+
+        if (logpdf is not None) and (not callable(logpdf)):
+            raise TypeError("Invalid argument in pre-fit distribution "
+                            "initialisation.")
+        self._logpdf: Callable = logpdf
         self._gof: Callable = None
 
     def __str__(self) -> str:
@@ -259,10 +271,35 @@ class PreFitUnivariateBase:
 
         # fitting ppf approx function
         ppf_approx: Callable = self._fit_ppf_approx(params, num_points, eps)
+        return self._eval_ppf_approx(q, params, ppf_approx, eps)
+
+    def _eval_ppf_approx(self, q: np.ndarray, params: tuple,
+                         ppf_approx: Callable, eps: float) -> np.ndarray:
+        """Evaluates a fitted ppf approximation function, using the
+        (non-approximate) ppf for quartiles lying outside (eps, 1-eps).
+
+        Parameters
+        ----------
+        q: np.ndarray
+            The quartile values to calculate cdf^-1(q) of.
+        params: tuple
+            The parameters which define the univariate model.
+        ppf_approx: Callable
+            The fitted ppf approximation function.
+        eps: float
+            The epsilon value used when fitting ppf_approx.
 
-        return np.array([ppf_approx(qi) if ((qi >= eps) and (qi <= 1-eps))
-                         else float(self.ppf(qi, params)) for qi in q
-                         ], dtype=float)
+        Returns
+        -------
+        ppf_approx_values: np.ndarray
+            An array of quantile values.
+        """
+        inside: np.ndarray = (q >= eps) & (q <= 1 - eps)
+        ppf_values: np.ndarray = np.empty(q.shape, dtype=float)
+        ppf_values[inside] = ppf_approx(q[inside])
+        if not np.all(inside):
+            ppf_values[~inside] = self.ppf(q[~inside], params)
+        return ppf_values
 
     def _fit_cdf_approx(self, params: tuple, num_points: int, bounds: tuple
                         ) -> Callable:
@@ -318,7 +355,7 @@ class PreFitUnivariateBase:
         # fitting cdf approx function
         bounds: tuple = (x.min(), x.max())
         cdf_approx = self._fit_cdf_approx(params, num_points, bounds)
-        return np.array([cdf_approx(xi) for xi in x], dtype=float)
+        return np.asarray(cdf_approx(x), dtype=float)
 
     def rvs(self, size: tuple, params: tuple, ppf_approx: bool = False,
             **kwargs) -> np.ndarray:
@@ -384,7 +421,14 @@ class PreFitUnivariateBase:
         logpdf_values: np.ndarray
             An array of logpdf values
         """
-        return np.log(self.pdf(x, params))
+        if self._logpdf is None:
+            with np.errstate(divide='ignore'):
+                return np.log(self.pdf(x, params))
+
+        x: np.ndarray = univariate_num_to_array(x)
+        params: tuple = check_params(params)
+        logpdf_values: np.ndarray = self._logpdf(x, *params)
+        return np.where(~np.isnan(logpdf_values), logpdf_values, -np.inf)
 
     def likelihood(self, data: np.ndarray, params: tuple) -> float:
         """The likelihood function.
@@ -407,10 +451,11 @@ class PreFitUnivariateBase:
             The value of the likelihood function.
         """
         data = check_univariate_data(data)
-        pdf_values: np.ndarray = self.pdf(data, params)
-        if np.any(np.isinf(pdf_values)):
+        logpdf_values: np.ndarray = self.logpdf(data, params)
+        if np.any(np.isposinf(logpdf_values)):
             return np.inf
-        return float(np.product(pdf_values))
+        # summing in log space, as the product of pdf values underflows
+        return float(np.exp(np.sum(logpdf_values)))
 
     def loglikelihood(self, data: np.ndarray, params: tuple) -> float:
         """The logarithm of the likelihood function.
@@ -578,6 +623,8 @@ class PreFitUnivariateBase:
         --------
         scipy.stats
         """
+        import matplotlib.pyplot as plt
+
         # checking arguments
         params = check_params(params)
 
@@ -700,7 +747,7 @@ class PreFitUnivariateBase:
             "parametric": self._PARAMETRIC,
         }
 
-        obj = copy.deepcopy(self)
+        obj = copy.copy(self)
         return self._FIT_TO(obj, fit_info)
 
     def _calc_fit_stats(self, data: np.ndarray, params: tuple,
@@ -727,9 +774,10 @@ class PreFitUnivariateBase:
             The fit statistics.
         """
         gof: pd.DataFrame = self._gof(data, params)
-        pdf_values: np.ndarray = self.pdf(data, params)
-        likelihood: float = float(np.product(pdf_values))
-        loglikelihood: float = float(np.sum(np.log(pdf_values)))
+        logpdf_values: np.ndarray = self.logpdf(data, params)
+        pdf_values: np.ndarray = np.exp(logpdf_values)
+        loglikelihood: float = float(np.sum(logpdf_values))
+        likelihood: float = float(np.exp(loglikelihood))
         num_data_points: int = len(data)
         num_params: int = len(params)
         aic: float = 2 * num_params - 2 * loglikelihood
@@ -738,21 +786,70 @@ class PreFitUnivariateBase:
         return (gof, likelihood, loglikelihood, num_data_points,
                 num_params, aic, bic, sse)
 
+    def _fit_info_given_data(self, context: FitContext, params: tuple
+                             ) -> dict:
+        """Returns information about the fit of the distribution to data.
+
+        Parameters
+        ----------
+        context: FitContext
+            The data the distribution has been fitted to.
+        params: tuple
+            The parameters which define the univariate model.
+            See scipy.stats for the correct order.
+
+        Returns
+        -------
+        fit_info: dict
+            Information about the fit, including fit statistics.
+        """
+        empirical_pdf, empirical_cdf, empirical_ppf, empirical_pdf_values = \
+            context.empirical(self.continuous_or_discrete)
+
+        # fit statistics
+        (gof, likelihood, loglikelihood, num_data_points, num_params, aic, bic,
+         sse) = self._calc_fit_stats(context.data, params,
+                                     empirical_pdf_values)
+
+        return {
+            "fitted_to_data": True,
+            "params": params,
+            "support": self.support(params),
+            "fitted_domain": context.fitted_domain,
+            "empirical_pdf": empirical_pdf,
+            "empirical_cdf": empirical_cdf,
+            "empirical_ppf": empirical_ppf,
+            "gof": gof,
+            "likelihood": likelihood,
+            "loglikelihood": loglikelihood,
+            "num_data_points": num_data_points,
+            "num_params": num_params,
+            "aic": aic,
+            "bic": bic,
+            "sse": sse,
+            "parametric": self._PARAMETRIC,
+        }
+
     def _fit_given_data(
-            self, data: Union[pd.DataFrame, pd.Series, np.ndarray, Iterable],
-            params: tuple = None)\
+            self, data: Union[pd.DataFrame, pd.Series, np.ndarray, Iterable,
+                              FitContext],
+            params: tuple = None, **kwargs)\
             -> Union[FittedContinuousUnivariate, FittedDiscreteUnivariate]:
         """Fits the distribution using user provided data.
 
         Parameters
         ----------
-        data : Union[pd.DataFrame, pd.Series, np.ndarray, Iterable]
+        data : Union[pd.DataFrame, pd.Series, np.ndarray, Iterable, FitContext]
             The data to fit to the distribution too.
             Can be a pd.DataFrame, pd.Series, np.ndarray or any other iterable
-            containing data.
+            containing data, or a FitContext shared between the distributions
+            being fitted to the same data.
         params: tuple
             The parameters which define the univariate model.
             See scipy.stats for the correct order.
+        kwargs:
+            Keyword arguments passed to the fit function of the distribution
+            when params are not provided.
 
         See Also
         --------
@@ -764,57 +861,27 @@ class PreFitUnivariateBase:
             A fitted distribution.
         """
         # checking arguments
-        data: np.ndarray = check_univariate_data(data)
+        context: FitContext = data if isinstance(data, FitContext) \
+            else FitContext(data)
 
-        if (check_array_datatype(data) == float) and (self.X_DATA_TYPE == int):
+        if (context.datatype == float) and (self.X_DATA_TYPE == int):
             raise FitError('Cannot fit discrete distribution to continuous '
                            'data.')
 
         if params is None:
-            params: tuple = self._fit(data)
+            params: tuple = self._fit(context.data, **kwargs)
         else:
             params = check_params(params)
 
-        # calculating support and fitted domain
-        support: tuple = self.support(params)
-        fitted_domain: tuple = (data.min(), data.max())
-
-        # fitting empirical distribution
-        empirical_fit: Callable = self._get_empirical_fit()
-        empirical_pdf, empirical_cdf, empirical_ppf, _, _ = empirical_fit(data)
-        empirical_pdf_values: np.ndarray = empirical_pdf(data)
-
-        # fit statistics
-        (gof, likelihood, loglikelihood, num_data_points, num_params, aic, bic,
-         sse) = self._calc_fit_stats(data, params, empirical_pdf_values)
-
         # returning fitted distribution
-        fit_info: dict = {
-            "fitted_to_data": True,
-            "params": params,
-            "support": support,
-            "fitted_domain": fitted_domain,
-            "empirical_pdf": empirical_pdf,
-            "empirical_cdf": empirical_cdf,
-            "empirical_ppf": empirical_ppf,
-            "gof": gof,
-            "likelihood": likelihood,
-            "loglikelihood": loglikelihood,
-            "num_data_points": num_data_points,
-            "num_params": num_params,
-            "aic": aic,
-            "bic": bic,
-            "sse": sse,
-            "parametric": self._PARAMETRIC,
-        }
-
-        obj = copy.deepcopy(self)
+        fit_info: dict = self._fit_info_given_data(context, params)
+        obj = copy.copy(self)
         return self._FIT_TO(obj, fit_info)
 
     def fit(self,
             data: Union[pd.DataFrame, pd.Series, np.ndarray, Iterable] = None,
-            params: tuple = None) -> Union[FittedContinuousUnivariate,
-                                           FittedDiscreteUnivariate]:
+            params: tuple = None, **kwargs
+            ) -> Union[FittedContinuousUnivariate, FittedDiscreteUnivariate]:
         """Used to fit the distribution to the data.
 
         Parameters
@@ -827,6 +894,11 @@ class PreFitUnivariateBase:
             The parameters which define the univariate model.
             See scipy.stats for the correct order.
             If not provided, data must be provided.
+        kwargs:
+            Keyword arguments passed to the fit function of the distribution
+            when fitting to data. For the gh and skewed_t distributions these
+            are workers and vectorized, which parallelise or vectorize the
+            evaluation of the differential evolution population.
 
         See Also
         --------
@@ -839,7 +911,7 @@ class PreFitUnivariateBase:
         """
         if data is not None:
             try:
-                return self._fit_given_data(data, params)
+                return self._fit_given_data(data, params, **kwargs)
             except Exception as e:
                 raise FitError(f"Unable to fit {self.name} distribution to "
                                f"data")
@@ -907,6 +979,7 @@ class PreFitNumericalUnivariateBase(PreFitUnivariateBase):
         self._ppf: Callable = None
         self._rvs: Callable = None
         self._support: tuple = None
+        self._logpdf: Callable = None
 
     def pdf(self, x: Union[float, int, np.ndarray], params: tuple = ()
             ) -> np.ndarray:
@@ -1034,49 +1107,20 @@ class PreFitNumericalUnivariateBase(PreFitUnivariateBase):
         fdist: Union[FittedContinuousUnivariate, FittedDiscreteUnivariate]
             A fitted numerical distribution.
         """
-        data = check_univariate_data(data)
-        params: tuple = ()
-        fitted_domain: tuple = (data.min(), data.max())
+        context: FitContext = data if isinstance(data, FitContext) \
+            else FitContext(data)
 
-        # fitting numerical distribution
-        (self._pdf, self._cdf, self._ppf, self._support, rvs) = self._fit(data)
+        # fitting numerical distribution to a copy, leaving self unfitted
+        obj = copy.copy(self)
+        (obj._pdf, obj._cdf, obj._ppf, obj._support, rvs) = \
+            obj._fit(context.data)
         if rvs is None:
-            rvs = partial(inverse_transform, ppf=self.ppf)
-        self._rvs = rvs
-
-        # fitting empirical distribution
-        empirical_fit: Callable = self._get_empirical_fit()
-        empirical_pdf, empirical_cdf, empirical_ppf, _, _ = empirical_fit(data)
-        empirical_pdf_values: np.ndarray = empirical_pdf(data)
-
-        # fit statistics
-        (gof, likelihood, loglikelihood, num_data_points, num_params, aic,
-         bic, sse) = self._calc_fit_stats(
-            data, params, empirical_pdf_values)
+            rvs = partial(inverse_transform, ppf=obj.ppf)
+        obj._rvs = rvs
 
         # returning fitted distribution
-        fit_info: dict = {
-            "fitted_to_data": True,
-            "params": params,
-            "support": self.support(),
-            "fitted_domain": fitted_domain,
-            "empirical_pdf": empirical_pdf,
-            "empirical_cdf": empirical_cdf,
-            "empirical_ppf": empirical_ppf,
-            "gof": gof,
-            "likelihood": likelihood,
-            "loglikelihood": loglikelihood,
-            "num_data_points": num_data_points,
-            "num_params": num_params,
-            "aic": aic,
-            "bic": bic,
-            "sse": sse,
-            "parametric": self._PARAMETRIC,
-        }
-
-        obj = self._FIT_TO(copy.deepcopy(self), fit_info)
-        self.__init()
-        return obj
+        fit_info: dict = obj._fit_info_given_data(context, ())
+        return obj._FIT_TO(obj, fit_info)
 
 
 class PreFitParametricContinuousUnivariate(PreFitUnivariateBase):
@@ -1086,8 +1130,9 @@ class PreFitParametricContinuousUnivariate(PreFitUnivariateBase):
     _PARAMETRIC = 'Parametric'
 
     def __init__(self, name: str, pdf: Callable, cdf: Callable, ppf: Callable,
-                 support: Callable, fit: Callable, rvs: Callable = None):
-        super().__init__(name, pdf, cdf, ppf, support, fit, rvs)
+                 support: Callable, fit: Callable, rvs: Callable = None,
+                 logpdf: Callable = None):
+        super().__init__(name, pdf, cdf, ppf, support, fit, rvs, logpdf)
         self._gof: Callable = partial(continuous_gof, cdf=self.cdf,
                                       name=self.name)
 
@@ -1099,8 +1144,9 @@ class PreFitParametricDiscreteUnivariate(PreFitUnivariateBase):
     _PARAMETRIC = 'Parametric'
 
     def __init__(self, name: str, pdf: Callable, cdf: Callable, ppf: Callable,
-                 support: Callable, fit: Callable, rvs: Callable = None):
-        super().__init__(name, pdf, cdf, ppf, support, fit, rvs)
+                 support: Callable, fit: Callable, rvs: Callable = None,
+                 logpdf: Callable = None):
+        super().__init__(name, pdf, cdf, ppf, support, fit, rvs, logpdf)
         self._gof: Callable = partial(
             discrete_gof, support=self.support, pdf=self.pdf,
             ppf=self.ppf, name=self.name)
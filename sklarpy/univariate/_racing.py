@@ -0,0 +1,125 @@
+# Contains code for pruning the candidate distributions fitted to a dataset
+import numpy as np
+import math
+import warnings
+
+from sklarpy.univariate._fit_context import FitContext
+
+__all__ = ['race', 'RACING_CRITERIA']
+
+RACING_CRITERIA: tuple = ('aic', 'bic', 'sse')
+
+
+def _subsample_order(data: np.ndarray, seed: int) -> np.ndarray:
+    """Returns a random ordering of the sample, with its minimum and maximum
+    placed first so that every subsample spans the range of the data."""
+    order: np.ndarray = np.random.default_rng(seed).permutation(len(data))
+    extremes: np.ndarray = np.unique([np.argmin(data), np.argmax(data)])
+    return np.concatenate([extremes, order[~np.isin(order, extremes)]])
+
+
+def _score(dist, context: FitContext, fitted_domain: tuple, criterion: str
+           ) -> float:
+    """Fits a distribution to a subsample, returning its score under the
+    criterion. Distributions which cannot be fitted, or whose fitted support
+    excludes the range of the full sample, are given an infinite score."""
+    data: np.ndarray = context.data
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            params: tuple = dist._fit(data)
+
+            # support / sign check
+            lower, upper = dist.support(params)
+            if not ((lower <= fitted_domain[0])
+                    and (fitted_domain[1] <= upper)):
+                return np.inf
+
+            logpdf_values: np.ndarray = dist.logpdf(data, params)
+            loglikelihood: float = float(np.sum(logpdf_values))
+    except Exception:
+        return np.inf
+
+    if not np.isfinite(loglikelihood):
+        return np.inf
+    elif criterion == 'aic':
+        score: float = 2 * len(params) - 2 * loglikelihood
+    elif criterion == 'bic':
+        score: float = np.log(len(data)) * len(params) - 2 * loglikelihood
+    else:
+        empirical_pdf_values: np.ndarray = context.empirical(
+            dist.continuous_or_discrete)[3]
+        score: float = float(np.sum(
+            (np.exp(logpdf_values) - empirical_pdf_values) ** 2))
+    return score if np.isfinite(score) else np.inf
+
+
+def race(distributions: dict, context: FitContext, criterion: str = 'aic',
+         shortlist: int = 5, min_sample_size: int = 250, seed: int = 0
+         ) -> list:
+    """Prunes candidate distributions by successive halving.
+
+    Every candidate is fitted to a small random subsample of the data, with
+    the worse half, by the chosen criterion, dropped. The survivors are then
+    refitted to a subsample twice the size, and so on, until at most
+    shortlist candidates remain. Subsamples are always smaller than the
+    data, so racing stops, keeping only the best shortlist candidates, once
+    the next subsample would contain all of it. Only the survivors are
+    therefore ever fitted to the full dataset. Each subsample contains the
+    minimum and maximum of the data, with candidates whose fitted support
+    does not contain this range dropped immediately.
+
+    Parameters
+    ----------
+    distributions: dict
+        The names of the candidate distributions as keys and the pre-fit
+        distributions as values.
+    context: FitContext
+        The data the distributions are being fitted to.
+    criterion: str
+        The criterion to rank candidates by. One of 'aic', 'bic' or 'sse'.
+        Default is 'aic'.
+    shortlist: int
+        The maximum number of candidates to keep.
+        Default is 5.
+    min_sample_size: int
+        The size of the first subsample. At most half the data is used in
+        the first subsample.
+        Default is 250.
+    seed: int
+        The seed used to draw subsamples.
+        Default is 0.
+
+    Returns
+    -------
+    survivors: list
+        The names of the candidates which survived, best first.
+    """
+    data: np.ndarray = context.data
+    order: np.ndarray = _subsample_order(data, seed)
+    num_data_points: int = len(data)
+    sample_size: int = min(min_sample_size, num_data_points // 2)
+
+    candidates: list = sorted(distributions)
+    if sample_size < 2:
+        # too little data to race on
+        return candidates
+    while True:
+        sample: FitContext = FitContext(data[order[:sample_size]])
+        scores: dict = {name: _score(distributions[name], sample,
+                                     context.fitted_domain, criterion)
+                        for name in candidates}
+        ranked: list = sorted((score, name) for name, score in scores.items()
+                              if np.isfinite(score))
+        if len(ranked) == 0:
+            # no candidate could be scored, so leaving them to the full fit
+            return candidates
+
+        # stopping before the subsample would be the full dataset
+        final_round: bool = 2 * sample_size >= num_data_points
+        num_to_keep: int = shortlist if final_round \
+            else max(shortlist, math.ceil(len(candidates) / 2))
+        candidates = [name for _, name in ranked[:num_to_keep]]
+        if final_round or len(candidates) <= shortlist:
+            return candidates
+        sample_size *= 2
@@ -0,0 +1,325 @@
+# Contains mergeable summaries of univariate samples too large to hold in
+# memory
+import numpy as np
+
+__all__ = ['StreamingMoments', 'KLLSketch', 'BinnedDensity']
+
+
+class StreamingMoments:
+    """Mergeable sufficient statistics of a univariate sample, from which
+    closed-form maximum likelihood estimators can be calculated."""
+
+    def __init__(self):
+        """Mergeable sufficient statistics of a univariate sample."""
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        self._sum_abs: float = 0.0
+        self._min: float = np.inf
+        self._max: float = -np.inf
+
+    def _combine(self, count: int, mean: float, m2: float, sum_abs: float,
+                 xmin: float, xmax: float) -> None:
+        """Combines the statistics of another sample with these, using
+        Chan et al.'s pairwise update of the mean and sum of squares."""
+        if count == 0:
+            return
+        total: int = self._count + count
+        delta: float = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + (delta ** 2) * self._count * count / total
+        self._count = total
+        self._sum_abs += sum_abs
+        self._min = min(self._min, xmin)
+        self._max = max(self._max, xmax)
+
+    def update(self, values: np.ndarray) -> None:
+        """Adds a chunk of the sample.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            A flattened numpy array of sample values.
+        """
+        if values.size == 0:
+            return
+        mean: float = float(values.mean())
+        self._combine(values.size, mean, float(np.sum((values - mean) ** 2)),
+                      float(np.abs(values).sum()), float(values.min()),
+                      float(values.max()))
+
+    def merge(self, other) -> None:
+        """Merges the statistics of another sample into these.
+
+        Parameters
+        ----------
+        other: StreamingMoments
+            The statistics of the other sample.
+        """
+        self._combine(other._count, other._mean, other._m2, other._sum_abs,
+                      other._min, other._max)
+
+    @property
+    def count(self) -> int:
+        """The number of observations."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """The sample mean."""
+        return self._mean
+
+    @property
+    def sum(self) -> float:
+        """The sum of the observations."""
+        return self._mean * self._count
+
+    @property
+    def sum_abs(self) -> float:
+        """The sum of the absolute values of the observations."""
+        return self._sum_abs
+
+    @property
+    def variance(self) -> float:
+        """The (biased) sample variance."""
+        return self._m2 / self._count if self._count > 0 else np.nan
+
+    @property
+    def min(self) -> float:
+        """The smallest observation."""
+        return self._min
+
+    @property
+    def max(self) -> float:
+        """The largest observation."""
+        return self._max
+
+
+class KLLSketch:
+    """A mergeable KLL quantile sketch.
+
+    Observations are held in a hierarchy of compactors, with each observation
+    at level h representing 2^h observations of the sample. When a compactor
+    exceeds its capacity, its observations are sorted and every other one,
+    from a random offset, promoted to the next level. Capacities decrease
+    geometrically from the top level down, so the sketch holds
+    O(k log(n / k)) observations, with rank errors of order n / k.
+    """
+    _C: float = 2 / 3
+    _MIN_CAPACITY: int = 2
+
+    def __init__(self, k: int = 200, seed: int = None):
+        """A mergeable KLL quantile sketch.
+
+        Parameters
+        ----------
+        k: int
+            The capacity of the top compactor. Larger values give more
+            accurate quantiles at the cost of memory.
+            Default is 200.
+        seed: int
+            The seed used when choosing which observations to promote.
+            Default is None.
+        """
+        if not (isinstance(k, int) and k >= self._MIN_CAPACITY):
+            raise TypeError(f"k must be an integer greater than or equal to "
+                            f"{self._MIN_CAPACITY}.")
+        self._k: int = k
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+        self._levels: list = [np.empty(0)]
+        self._count: int = 0
+
+    def _capacity(self, level: int) -> int:
+        """The capacity of the compactor at a given level."""
+        depth: int = len(self._levels) - 1 - level
+        return max(self._MIN_CAPACITY,
+                   int(np.ceil(self._k * self._C ** depth)))
+
+    def _compress(self) -> None:
+        """Compacts levels until each is within its capacity."""
+        level: int = 0
+        while level < len(self._levels):
+            items: np.ndarray = self._levels[level]
+            if items.size <= self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            items = np.sort(items)
+
+            # an odd observation is kept back, so weight is preserved exactly
+            num_kept: int = items.size % 2
+            promoted: np.ndarray = items[num_kept:][self._rng.integers(2)::2]
+            self._levels[level + 1] = np.concatenate(
+                [self._levels[level + 1], promoted])
+            self._levels[level] = items[:num_kept]
+
+            # adding a level lowers the capacities of those below it
+            level = 0
+
+    def update(self, values: np.ndarray) -> None:
+        """Adds a chunk of the sample.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            A flattened numpy array of sample values.
+        """
+        self._levels[0] = np.concatenate([self._levels[0],
+                                          np.asarray(values, dtype=float)])
+        self._count += values.size
+        self._compress()
+
+    def merge(self, other) -> None:
+        """Merges another sketch into this one.
+
+        Parameters
+        ----------
+        other: KLLSketch
+            The sketch of the other sample.
+        """
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._count += other._count
+        self._compress()
+
+    def weighted(self) -> tuple:
+        """Returns the observations held in the sketch and their weights.
+
+        Returns
+        -------
+        weighted: tuple
+            The sorted observations and the number of observations of the
+            sample each represents.
+        """
+        items: np.ndarray = np.concatenate(self._levels)
+        weights: np.ndarray = np.concatenate([
+            np.full(level.size, 2.0 ** h)
+            for h, level in enumerate(self._levels)])
+        order: np.ndarray = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+
+    @property
+    def k(self) -> int:
+        """The capacity of the top compactor."""
+        return self._k
+
+    @property
+    def count(self) -> int:
+        """The number of observations summarised by the sketch."""
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """The number of observations held in the sketch."""
+        return sum(level.size for level in self._levels)
+
+
+class BinnedDensity:
+    """A mergeable histogram of a univariate sample.
+
+    Bins have widths which are powers of two and edges on a global grid, so
+    histograms of different chunks can be merged exactly. When the range of
+    the sample outgrows the number of bins, the bin width is doubled by
+    merging adjacent bins.
+    """
+
+    def __init__(self, num_bins: int = 1024):
+        """A mergeable histogram of a univariate sample.
+
+        Parameters
+        ----------
+        num_bins: int
+            The maximum number of bins.
+            Default is 1024.
+        """
+        if not (isinstance(num_bins, int) and num_bins >= 2):
+            raise TypeError("num_bins must be an integer greater than 1.")
+        self._num_bins: int = num_bins
+        self._exponent: int = None
+        self._start: int = 0
+        self._counts: np.ndarray = np.zeros(0)
+
+    def _coarsen(self) -> None:
+        """Doubles the bin width, merging adjacent bins."""
+        new_start: int = self._start // 2
+        indices: np.ndarray = (self._start + np.arange(self._counts.size)) \
+            // 2 - new_start
+        self._counts = np.bincount(indices, weights=self._counts)
+        self._start = new_start
+        self._exponent += 1
+
+    def _add(self, indices: np.ndarray, counts: np.ndarray) -> None:
+        """Adds counts to the bins with the given global indices."""
+        if self._counts.size > 0:
+            lower: int = min(int(indices.min()), self._start)
+            upper: int = max(int(indices.max()),
+                             self._start + self._counts.size - 1)
+        else:
+            lower, upper = int(indices.min()), int(indices.max())
+        while upper - lower + 1 > self._num_bins:
+            self._coarsen()
+            indices = indices // 2
+            lower, upper = lower // 2, upper // 2
+
+        new_counts: np.ndarray = np.zeros(upper - lower + 1)
+        offset: int = self._start - lower
+        new_counts[offset: offset + self._counts.size] = self._counts
+        np.add.at(new_counts, indices - lower, counts)
+        self._counts, self._start = new_counts, lower
+
+    def update(self, values: np.ndarray) -> None:
+        """Adds a chunk of the sample.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            A flattened numpy array of sample values.
+        """
+        if values.size == 0:
+            return
+        if self._exponent is None:
+            span: float = float(values.max() - values.min())
+            width: float = span / (self._num_bins - 1) if span > 0 else 1.0
+            self._exponent = int(np.ceil(np.log2(width)))
+        indices: np.ndarray = np.floor(
+            values / self.width).astype(np.int64)
+        self._add(indices, np.ones(values.size))
+
+    def merge(self, other) -> None:
+        """Merges the histogram of another sample into this one.
+
+        Parameters
+        ----------
+        other: BinnedDensity
+            The histogram of the other sample.
+        """
+        if other._exponent is None:
+            return
+        if self._exponent is None:
+            self._exponent, self._start = other._exponent, other._start
+            self._counts = other._counts.copy()
+            return
+        while self._exponent < other._exponent:
+            self._coarsen()
+        indices: np.ndarray = other._start + np.arange(other._counts.size)
+        indices = indices // (2 ** (self._exponent - other._exponent))
+        self._add(indices, other._counts)
+
+    @property
+    def width(self) -> float:
+        """The width of each bin."""
+        return 2.0 ** self._exponent
+
+    @property
+    def centers(self) -> np.ndarray:
+        """The centers of the bins."""
+        return (self._start + np.arange(self._counts.size) + 0.5) * self.width
+
+    @property
+    def counts(self) -> np.ndarray:
+        """The number of observations in each bin."""
+        return self._counts
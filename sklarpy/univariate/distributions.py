@@ -13,61 +13,99 @@ from sklarpy.univariate.distributions_map import distributions_map, \
 
 __all__ = [*distributions_map['all']]
 
+# Distributions are built on first access, by the module-level __getattr__,
+# so importing sklarpy does not pay for wrapping every scipy distribution.
+
 
 ###############################################################################
 # Continuous (Parametric)
 ###############################################################################
-def build_cp_str(dist: str, name: str) -> str:
-    s: str = f"{name}: PreFitParametricContinuousUnivariate = " \
-             f"PreFitParametricContinuousUnivariate('{name}', {dist}.pdf, " \
-             f"{dist}.cdf, {dist}.ppf, {dist}.support, {dist}.fit)"
-    if 'rvs' in dir(eval(dist)):
-        s = f"{s[:-1]}, {dist}.rvs)"
-    return s
-
-
-for name in scipy_cp_names:
-    dist: str = f"scipy.stats.{name}"
-    s: str = build_cp_str(dist, name)
-    exec(s)
-
-for scipy_name, sklarpy_name in cp_rename_dict.items():
-    dist: str = f"scipy.stats.{scipy_name}"
-    s: str = build_cp_str(dist, sklarpy_name)
-    exec(s)
-
-for name in sklarpy_cp_names:
-    dist: str = f"_{name}"
-    s: str = build_cp_str(dist, name)
-    exec(s)
-
-skewed_t = PreFitParametricContinuousUnivariate(
-    'skewed_t', _skewed_t.pdf, _skewed_t.cdf,
-    _skewed_t.ppf, _skewed_t.support, _skewed_t.fit
-)
+def _build_cp(name: str, dist) -> PreFitParametricContinuousUnivariate:
+    """Wraps a scipy or sklarpy continuous distribution."""
+    rvs = dist.rvs if hasattr(dist, 'rvs') else None
+    return PreFitParametricContinuousUnivariate(
+        name, dist.pdf, dist.cdf, dist.ppf, dist.support, dist.fit, rvs,
+        dist.logpdf)
+
+
+_cp_sources: dict = {
+    **{name: name for name in scipy_cp_names},
+    **{sklarpy_name: scipy_name
+       for scipy_name, sklarpy_name in cp_rename_dict.items()},
+}
+_sklarpy_cp_objs: dict = {'gh': _gh, 'gig': _gig, 'ig': _ig}
+
+
+def _build_skewed_t() -> PreFitParametricContinuousUnivariate:
+    """Builds the skewed-t distribution, which has no rvs function."""
+    return PreFitParametricContinuousUnivariate(
+        'skewed_t', _skewed_t.pdf, _skewed_t.cdf,
+        _skewed_t.ppf, _skewed_t.support, _skewed_t.fit,
+        logpdf=_skewed_t.logpdf
+    )
+
 
 ###############################################################################
 # Discrete (Parametric)
 ###############################################################################
-for scipy_name, sklarpy_name in dp_rename_dict.items():
-    dist: str = f"scipy.stats.{scipy_name}"
-    s: str = f"{sklarpy_name}: PreFitParametricDiscreteUnivariate = " \
-             f"PreFitParametricDiscreteUnivariate('{sklarpy_name}', " \
-             f"{dist}.pmf, {dist}.cdf, {dist}.ppf, {dist}.support, " \
-             f"{sklarpy_name}_fit)"
-    if 'rvs' in dir(eval(dist)):
-        s = f"{s[:-1]}, {dist}.rvs)"
-    exec(s)
+_dp_fits: dict = {
+    'poisson': poisson_fit, 'planck': planck_fit,
+    'discrete_laplace': discrete_laplace_fit,
+    'discrete_uniform': discrete_uniform_fit, 'geometric': geometric_fit
+}
+_dp_sources: dict = {sklarpy_name: scipy_name for scipy_name, sklarpy_name
+                     in dp_rename_dict.items()}
+
+
+def _build_dp(name: str) -> PreFitParametricDiscreteUnivariate:
+    """Wraps a scipy discrete distribution."""
+    dist = getattr(scipy.stats, _dp_sources[name])
+    rvs = dist.rvs if hasattr(dist, 'rvs') else None
+    return PreFitParametricDiscreteUnivariate(
+        name, dist.pmf, dist.cdf, dist.ppf, dist.support, _dp_fits[name],
+        rvs, dist.logpmf)
+
 
 ###############################################################################
 # Numerical/Non-Parametric
 ###############################################################################
-gaussian_kde = PreFitNumericalContinuousUnivariate('gaussian-kde', kde_fit)
+_numerical_builders: dict = {
+    'gaussian_kde': lambda: PreFitNumericalContinuousUnivariate(
+        'gaussian-kde', kde_fit),
+    'empirical': lambda: PreFitNumericalContinuousUnivariate(
+        'empirical', continuous_empirical_fit),
+    'discrete_empirical': lambda: PreFitNumericalDiscreteUnivariate(
+        'discrete-empirical', discrete_empirical_fit),
+}
+
+
+###############################################################################
+# Lazy Registry
+###############################################################################
+def _build(name: str):
+    """Builds the pre-fit distribution with the given name."""
+    if name in _cp_sources:
+        return _build_cp(name, getattr(scipy.stats, _cp_sources[name]))
+    elif name in sklarpy_cp_names:
+        return _build_cp(name, _sklarpy_cp_objs[name])
+    elif name == 'skewed_t':
+        return _build_skewed_t()
+    elif name in _dp_sources:
+        return _build_dp(name)
+    return _numerical_builders[name]()
+
+
+_buildable: frozenset = frozenset([*__all__, 'skewed_t'])
+
+
+def __getattr__(name: str):
+    if name in _buildable:
+        dist = _build(name)
+        # caching, so each distribution is only built once
+        globals()[name] = dist
+        return dist
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-empirical = PreFitNumericalContinuousUnivariate(
-    'empirical', continuous_empirical_fit
-)
 
-discrete_empirical = PreFitNumericalDiscreteUnivariate(
-    'discrete-empirical', discrete_empirical_fit
-)
+def __dir__() -> list:
+    return sorted({*globals(), *_buildable})
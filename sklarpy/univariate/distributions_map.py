@@ -9,12 +9,9 @@ def get_scipy_names(names, required, rename_dict):
     """Returns the names of the distributions available in scipy.stats."""
     scipy_names: deque = deque()
     for name in names:
-        dist = eval(f"scipy.stats.{name}")
-        dist_dir = dir(dist)
-        for req in required:
-            if req not in dist_dir:
-                continue
-        scipy_names.append(name)
+        dist = getattr(scipy.stats, name)
+        if all(hasattr(dist, req) for req in required):
+            scipy_names.append(name)
 
     for name in rename_dict:
         if name in scipy_names:
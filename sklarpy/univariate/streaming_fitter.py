@@ -0,0 +1,337 @@
+# Contains code to determine the univariate distribution which best fits a
+# dataset too large to hold in memory
+import numpy as np
+import pandas as pd
+from typing import Union, Iterable
+from functools import partial
+import copy
+import logging
+import warnings
+
+from sklarpy.univariate import distributions as prefit_distributions
+from sklarpy.univariate._fitter_base import UnivariateFitterBase
+from sklarpy.univariate._sketches import StreamingMoments, KLLSketch, \
+    BinnedDensity
+from sklarpy.univariate._distributions._streaming import \
+    sketch_empirical_fit, sketch_discrete_empirical_fit, binned_kde_fit
+from sklarpy.univariate._inverse_transform import inverse_transform
+from sklarpy.utils._errors import FitError
+from sklarpy.utils._input_handlers import check_univariate_data, \
+    check_array_datatype
+
+__all__ = ['StreamingUnivariateFitter']
+
+
+class StreamingUnivariateFitter(UnivariateFitterBase):
+    """Used for determining the best univariate/marginal distribution for
+    a random sample which is too large to hold in memory, consuming it in
+    chunks."""
+    _OBJ_NAME = 'StreamingUnivariateFitter'
+    _GOF_SAMPLE_SIZE: int = 10000
+
+    def __init__(self, name: str = None, sketch_size: int = 1000,
+                 num_bins: int = 4096, seed: int = None):
+        """Used for determining the best univariate/marginal distribution
+        for a random sample which is too large to hold in memory.
+
+        The sample is consumed in chunks, using partial_fit or fit, with
+        only bounded-size summaries of it kept:
+
+        - the count, mean, sum of squares, sum of absolute values, minimum
+          and maximum of the sample, from which the normal, expon and uniform
+          (continuous data) or poisson, geometric, planck, discrete_laplace
+          and discrete_uniform (discrete data) distributions are fitted by
+          maximum likelihood exactly.
+        - a KLL quantile sketch, backing the empirical (continuous data) or
+          discrete-empirical (discrete data) distributions.
+        - a histogram, backing a binned gaussian-kde distribution
+          (continuous data).
+
+        Summaries are mergeable, so fitters of different parts of a sample
+        can be combined using merge.
+
+        Fit statistics are approximated from the summaries. Log-likelihoods
+        and sums of squared errors are weighted sums over the observations
+        held in the quantile sketch, while goodness of fit tests are
+        performed on a random sample of up to 10,000 observations drawn from
+        the sketch. As this sample is drawn from the empirical distribution
+        backed by the sketch, goodness of fit tests are not performed for
+        it, with its test statistics and p-values left as NaN.
+
+        Parameters
+        ----------
+        name: str
+            The name of your StreamingUnivariateFitter object. Used when
+            saving. If none, 'StreamingUnivariateFitter' is used as a name.
+            Default is None.
+        sketch_size: int
+            The size parameter, k, of the KLL quantile sketch. Quantiles are
+            accurate to roughly 1 / k.
+            Default is 1000.
+        num_bins: int
+            The maximum number of bins in the histogram backing the
+            gaussian-kde distribution.
+            Default is 4096.
+        seed: int
+            The seed used by the quantile sketch and when drawing samples
+            from it.
+            Default is None.
+        """
+        super().__init__(name)
+        self._seed: int = seed
+        self._moments: StreamingMoments = StreamingMoments()
+        self._sketch: KLLSketch = KLLSketch(sketch_size, seed)
+        self._density: BinnedDensity = BinnedDensity(num_bins)
+        self._datatype = int
+        self._stale: bool = False
+
+    def __str__(self):
+        return f"StreamingUnivariateFitter(fitted={self._fitted}, " \
+               f"num_data_points={self.num_data_points})"
+
+    def partial_fit(self, data: Union[pd.DataFrame, pd.Series, np.ndarray,
+                                      Iterable]):
+        """Adds a chunk of the sample to the fitter.
+
+        Parameters
+        ----------
+        data : Union[pd.DataFrame, pd.Series, np.ndarray, Iterable]
+            A chunk of the sample.
+            Can be a pd.DataFrame, pd.Series, np.ndarray or any other
+            iterable containing data. Data may be continuous or discrete.
+
+        Returns
+        -------
+        self
+            The updated StreamingUnivariateFitter object.
+        """
+        chunk: np.ndarray = check_univariate_data(data)
+        if chunk.size == 0:
+            return self
+        if check_array_datatype(chunk) == float:
+            self._datatype = float
+        chunk = chunk.astype(float)
+        if np.isnan(chunk).any():
+            raise ValueError("data must not contain NaN values.")
+
+        self._moments.update(chunk)
+        self._sketch.update(chunk)
+        self._density.update(chunk)
+        self._fitted = self._stale = True
+        return self
+
+    def fit(self, chunks: Iterable, raise_error: bool = False):
+        """Fits distributions to a sample consumed in chunks.
+
+        Parameters
+        ----------
+        chunks: Iterable
+            An iterable, such as a generator, yielding chunks of the sample.
+            Each chunk can be a pd.DataFrame, pd.Series, np.ndarray or any
+            other iterable containing data. A single numpy array or pandas
+            object is treated as a single chunk.
+        raise_error: bool
+            Whether to raise an error if no distributions are fitted.
+            Default is False.
+
+        Returns
+        -------
+        self
+            A fitted StreamingUnivariateFitter object.
+        """
+        if isinstance(chunks, (np.ndarray, pd.DataFrame, pd.Series)):
+            chunks = [chunks]
+        elif not isinstance(chunks, Iterable):
+            raise TypeError("chunks must be an iterable.")
+
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        self._refresh()
+        return self._fit_finish(raise_error)
+
+    def merge(self, other):
+        """Merges the summaries of another StreamingUnivariateFitter, fitted
+        to a different part of the sample, into this one.
+
+        Parameters
+        ----------
+        other: StreamingUnivariateFitter
+            The fitter to merge into this one.
+
+        Returns
+        -------
+        self
+            The updated StreamingUnivariateFitter object.
+        """
+        if not isinstance(other, StreamingUnivariateFitter):
+            raise TypeError("other must be a StreamingUnivariateFitter.")
+        if other.num_data_points == 0:
+            return self
+        if other._datatype == float:
+            self._datatype = float
+
+        self._moments.merge(other._moments)
+        self._sketch.merge(other._sketch)
+        self._density.merge(other._density)
+        self._fitted = self._stale = True
+        return self
+
+    def _closed_form_params(self) -> dict:
+        """Returns the maximum likelihood estimators of the parameters of the
+        distributions which can be fitted from the sample's moments."""
+        m: StreamingMoments = self._moments
+        count: np.float64 = np.float64(m.count)
+        if self._datatype == float:
+            return {
+                'normal': (m.mean, np.sqrt(m.variance)),
+                'expon': (m.min, m.mean - m.min),
+                'uniform': (m.min, m.max - m.min),
+            }
+        return {
+            'poisson': (m.mean,),
+            'geometric': (count / m.sum,),
+            'planck': (np.log(1 + (count / m.sum)),),
+            'discrete_laplace': (np.arcsinh(count / m.sum_abs),),
+            'discrete_uniform': (int(m.min), int(m.max + 1)),
+        }
+
+    def _numerical_funcs(self) -> dict:
+        """Returns the fitted pdf, cdf, ppf, support and rvs functions of the
+        numerical distributions backed by the summaries of the sample."""
+        items, weights = self._sketch.weighted()
+        m: StreamingMoments = self._moments
+        if self._datatype == int:
+            return {'discrete_empirical': sketch_discrete_empirical_fit(
+                items, weights, int(m.min), int(m.max))}
+
+        # a window of quantiles well above the rank error of the sketch
+        window: float = min(20 / self._sketch.k, 0.1)
+        return {
+            'empirical': sketch_empirical_fit(items, weights, m.min, m.max,
+                                              window),
+            'gaussian_kde': binned_kde_fit(
+                self._density.centers, self._density.counts,
+                self._density.width, np.sqrt(m.variance), m.min, m.max),
+        }
+
+    def _fit_info(self, dist, params: tuple, empirical_funcs: tuple,
+                  is_empirical: bool) -> dict:
+        """Returns information about the fit of a distribution, with fit
+        statistics approximated from the summaries of the sample. Goodness of
+        fit tests are not performed for the empirical distribution backed by
+        the sketch, as the sample they use is drawn from it."""
+        items, weights = self._sketch.weighted()
+        empirical_pdf, empirical_cdf, empirical_ppf = empirical_funcs[:3]
+
+        logpdf_values: np.ndarray = dist.logpdf(items, params)
+        pdf_values: np.ndarray = np.exp(logpdf_values)
+        loglikelihood: float = float(np.sum(weights * logpdf_values))
+        num_data_points: int = self.num_data_points
+        num_params: int = len(params)
+        sse: float = float(np.sum(
+            weights * (pdf_values - empirical_pdf(items)) ** 2))
+        gof: pd.DataFrame = dist._gof(self._data, params)
+        if is_empirical:
+            gof = pd.DataFrame(np.nan, index=gof.index, columns=gof.columns)
+
+        return {
+            "fitted_to_data": True,
+            "params": params,
+            "support": dist.support(params),
+            "fitted_domain": (self._moments.min, self._moments.max),
+            "empirical_pdf": empirical_pdf,
+            "empirical_cdf": empirical_cdf,
+            "empirical_ppf": empirical_ppf,
+            "gof": gof,
+            "likelihood": float(np.exp(loglikelihood)),
+            "loglikelihood": loglikelihood,
+            "num_data_points": num_data_points,
+            "num_params": num_params,
+            "aic": 2 * num_params - 2 * loglikelihood,
+            "bic": -2 * loglikelihood
+            + np.log(num_data_points) * num_params,
+            "sse": sse,
+            "parametric": dist._PARAMETRIC,
+        }
+
+    def _refresh(self) -> None:
+        """Fits distributions to the current summaries of the sample, if
+        these have changed since they were last fitted."""
+        if not self._stale:
+            return
+        self._fitted_dists, self._fitted_summaries = {}, {}
+        numerical_funcs: dict = self._numerical_funcs()
+        empirical_name: str = 'empirical' if self._datatype == float \
+            else 'discrete_empirical'
+        empirical_funcs: tuple = numerical_funcs[empirical_name]
+
+        # a random sample drawn from the sketch, used for goodness of fit
+        # tests and plotting
+        num_points: int = min(self.num_data_points, self._GOF_SAMPLE_SIZE)
+        q: np.ndarray = np.random.default_rng(self._seed).uniform(
+            size=num_points)
+        self._data = empirical_funcs[2](q).astype(self._datatype)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            closed_form_params: dict = self._closed_form_params()
+        fits: list = [
+            *((name, params, None)
+              for name, params in closed_form_params.items()),
+            *((name, (), funcs) for name, funcs in numerical_funcs.items())]
+        for name, params, funcs in fits:
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    obj = copy.copy(getattr(prefit_distributions, name))
+                    if funcs is not None:
+                        # numerical distribution
+                        (obj._pdf, obj._cdf, obj._ppf, obj._support,
+                         rvs) = funcs
+                        obj._rvs = partial(inverse_transform, ppf=obj.ppf) \
+                            if rvs is None else rvs
+                    fitted = obj._FIT_TO(obj, self._fit_info(
+                        obj, params, empirical_funcs,
+                        name == empirical_name))
+                    summary: pd.DataFrame = fitted.summary
+            except Exception as e:
+                logging.warning(f"Unable to fit {name} distribution.\n{e}")
+                continue
+            summary.columns = [fitted.name]
+            self._add_fitted((fitted, summary))
+        self._stale = False
+
+    def _fit_empirical(self):
+        """Returns the empirical distribution backed by the quantile
+        sketch."""
+        self._refresh()
+        name: str = 'empirical' if self._datatype == float \
+            else 'discrete-empirical'
+        return self._fitted_dists[name]
+
+    def get_summary(self, sortby: str = None, significant: bool = False,
+                    pvalue: float = 0.05) -> pd.DataFrame:
+        """Returns a summary of the fitted distributions.
+        See UnivariateFitter.get_summary documentation for more."""
+        self._refresh()
+        return super().get_summary(sortby, significant, pvalue)
+
+    def plot(self, *args, **kwargs) -> None:
+        """Plots the fitted distributions, using a representative sample of
+        the quantile sketch in place of the data.
+        See UnivariateFitter.plot documentation for more."""
+        self._refresh()
+        return super().plot(*args, **kwargs)
+
+    @property
+    def fitted_distributions(self) -> dict:
+        """All distributions fitted to the dataset."""
+        if self._fitted:
+            self._refresh()
+            return self._fitted_dists
+        raise FitError("StreamingUnivariateFitter has not been fitted to "
+                       "data. Call .fit or .partial_fit method.")
+
+    @property
+    def num_data_points(self) -> int:
+        """The number of observations consumed."""
+        return self._moments.count
@@ -5,23 +5,22 @@ from typing import Union, Iterable, Callable
 import logging
 import pandas as pd
 from functools import partial
-from concurrent.futures import ProcessPoolExecutor
-from pickle import PicklingError
-import matplotlib.pyplot as plt
-import math
 import warnings
 
-from sklarpy.univariate.distributions import *
+from sklarpy.univariate import distributions as prefit_distributions
 from sklarpy.univariate.distributions_map import distributions_map
-from sklarpy.utils._errors import SignificanceError, FitError
+from sklarpy.univariate._fit_context import FitContext
+from sklarpy.univariate._fitter_base import UnivariateFitterBase
+from sklarpy.univariate._fit_pool import FitPool
+from sklarpy.univariate._racing import race, RACING_CRITERIA
+from sklarpy.univariate._prefit_dists import PreFitNumericalUnivariateBase
 from sklarpy.utils._input_handlers import check_univariate_data, \
     check_array_datatype
-from sklarpy.utils._serialize import Savable
 
 __all__ = ['UnivariateFitter']
 
 
-class UnivariateFitter(Savable):
+class UnivariateFitter(UnivariateFitterBase):
     """Used for determining the best univariate/marginal distribution
     for a random sample."""
     _OBJ_NAME = 'UnivariateFitter'
@@ -42,26 +41,27 @@ class UnivariateFitter(Savable):
             If none, 'UnivariateFitter' is used as a name.
             Default is None.
         """
-        self._data: np.ndarray = check_univariate_data(data)
+        super().__init__(name)
+        self._data = check_univariate_data(data)
         self._datatype = check_array_datatype(self._data)
         self._data = self._data.astype(self._datatype)
-        self._fitted: bool = False
-        self._fitted_dists: dict = {}
-        self._fitted_summaries: dict = {}
-        super().__init__(name)
 
     def __str__(self):
         return f"UnivariateFitter(fitted={self._fitted})"
 
-    def __repr__(self):
-        return self.__str__()
+    def _fit_empirical(self):
+        """Fits the empirical distribution of the data."""
+        if self._datatype == int:
+            return prefit_distributions.discrete_empirical.fit(self._data)
+        return prefit_distributions.empirical.fit(self._data)
 
-    def _fit_single_dist(self, name: str, fit_data: np.ndarray, data_type
+    @staticmethod
+    def _fit_single_dist(name: str, fit_data: FitContext, data_type
                          ) -> Union[tuple, None]:
         """Fits a single distribution to the dataset."""
         try:
             # retrieving a distribution
-            dist = eval(name)
+            dist = getattr(prefit_distributions, name)
 
             if (dist.X_DATA_TYPE == int) and (data_type == float):
                 logging.warning(f'Cannot fit discrete {name} distribution to '
@@ -103,42 +103,61 @@ class UnivariateFitter(Savable):
             res = res.difference(distributions_map['all numerical'])
         return set(d.replace('-', '_') for d in res)
 
-    def _fit_processpoolexecutor(self, distributions: set, func: Callable,
-                                 timeout):
-        """Fits distributions using ProcessPoolExecutor."""
-        remaining: int = len(distributions)
-        if remaining == 0:
-            # early stopping
-            return None
-
-        # fitting
-        with ProcessPoolExecutor() as executor:
-            results = executor.map(func, distributions, timeout=timeout)
+    @staticmethod
+    def _fit_with_pool(pool: FitPool, data: np.ndarray, fits: dict) -> None:
+        """Fits distributions to the columns of a dataset in parallel.
 
-        # processing results
-
-        while remaining > 0:
-            remaining -= 1
-            try:
-                for res in results:
-                    if res is not None:
-                        self._fitted_dists[res[0].name] = res[0]
-                        self._fitted_summaries[res[0].name] = res[1]
-            except PicklingError:
-                pass
+        Parameters
+        ----------
+        pool: FitPool
+            The pool of worker processes to fit distributions with.
+        data: np.ndarray
+            The 2-dimensional dataset containing the variables to fit
+            distributions to as columns.
+        fits: dict
+            Column indexes as keys, with tuples of (fitter, distributions,
+            data_type, timeout) as values, where fitter is the
+            UnivariateFitter of the column.
+        """
+        tasks: dict = {
+            (column, name): (column, fitter._datatype, name, data_type,
+                             timeout)
+            for column, (fitter, distributions, data_type, timeout)
+            in fits.items() for name in distributions}
+
+        results: dict = dict(pool.fit(data, tasks))
+
+        # storing results in the order requested, so fitted distributions
+        # are ordered as when fitted sequentially
+        fit_data: dict = {}
+        for column, name in tasks:
+            fitter, _, data_type, timeout = fits[column]
+            res = results[(column, name)]
+            if isinstance(res, TimeoutError):
+                logging.warning(f"Unable to fit {name} distribution within "
+                                f"{timeout} seconds.")
+                continue
+            elif isinstance(res, Exception):
+                # e.g. the fitted distribution could not be pickled, so it is
+                # fitted sequentially instead
+                if column not in fit_data:
+                    fit_data[column] = FitContext(
+                        fitter._data.astype(data_type))
+                res = fitter._fit_single_dist(name, fit_data[column],
+                                              data_type)
+            fitter._add_fitted(res)
 
     def _fit_sequentially(self, distributions: set, func: Callable):
         """Fits distributions non-concurrently."""
         for name in distributions:
-            res = func(name)
-            if res is not None:
-                self._fitted_dists[res[0].name] = res[0]
-                self._fitted_summaries[res[0].name] = res[1]
+            self._add_fitted(func(name))
 
     def fit(self, distributions: Union[str, Iterable] = None, data_type=None,
             multimodal: bool = False, numerical: bool = False,
             timeout: int = 10, raise_error: bool = False,
-            use_processpoolexecutor: bool = False, **kwargs):
+            use_processpoolexecutor: bool = False, pool: FitPool = None,
+            racing: bool = False, racing_criterion: str = 'aic',
+            shortlist: int = 5, **kwargs):
         """Fits the specified probability distributions to the data.
 
         Parameters
@@ -182,12 +201,37 @@ class UnivariateFitter(Savable):
             Whether to raise an error if no distributions are fitted.
             Default is False.
         use_processpoolexecutor: bool
-            Whether to use ProcessPoolExecutor to fit distributions
-            concurrently.
+            Whether to fit distributions concurrently in a pool of worker
+            processes, with the data placed in shared memory.
             Note that, if code is not run inside
             `if __name__ == '__main__': ... `
             in the main module, you may receive a runtime error.
             Default is False.
+        pool: FitPool
+            A pool of worker processes to fit distributions concurrently
+            with. Pools can be reused across many fits, avoiding starting new
+            worker processes each time. If None and use_processpoolexecutor
+            is True, a pool is created for this fit only.
+            Default is None.
+        racing: bool
+            Whether to prune the parametric distributions before fitting, by
+            racing them on successively larger subsamples of the data.
+            Every candidate is fitted to a small subsample, with the worse
+            half, by racing_criterion, dropped and the survivors refitted to
+            a subsample twice the size, until at most shortlist candidates
+            remain. Candidates whose fitted support does not contain the data
+            are dropped immediately. Only the shortlisted distributions are
+            fitted to the full dataset, with goodness of fit tests performed.
+            Numerical distributions are not raced.
+            Default is False.
+        racing_criterion: str
+            The criterion used to rank candidates when racing. One of 'aic',
+            'bic' or 'sse'.
+            Default is 'aic'.
+        shortlist: int
+            The maximum number of parametric distributions to fit to the full
+            dataset when racing.
+            Default is 5.
 
         Returns
         -------
@@ -195,6 +239,41 @@ class UnivariateFitter(Savable):
             A fitted UnivariateFitter object.
         """
 
+        distributions, data_type = self._fit_setup(
+            distributions, data_type, multimodal, numerical, timeout,
+            raise_error, use_processpoolexecutor, pool, racing,
+            racing_criterion, shortlist)
+
+        # fitting distributions
+        if use_processpoolexecutor or (pool is not None):
+            fits: dict = {0: (self, distributions, data_type, timeout)}
+            data: np.ndarray = self._data.reshape(-1, 1)
+            if pool is None:
+                with FitPool() as pool:
+                    self._fit_with_pool(pool, data, fits)
+            else:
+                self._fit_with_pool(pool, data, fits)
+        else:
+            # putting data in the correct data-type, with the empirical
+            # distributions of the data shared between all fitted
+            # distributions
+            fit_data: FitContext = FitContext(self._data.astype(data_type))
+            func: Callable = partial(self._fit_single_dist, fit_data=fit_data,
+                                     data_type=data_type)
+            self._fit_sequentially(distributions, func)
+        return self._fit_finish(raise_error)
+
+    def _fit_setup(self, distributions: Union[str, Iterable] = None,
+                   data_type=None, multimodal: bool = False,
+                   numerical: bool = False, timeout: int = 10,
+                   raise_error: bool = False,
+                   use_processpoolexecutor: bool = False,
+                   pool: FitPool = None, racing: bool = False,
+                   racing_criterion: str = 'aic', shortlist: int = 5,
+                   **kwargs) -> tuple:
+        """Checks the arguments of fit, returning the set of distributions
+        to fit, pruned by racing if requested, and the data-type to fit them
+        to."""
         # argument checks
         if data_type is None:
             data_type = self._datatype
@@ -218,11 +297,14 @@ class UnivariateFitter(Savable):
             raise TypeError("Distributions must be a string or iterable.")
 
         for bool_arg in (multimodal, numerical, raise_error,
-                         use_processpoolexecutor):
+                         use_processpoolexecutor, racing):
             if not isinstance(bool_arg, bool):
                 raise TypeError("multimodal, numerical, raise_error, "
-                                "use_processpoolexecutor arguments must be "
-                                "bool.")
+                                "use_processpoolexecutor, racing arguments "
+                                "must be bool.")
+
+        if not ((pool is None) or isinstance(pool, FitPool)):
+            raise TypeError("pool must be None or a FitPool.")
 
         if isinstance(timeout, int):
             if timeout <= 0:
@@ -230,398 +312,34 @@ class UnivariateFitter(Savable):
         else:
             raise TypeError("timeout must be a positive integer.")
 
-        # putting data in the correct data-type
-        fit_data: np.ndarray = self._data.astype(data_type)
+        if racing_criterion not in RACING_CRITERIA:
+            raise ValueError(f"racing_criterion must be one of "
+                             f"{RACING_CRITERIA}.")
+
+        if not (isinstance(shortlist, int) and shortlist > 0):
+            raise TypeError("shortlist must be a positive integer.")
 
         # getting list of distributions
         distributions: set = self._get_distributions(distributions,
                                                      multimodal, numerical)
-
-        # fitting distributions
-        func: Callable = partial(self._fit_single_dist, fit_data=fit_data,
-                                 data_type=data_type)
-        if use_processpoolexecutor:
-            ppe_distributions: set = distributions.intersection(
-                distributions_map['all parametric'])
-            distributions: set = distributions.difference(ppe_distributions)
-            self._fit_processpoolexecutor(ppe_distributions, func, timeout)
-        self._fit_sequentially(distributions, func)
-
-        if len(self._fitted_dists) == 0:
-            msg: str = "Unable to fit any distribution to the data."
-            if raise_error:
-                raise FitError(msg)
-            else:
-                logging.warning(msg)
-        self._fitted = True
-        return self
-
-    def _filter(self, pvalue: float) -> tuple:
-        """method to filter out all distributions which do not statistically
-        fit the data for a given p-value."""
-        if not self._fitted:
-            raise FitError("UnivariateFitter has not been fitted to data. "
-                           "Call .fit method.")
-
-        filtered_dists: dict = {}
-        filtered_summaries: dict = {}
-        for name in self._fitted_dists:
-            dist = self._fitted_dists[name]
-            gof: pd.DataFrame = dist.gof()
-
-            if dist.continuous_or_discrete == 'continuous':
-                # Cramér-von Mises and Kolmogorov-Smirnov gof tests
-                # for continuous distributions
-                cvm_pvalue: float = gof.loc[
-                    'Cramér-von Mises p-value'].values[0]
-                ks_pvalue: float = gof.loc[
-                    'Kolmogorov-Smirnov p-value'].values[0]
-
-                # keeping only the distributions which are significant
-                # for BOTH tests
-                if (cvm_pvalue >= pvalue) and (ks_pvalue >= pvalue):
-                    filtered_dists[name] = dist
-                    filtered_summaries[name] = self._fitted_summaries[name]
-
-            elif dist.continuous_or_discrete == 'discrete':
-                # Chi-squared gof tests for discrete distributions
-                chisq_pvalue: float = gof.loc['chi-square p-value'].values[0]
-
-                if chisq_pvalue >= pvalue:
-                    filtered_dists[name] = dist
-                    filtered_summaries[name] = self._fitted_summaries[name]
-        return filtered_dists, filtered_summaries
-
-    def get_summary(self, sortby: str = None, significant: bool = False,
-                    pvalue: float = 0.05) -> pd.DataFrame:
-        """Returns a summary of the fitted distributions.
-
-        Parameters
-        ----------
-        sortby: str
-            The metric/column to sort the summary by. None to not sort.
-            Default is None.
-        significant: bool
-            True to remove distributions which fail goodness of fit
-            significance tests.
-            Default is False.
-        pvalue: float
-            The p-value to use when rejecting the null hypothesis in goodness
-            of fit tests.
-            Default is 0.05.
-
-        Returns
-        -------
-        summary: pd.DataFrame
-            The summary of fitted distributions.
-        """
-        if not self._fitted:
-            raise FitError("UnivariateFitter has not been fitted to data. "
-                           "Call .fit method.")
-
-        # argument checks
-        if not isinstance(significant, bool):
-            raise TypeError("significant must be a boolean.")
-
-        if not (isinstance(pvalue, float) or isinstance(pvalue, int)):
-            raise TypeError("pvalue must be a float.")
-        elif (pvalue > 1) or (pvalue < 0):
-            raise ValueError("pvalue must be a valid probability.")
-
-        if significant:
-            _, summaries = self._filter(pvalue)
-        else:
-            summaries = self._fitted_summaries
-
-        if len(summaries) == 0:
-            # No distributions fitted successfully
-            return pd.DataFrame()
-
-        summary: pd.DataFrame = pd.concat(summaries.values(), axis=1
-                                          ).transpose()
-        max_num_params: int = summary['#Params'].max()
-        if max_num_params != 0:
-            # putting columns in desired order
-            cols: list = summary.columns.to_list()
-            param0_index: int = cols.index('param0')
-            param_cols: list = [f'param{i}' for i in range(max_num_params)]
-            non_param_cols: list = [col for col in cols
-                                    if col not in param_cols]
-            new_order: list = [
-                *cols[:param0_index],
-                *param_cols,
-                *non_param_cols[param0_index:]
-            ]
-            summary = summary[new_order]
-
-        if (sortby is None) or (sortby not in summary.columns):
-            return summary
-        return summary.sort_values(by=sortby)
-
-    def get_best(self, significant: bool = True, pvalue: float = 0.05,
-                 raise_error: bool = False, **kwargs):
-        """Returns the fitted probability distribution which minimises the sum
-        of squared error between the empirical and fitted pdfs.
-
-        Parameters
-        ----------
-        significant: bool
-            True to select only from distributions which satisfy goodness of
-            fit significance tests.
-            Default is True.
-        pvalue: float
-            The p-value to use when rejecting the null hypothesis in
-            goodness of fit tests.
-            Default is 0.05.
-        raise_error: bool
-            True to raise an error if no distribution can be returned.
-            If False and no distribution can be returned, an empirical
-            distribution is fitted and returned.
-            Default is False.
-
-        Returns
-        -------
-        best:
-            best fitted distribution.
-        """
-        # argument checks
-        if not isinstance(raise_error, bool):
-            raise TypeError("raise_error must be a boolean.")
-
-        summary: pd.DataFrame = self.get_summary('Sum of Squared Error',
-                                                 significant, pvalue)
-        if len(summary) == 0:
-            # no good distributional fits
-            if raise_error:
-                raise SignificanceError("No statistically significant "
-                                        "distributions fitted.")
-            logging.warning("No statistically significant distributions "
-                            "fitted. Empirical distribution returned.")
-
-            # fitting numerical distributions
-            if self._datatype == int:
-                return discrete_empirical.fit(self._data)
-            return empirical.fit(self._data)
-
-        best = summary.index[0]
-        return self._fitted_dists[best]
-
-    def plot(self, which: Union[str, Iterable] = 'all', pvalue: float = 0.05,
-             xrange: np.ndarray = None, include_empirical: bool = True,
-             empirical_color: str = 'black', qqplot_yx_color: str = 'black',
-             alpha: float = 0.5, empirical_alpha: float = 1.0,
-             qqplot_yx_alpha: float = 1.0, pdf_plot_limit: float = 1.0,
-             figsize: tuple = (16, 8), grid: bool = True,
-             num_to_plot: int = 100, show: bool = True) -> None:
-        """Plots the fitted distributions. Produces subplots of the pdf and
-        cdf.
-
-        Parameters
-        ----------
-        which: Union[str, Iterable]
-            'all', 'best', 'significant', 'best significant' to plot all,
-            the best and significant fitted distributions. which can also be
-            the string name of a fitted distribution.
-            If an iterable, the distribution names which are specified in the
-            iterable and have been fitted are plotted.
-            Default is 'all'.
-        pvalue: float
-            The p-value to use when rejecting the null hypothesis in goodness
-            of fit tests. Used if which is 'significant' or 'best significant'.
-            Default is 0.05.
-        xrange: np.ndarray
-            A user supplied range to plot the distribution
-            (and empirical distribution) over.
-            If not provided, this will be generated.
-        include_empirical: bool
-            Whether to include empirical distribution in your plots.
-            Default is True.
-        empirical_color: str
-            The color in which to plot the empirical distribution.
-            Any acceptable value for the matplotlib.pyplot 'color' argument
-            can be given.
-            Default is 'black'.
-        qqplot_yx_color: str
-            The color in which to plot the y=x line in the QQ-plot. Any
-            acceptable value for the matplotlib.pyplot 'color' argument can be
-            given.
-            Default is 'black'.
-        pdf_plot_limit: float
-            The upper limit for pdf values to use in plots. This may be useful
-            as fitted distributions may sometimes have unreasonably large pdf
-            values which skew the proportions of the plots, making analysis
-            difficult.
-            Default is 1.0.
-        alpha: float
-            The alpha/transparency value to use when plotting the distribution.
-            Default is 0.5
-        empirical_alpha: float
-            The alpha/transparency value to use when plotting the empirical
-            distribution.
-            Default is 1.0.
-        qqplot_yx_alpha: float
-            The alpha/transparency value to use when plotting the y=x line in
-            the QQ-plot.
-        figsize: tuple
-            The size/dimensions of the figure.
-            Default is (16, 8).
-        grid: bool
-            Whether to include a grid in the plots.
-            Default is True.
-        num_to_plot: int
-            The number of points to plot.
-            Default is 100.
-        show: bool
-            Whether to show the plots.
-            Default is True.
-        """
-        if not self._fitted:
-            raise FitError("UnivariateFitter has not been fitted to data. "
-                           "Call .fit method.")
-
-        # argument checks
-        if isinstance(which, str):
-            which = which.lower()
-            if which == 'all':
-                dists = self.get_summary().index
-            elif which == 'significant':
-                summary: pd.DataFrame = self.get_summary(significant=True,
-                                                         pvalue=pvalue)
-                if len(summary) == 0:
-                    raise SignificanceError("No statistically significant "
-                                            "distributions fitted.")
-                dists = summary.index
-            elif which == 'best':
-                dists = [self.get_best().name]
-            elif which == 'best significant':
-                dists = [self.get_best(significant=True, pvalue=pvalue).name]
-            elif which in self._fitted_dists.keys():
-                dists = [which]
-            else:
-                raise ValueError(f"if which is a string, it must be 'all', "
-                                 f"'significant', 'best', 'best significant' "
-                                 f"or the name of a fitted distribution, "
-                                 f"not '{which}'")
-        elif isinstance(which, Iterable):
-            dists = [d for d in which if d in self._fitted_dists.keys()]
-        else:
-            raise TypeError("which must be a string or iterable")
-
-        if xrange is None:
-            if not (isinstance(num_to_plot, int) and num_to_plot >= 1):
-                raise TypeError("invalid argument type in plot. "
-                                "check num_to_plot is a natural number.")
-            xrange: np.ndarray = np.linspace(
-                self._data.min(), self._data.max(), num_to_plot)
-        elif isinstance(xrange, np.ndarray):
-            if xrange.size < 1:
-                raise ValueError("xrange cannot be empty.")
-        else:
-            raise TypeError("xrange must be None or a numpy array.")
-
-        for bool_arg in (include_empirical, grid, show):
-            if not isinstance(bool_arg, bool):
-                raise TypeError("invalid argument type in plot. check "
-                                "include_empirical, grid, show are all "
-                                "boolean.")
-
-        for str_arg in (empirical_color, qqplot_yx_color):
-            if not isinstance(str_arg, str):
-                raise TypeError("invalid argument type in plot. check "
-                                "empirical_color, qqplot_yx_color are all "
-                                "strings.")
-
-        for float_arg in (alpha, empirical_alpha,
-                          qqplot_yx_alpha, pdf_plot_limit):
-            if not isinstance(float_arg, float):
-                raise TypeError("invalid argument type in plot. check alpha, "
-                                "empirical_alpha, qqplot_yx_alpha, "
-                                "pdf_plot_limit are all floats.")
-
-        if not (isinstance(figsize, tuple) and len(figsize) == 2):
-            raise TypeError("invalid argument type in plot. check figsize "
-                            "is a tuple of length 2.")
-
-        # creating qrange
-        qrange: np.ndarray = np.linspace(0, 1, num_to_plot, dtype=float)
-
-        # max pdf value to plot
-        max_pdf_value: float = 0.0
-
-        # creating subplots
-        xlabels: tuple = ("x", "x", "P(X<=q)", "Theoretical Quantiles")
-        ylabels: tuple = ("PDF", "P(X<=x)", "q", "Empirical Quantiles")
-        titles: tuple = ('PDF', 'CDF', 'Inverse CDF', "QQ-Plot")
-        fig, ax = plt.subplots(1, 4, figsize=figsize)
-
-        # fitting empirical dist for plotting
-        if self._datatype == float:
-            empirical_dist = empirical.fit(self._data.astype(float))
-        elif self._datatype == int:
-            empirical_dist = discrete_empirical.fit(self._data.astype(int))
-
-        # plotting empirical distribution
-        empirical_ppf_values: np.ndarray = empirical_dist.ppf(qrange)
-        if include_empirical:
-            empirical_label: str = 'Empirical'
-            empirical_pdf_values: np.ndarray = empirical_dist.pdf(xrange)
-            ax[0].plot(xrange, empirical_pdf_values, color=empirical_color,
-                       alpha=empirical_alpha, label=empirical_label)
-            ax[1].plot(xrange, empirical_dist.cdf(xrange),
-                       color=empirical_color, alpha=empirical_alpha,
-                       label=empirical_label)
-            ax[2].plot(qrange, empirical_ppf_values, color=empirical_color,
-                       alpha=empirical_alpha, label=empirical_label)
-
-            max_pdf_value = empirical_pdf_values.max()
-
-        # plotting distributions
-        ax[3].plot(xrange, xrange, color=qqplot_yx_color,
-                   alpha=qqplot_yx_alpha, label='y=x')
-        for name in dists:
-            dist = self._fitted_dists[name]
-
-            pdf_values: np.ndarray = dist.pdf(xrange)
-            cdf_values: np.ndarray = dist.cdf(xrange)
-            ppf_values: np.ndarray = dist.ppf(qrange)
-
-            ax[0].plot(xrange, pdf_values, alpha=alpha, label=dist.name)
-            ax[1].plot(xrange, cdf_values, alpha=alpha, label=dist.name)
-            ax[2].plot(qrange, ppf_values, alpha=alpha, label=dist.name)
-            ax[3].scatter(ppf_values, empirical_ppf_values, label='Quartiles',
-                          alpha=alpha)
-
-            max_pdf_value = max(max_pdf_value, pdf_values.max())
-        ax[0].set_ylim(0, min(pdf_plot_limit, max_pdf_value))
-
-        # labelling axes
-        for i in range(4):
-            ax[i].set_xlabel(xlabels[i])
-            ax[i].set_ylabel(ylabels[i])
-            ax[i].set_title(titles[i])
-            ax[i].grid(grid)
-
-        # choosing legend location
-        num_dists: int = len(self._fitted_dists)
-        if num_dists <= 10:
-            ncols: int = num_dists
-        else:
-            ncols: int = 10
-        nrows = math.ceil(num_dists / 4)
-        handles, labels = ax[0].get_legend_handles_labels()
-        fig.legend(handles, labels, loc='lower center', ncol=ncols,
-                   bbox_to_anchor=(0.5, 0), fancybox=True, shadow=True)
-        plt.tight_layout()
-        bottom = max(nrows * 0.2 / figsize[1], 0.12)
-        fig.subplots_adjust(bottom=bottom)
-
-        if show:
-            plt.show()
-
-    @property
-    def fitted_distributions(self) -> dict:
-        """All distributions fitted to the dataset."""
-        if self._fitted:
-            return self._fitted_dists
-        raise FitError("UnivariateFitter has not been fitted to data. "
-                       "Call .fit method.")
+        if racing:
+            distributions = self._race(distributions, data_type,
+                                       racing_criterion, shortlist)
+        return distributions, data_type
+
+    def _race(self, distributions: set, data_type, criterion: str,
+              shortlist: int) -> set:
+        """Prunes the parametric distributions to fit by racing them on
+        successively larger subsamples of the data."""
+        candidates: dict = {}
+        for name in distributions:
+            dist = getattr(prefit_distributions, name)
+            if isinstance(dist, PreFitNumericalUnivariateBase) or (
+                    (dist.X_DATA_TYPE == int) and (data_type == float)):
+                # not raced
+                continue
+            candidates[name] = dist
+
+        fit_data: FitContext = FitContext(self._data.astype(data_type))
+        survivors: list = race(candidates, fit_data, criterion, shortlist)
+        return distributions.difference(candidates).union(survivors)
@@ -76,6 +76,8 @@ def check_univariate_data(
             raise ValueError("data must be a single column dataframe for it to"
                              " be considered univariate.")
         data_array: np.ndarray = data.to_numpy().flatten()
+    elif isinstance(data, np.ndarray) and data.ndim > 0:
+        return data.flatten()
     elif isinstance(data, Iterable):
         return np.asarray(list(data)).flatten()
     else:
@@ -169,7 +171,7 @@ def check_multivariate_data(
 
     # checking number of variables
     if num_variables is not None:
-        if data_array.ndim != num_variables:
+        if data_array.shape[1] != num_variables:
             raise ValueError("data dimensions do not match the number of "
                              "variables.")
 
@@ -0,0 +1,274 @@
+# Contains code for caching random samples drawn by fitted SklarPy objects
+import numpy as np
+import warnings
+from collections import OrderedDict
+from typing import Callable, Hashable, Union
+
+__all__ = ['SampleCache', 'SampleCacheable']
+
+_BLOCK_SIZE: int = 10 ** 4  # number of rows drawn at a time for seeded samples
+
+
+def _draw(sampler: Callable, size: int, seed: Union[int, None],
+          state: Union[tuple, None] = None) -> tuple:
+    """Draws a random sample of the given size.
+
+    Seeded samples are drawn in blocks of _BLOCK_SIZE rows from their own
+    random stream, so that the first n rows of a seeded sample do not depend
+    on how many rows were drawn in total, or on how they were extended.
+    The global numpy random state is left untouched by seeded draws.
+
+    Parameters
+    ----------
+    sampler: Callable
+        A function taking a sample size and returning a 2d numpy array of
+        random variables, using numpy's global random state.
+    size: int
+        The number of rows to draw. For seeded samples, this is rounded up to
+        a whole number of blocks.
+    seed: Union[int, None]
+        The seed of the random stream. None to use the global random state.
+    state: Union[tuple, None]
+        The random state to continue the seeded stream from. None to start
+        the stream from the seed.
+
+    Returns
+    -------
+    sample, state: tuple
+        The random sample and the random state of the seeded stream after
+        drawing it (None when unseeded).
+    """
+    if seed is None:
+        return sampler(size), None
+
+    global_state: tuple = np.random.get_state()
+    try:
+        if state is None:
+            np.random.seed(seed)
+        else:
+            np.random.set_state(state)
+        blocks: list = [sampler(_BLOCK_SIZE)
+                        for _ in range(-(-size // _BLOCK_SIZE))]
+        state = np.random.get_state()
+    finally:
+        np.random.set_state(global_state)
+    return np.concatenate(blocks, axis=0), state
+
+
+class SampleCache:
+    """Stores random samples, keyed by seed, so they can be reused and
+    extended by later calls rather than redrawn."""
+    def __init__(self, max_bytes: int):
+        """Stores random samples, keyed by seed, so they can be reused and
+        extended by later calls rather than redrawn.
+
+        The least recently used samples are evicted once the total memory
+        used exceeds max_bytes. Samples are not pickled or copied with their
+        owner; only the memory cap is.
+
+        Parameters
+        ----------
+        max_bytes: int
+            The maximum number of bytes of samples to store.
+        """
+        if (not isinstance(max_bytes, int)) or (max_bytes <= 0):
+            raise TypeError("max_bytes must be a positive integer.")
+        self._max_bytes: int = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+
+    def __getstate__(self) -> dict:
+        return {'_max_bytes': self._max_bytes}
+
+    def __setstate__(self, state: dict) -> None:
+        self._max_bytes = state['_max_bytes']
+        self._entries = OrderedDict()
+
+    def get(self, sampler: Callable, size: int, seed: Union[int, None],
+            key: Hashable = None) -> np.ndarray:
+        """Returns a random sample of the given size, reusing and extending
+        any cached sample with the same seed and key.
+
+        Parameters
+        ----------
+        sampler: Callable
+            A function taking a sample size and returning a 2d numpy array of
+            random variables, using numpy's global random state.
+        size: int
+            The number of rows required.
+        seed: Union[int, None]
+            The seed of the random stream. None to use the global random
+            state.
+        key: Hashable
+            Identifies the sampler, so samples drawn by different samplers
+            with the same seed are cached separately.
+            Default is None.
+
+        Returns
+        -------
+        sample: np.ndarray
+            The first size rows of the cached sample.
+        """
+        return self._extend(sampler, size, seed, key)[0][:size]
+
+    def _extend(self, sampler: Callable, size: int, seed: Union[int, None],
+                key: Hashable = None) -> tuple:
+        """Extends the cached sample with the given seed and key to at least
+        size rows, storing it if it fits within max_bytes.
+
+        Returns
+        -------
+        sample, state, cached: tuple
+            The whole sample, the random state of its seeded stream and
+            whether it was stored.
+        """
+        sample, state = self._entries.pop((seed, key), (None, None))
+        num_cached: int = 0 if sample is None else sample.shape[0]
+        if num_cached < size:
+            new_sample, state = _draw(sampler, size - num_cached, seed, state)
+            sample = new_sample if sample is None \
+                else np.concatenate([sample, new_sample], axis=0)
+
+        if sample.nbytes <= self._max_bytes:
+            # evicting the least recently used samples
+            while self._entries and \
+                    (self.nbytes + sample.nbytes > self._max_bytes):
+                self._entries.popitem(last=False)
+            self._entries[(seed, key)] = (sample, state)
+            return sample, state, True
+        warnings.warn(f"sample of {sample.nbytes} bytes exceeds the sample "
+                      f"cache's max_bytes of {self._max_bytes} and was not "
+                      f"cached.")
+        return sample, state, False
+
+    def clear(self) -> None:
+        """Removes all cached samples."""
+        self._entries.clear()
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum number of bytes of samples stored."""
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of samples currently stored."""
+        return sum(sample.nbytes for sample, _ in self._entries.values())
+
+
+class SampleCacheable:
+    """Base class used for adding an opt-in cache of the random samples used
+    by monte-carlo methods."""
+    _sample_cache: Union[SampleCache, None] = None
+
+    def enable_sample_cache(self, max_bytes: int = 10 ** 8) -> None:
+        """Keeps the random samples drawn by monte-carlo methods, such as
+        mc_cdf and mc_cdf_plot, so later calls with the same seed reuse them,
+        drawing only the additional rows needed when a larger sample is
+        requested.
+
+        Parameters
+        ----------
+        max_bytes: int
+            The maximum memory used by cached samples, in bytes. The least
+            recently used samples are evicted beyond this.
+            Default is 10 ** 8.
+        """
+        self._sample_cache = SampleCache(max_bytes)
+
+    def disable_sample_cache(self) -> None:
+        """Removes the sample cache and all samples stored in it."""
+        self._sample_cache = None
+
+    def clear_sample_cache(self) -> None:
+        """Removes all samples stored in the sample cache, if enabled."""
+        if self._sample_cache is not None:
+            self._sample_cache.clear()
+
+    @property
+    def sample_cache(self) -> Union[SampleCache, None]:
+        """The sample cache, or None if not enabled."""
+        return self._sample_cache
+
+    def _mc_batches(self, sampler: Callable, seed: Union[int, None],
+                    key: Hashable = None) -> Callable:
+        """Returns a function drawing consecutive batches of rows of the
+        random sample for monte-carlo methods, using the sample cache if
+        enabled.
+
+        Parameters
+        ----------
+        sampler: Callable
+            A function taking a sample size and returning a 2d numpy array of
+            random variables, using numpy's global random state.
+        seed: Union[int, None]
+            The seed of the random stream. None to use the global random
+            state.
+        key: Hashable
+            Identifies the sampler, so samples drawn by different samplers
+            with the same seed are cached separately.
+            Default is None.
+
+        Returns
+        -------
+        batches: Callable
+            A function taking a number of rows and returning the next rows of
+            the random sample.
+        """
+        if (seed is not None) and not isinstance(seed, (int, np.integer)):
+            raise TypeError("seed must be an integer or None.")
+        drawn: dict = {'num_rows': 0, 'rows': None, 'state': None,
+                       'cached': self._sample_cache is not None}
+
+        def batches(size: int) -> np.ndarray:
+            if (not isinstance(size, int)) or (size <= 0):
+                raise TypeError("num_generate must be a positive integer")
+            start: int = drawn['num_rows']
+            end: int = start + size
+            drawn['num_rows'] = end
+            if drawn['cached']:
+                sample, state, drawn['cached'] = self._sample_cache._extend(
+                    sampler, end, seed, key)
+                if not drawn['cached']:
+                    # too large to cache, so continuing its stream uncached
+                    drawn['rows'], drawn['state'] = sample[end:], state
+                return sample[start:end]
+
+            # keeping any surplus rows of the last block drawn
+            rows: Union[np.ndarray, None] = drawn['rows']
+            num_rows: int = 0 if rows is None else rows.shape[0]
+            if num_rows < size:
+                new_rows, drawn['state'] = _draw(
+                    sampler, size - num_rows, seed, drawn['state'])
+                rows = new_rows if rows is None \
+                    else np.concatenate([rows, new_rows], axis=0)
+            drawn['rows'] = rows[size:]
+            return rows[:size]
+        return batches
+
+    def _mc_sample(self, sampler: Callable, size: int,
+                   seed: Union[int, None], key: Hashable = None
+                   ) -> np.ndarray:
+        """Returns a random sample for monte-carlo methods, using the sample
+        cache if enabled.
+
+        Parameters
+        ----------
+        sampler: Callable
+            A function taking a sample size and returning a 2d numpy array of
+            random variables, using numpy's global random state.
+        size: int
+            The number of rows required.
+        seed: Union[int, None]
+            The seed of the random stream. None to use the global random
+            state.
+        key: Hashable
+            Identifies the sampler, so samples drawn by different samplers
+            with the same seed are cached separately.
+            Default is None.
+
+        Returns
+        -------
+        sample: np.ndarray
+            The random sample.
+        """
+        return self._mc_batches(sampler, seed, key)(size)
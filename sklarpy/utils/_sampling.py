@@ -0,0 +1,96 @@
+# Contains code for generating the uniform random numbers underlying
+# SklarPy's random variable generators, with variance reduction
+import numpy as np
+import scipy.stats
+
+__all__ = ['SAMPLING_METHODS', 'check_sampling', 'uniform_rvs',
+           'stratify_margins']
+
+SAMPLING_METHODS: tuple = ('random', 'sobol', 'antithetic', 'lhs')
+_EPS: float = 10 ** -15
+
+
+def check_sampling(sampling: str) -> None:
+    """Checks the sampling method is valid, raising an error if not.
+
+    Parameters
+    ----------
+    sampling: str
+        The name of the sampling method.
+    """
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"sampling must be one of {SAMPLING_METHODS}.")
+
+
+def _seed() -> int:
+    # seeding scipy's generators from numpy's global random state, so they
+    # respect np.random.seed
+    return np.random.randint(0, 2 ** 31 - 1)
+
+
+def uniform_rvs(size: int, num_dims: int, sampling: str) -> np.ndarray:
+    """Generates uniform random numbers on (0, 1)^num_dims.
+
+    Parameters
+    ----------
+    size: int
+        The number of points to generate.
+    num_dims: int
+        The number of dimensions of each point.
+    sampling: str
+        'random' for independent pseudo-random points, 'sobol' for a
+        scrambled Sobol sequence, 'antithetic' for pairs of points u and
+        1 - u and 'lhs' for a Latin hypercube, in which each dimension has
+        exactly one point in each of size equal width strata.
+
+    Returns
+    -------
+    u: np.ndarray
+        A (size, num_dims) array of uniform random numbers, strictly between
+        0 and 1.
+    """
+    check_sampling(sampling)
+    if sampling == 'sobol':
+        # the first size points of a sequence whose length is a power of 2
+        m: int = int(np.ceil(np.log2(max(size, 1))))
+        u: np.ndarray = scipy.stats.qmc.Sobol(
+            num_dims, scramble=True, seed=_seed()).random_base2(m)[:size]
+    elif sampling == 'antithetic':
+        half: np.ndarray = np.random.uniform(size=(-(-size // 2), num_dims))
+        u = np.concatenate([half, 1 - half], axis=0)[:size]
+    elif sampling == 'lhs':
+        u = scipy.stats.qmc.LatinHypercube(num_dims, seed=_seed()).random(
+            size)
+    else:
+        u = np.random.uniform(size=(size, num_dims))
+    return np.clip(u, _EPS, 1 - _EPS)
+
+
+def stratify_margins(u: np.ndarray) -> np.ndarray:
+    """Latin hypercube sampling with dependence. Replaces each column of a
+    sample of uniform random variables with stratified values of the same
+    ranks, so each margin has exactly one value in each of n equal width
+    strata, while the ranks, and so the dependence structure, are kept.
+
+    Parameters
+    ----------
+    u: np.ndarray
+        A (n, d) sample of dependent uniform random variables.
+
+    See Also
+    --------
+    Packham, N. and Schmidt, W. (2010) Latin hypercube sampling with
+    dependence and applications in finance. Journal of Computational
+    Finance, 13.
+
+    Returns
+    -------
+    stratified_u: np.ndarray
+        The stratified sample.
+    """
+    n: int = u.shape[0]
+    ranks: np.ndarray = np.empty(u.shape, dtype=float)
+    np.put_along_axis(ranks, np.argsort(u, axis=0),
+                      np.arange(n, dtype=float)[:, None], axis=0)
+    return np.clip((ranks + np.random.uniform(size=u.shape)) / n,
+                   _EPS, 1 - _EPS)